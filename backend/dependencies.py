@@ -1,11 +1,13 @@
 import os
 import math
+import numpy as np
 from pathlib import Path
 from fastapi import HTTPException
 
 
 WORKSPACE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "petrophysics-workplace")
 ALLOWED_EXTENSIONS = {'las', 'LAS'}
+LOG_ENCODINGS = {'plain', 'categorical'}
 
 
 Path(WORKSPACE_ROOT).mkdir(parents=True, exist_ok=True)
@@ -37,12 +39,58 @@ def sanitize_value(value):
 
 
 def sanitize_list(lst):
-    """Convert all NaN values in a list to None"""
+    """Convert all NaN values in a list (or NumPy log array) to None"""
+    if isinstance(lst, np.ndarray):
+        if lst.dtype.kind == 'f':
+            # Vectorized path for array-backed logs: only touch non-finite samples
+            result = lst.tolist()
+            for i in np.flatnonzero(~np.isfinite(lst)).tolist():
+                result[i] = None
+            return result
+        lst = lst.tolist()
     if not lst:
         return []
     return [sanitize_value(v) for v in lst]
 
 
+def log_samples_payload(log, encoding: str = 'plain', arrays: bool = False) -> dict:
+    """
+    Samples of a WellLog for API responses.
+
+    'plain' returns the samples as a list under "log". 'categorical' returns string
+    logs as integer "codes" (-1 for missing) plus their "categories" table instead of
+    repeating every name per sample; numeric logs are always returned plain.
+    arrays=True keeps numeric samples and codes as NumPy arrays (NaN kept) for the
+    streaming JSON encoder (see utils.log_json).
+    """
+    categorical = getattr(log, 'is_categorical', False)
+    if encoding == 'categorical' and categorical:
+        return {"log": None, "codes": log.values if arrays else log.values.tolist(), "categories": list(log.categories)}
+    if arrays and not categorical:
+        return {"log": log.values}
+    return {"log": sanitize_list(log.log) if hasattr(log, 'log') else []}
+
+
+def raw_log_samples(log) -> dict:
+    """
+    Samples of a WellLog as arrays for binary responses (see utils.log_payload):
+    numeric logs as float64 "log" with NaN kept, string logs as int32 "codes" plus "categories".
+    """
+    if getattr(log, 'is_categorical', False):
+        return {"log": None, "codes": log.values, "categories": list(log.categories)}
+    return {"log": log.values}
+
+
+def validate_log_encoding(encoding: str) -> str:
+    """Validate the log encoding query parameter"""
+    if encoding not in LOG_ENCODINGS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid encoding '{encoding}'. Expected one of: {', '.join(sorted(LOG_ENCODINGS))}"
+        )
+    return encoding
+
+
 def allowed_file(filename: str) -> bool:
     """Check if a file has an allowed extension"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -47,6 +47,13 @@ async def lifespan(app: FastAPI):
         initialize_file_well_storage(WORKSPACE_ROOT)
         logger.info("[STARTUP] Well file indexing complete.")
         
+        # Warm the cache from the snapshot of the last run; only changed wells are parsed again
+        get_file_well_storage().restore_cache_snapshot()
+        get_file_well_storage().snapshotter.start()
+        
+        # Pick up .ptrc files changed outside the API (CLI commands, batch jobs)
+        get_file_well_storage().change_detector.start()
+        
         # Step 2: Eager load current project wells into memory
         storage_service = SQLiteStorageService()
         current_project = storage_service.load_current_project()
@@ -55,19 +62,19 @@ async def lifespan(app: FastAPI):
             project_path = current_project["projectPath"]
             logger.info(f"[STARTUP] Found current project: {project_path}")
             
-            # Preload all wells for the current project
+            # Preload all wells for the current project in the background (the server is ready meanwhile)
             file_storage = get_file_well_storage()
-            stats = await file_storage.preload_project(project_path)
+            job = file_storage.preloader.start(project_path)
             
-            logger.info(f"[STARTUP] EAGER LOADING complete: {stats['loaded_wells']}/{stats['total_wells']} wells loaded into memory")
+            logger.info(f"[STARTUP] EAGER LOADING started: {job.total} wells loading in the background")
         else:
             # Fallback: try to load from default project folder
             default_project = Path(WORKSPACE_ROOT) / "project"
             if default_project.exists():
                 logger.info(f"[STARTUP] No current project found, using default: {default_project}")
                 file_storage = get_file_well_storage()
-                stats = await file_storage.preload_project(str(default_project))
-                logger.info(f"[STARTUP] EAGER LOADING complete: {stats['loaded_wells']}/{stats['total_wells']} wells loaded into memory")
+                job = file_storage.preloader.start(str(default_project))
+                logger.info(f"[STARTUP] EAGER LOADING started: {job.total} wells loading in the background")
             else:
                 logger.info("[STARTUP] No current project found. Wells will be loaded on-demand.")
         
@@ -83,6 +90,16 @@ async def lifespan(app: FastAPI):
     
     # SHUTDOWN: Cleanup if needed
     logger.info("[SHUTDOWN] Server shutting down...")
+    try:
+        storage = get_file_well_storage()
+        storage.preloader.cancel()
+        storage.change_detector.stop()
+        storage.snapshotter.stop()
+        storage.save_cache_snapshot()
+    except RuntimeError:
+        pass
+    except OSError as e:
+        logger.error(f"[SHUTDOWN] Failed to write the cache snapshot: {e}")
 
 
 def create_app():
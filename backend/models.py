@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List, Any, Literal
+from pydantic import BaseModel, Field, ConfigDict, model_serializer
+from typing import Optional, List, Any, Literal, ClassVar, Tuple
 from datetime import datetime
 
 
@@ -135,6 +135,19 @@ class WellLogInfo(CustomBase):
     log_type: Optional[str] = None
     values: Optional[List[Any]] = None
     log: Optional[List[Any]] = None
+    codes: Optional[List[int]] = None
+    categories: Optional[List[str]] = None
+
+    # Dictionary encoding fields, only sent for encoding=categorical
+    omit_when_none: ClassVar[Tuple[str, ...]] = ("codes", "categories")
+
+    @model_serializer(mode="wrap")
+    def _omit_encoding_fields(self, handler):
+        data = handler(self)
+        for name in self.omit_when_none:
+            if data.get(name) is None:
+                data.pop(name, None)
+        return data
 
 
 class ConstantInfo(CustomBase):
@@ -179,6 +192,48 @@ class DatasetDetailsResponse(CustomBase):
     dataset: DatasetInfo
 
 
+class LogSliceInfo(CustomBase):
+    name: str
+    dataset: str
+    log_type: str
+    samples: int
+    decimated: bool
+    depths: List[Optional[float]]
+    values: List[Any]
+
+
+class LogSliceResponse(CustomBase):
+    success: bool
+    wellName: str
+    top: Optional[float] = None
+    bottom: Optional[float] = None
+    method: str
+    maxPoints: int
+    logs: List[LogSliceInfo]
+
+
+class DatasetChangeInfo(DatasetInfo):
+    revision: int
+    removedLogs: List[str] = []
+
+
+class WellChangeInfo(CustomBase):
+    wellName: str
+    path: str
+    revision: int
+    deleted: bool = False
+    datasets: List[DatasetChangeInfo] = []
+    removedDatasets: List[str] = []
+
+
+class WellChangesResponse(CustomBase):
+    success: bool
+    since: int
+    revision: int
+    full: bool = False
+    wells: List[WellChangeInfo]
+
+
 class WellListItem(CustomBase):
     id: str
     name: str
@@ -186,6 +241,7 @@ class WellListItem(CustomBase):
     path: str
     created_at: Optional[str] = None
     datasets: int
+    error: Optional[str] = None
 
 
 class WellListResponse(CustomBase):
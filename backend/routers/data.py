@@ -3,6 +3,7 @@ import json
 from fastapi import APIRouter, HTTPException
 from models import DataListResponse, FileContentResponse
 from dependencies import WORKSPACE_ROOT, validate_path
+from utils.ptrc_file_io import read_well_file
 
 
 router = APIRouter(prefix="/data", tags=["data"])
@@ -80,6 +81,10 @@ async def read_file(path: str):
         if not os.path.isfile(resolved_path):
             raise HTTPException(status_code=400, detail="Path is not a file")
         
+        if resolved_path.endswith('.ptrc'):
+            # Well files may be binary v2, decode them to the JSON layout
+            return {"content": read_well_file(resolved_path)}
+        
         with open(resolved_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
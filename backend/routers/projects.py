@@ -1,6 +1,8 @@
 import os
+import asyncio
 import hashlib
 import shutil
+from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Body
 from pydantic import BaseModel
 from models import ProjectCreate, ProjectResponse, ErrorResponse
@@ -47,6 +49,21 @@ class SetCurrentProjectResponse(BaseModel):
     projectName: str
 
 
+class PreloadStatusResponse(BaseModel):
+    state: Optional[str] = None
+    project: Optional[str] = None
+    project_path: Optional[str] = None
+    mode: Optional[str] = None
+    workers: int = 0
+    total_wells: int = 0
+    loaded_wells: int = 0
+    failed_wells: List[str] = []
+    remaining_wells: int = 0
+    progress: float = 0.0
+    priority_wells: List[str] = []
+    elapsed_seconds: float = 0.0
+
+
 class DeleteProjectRequest(BaseModel):
     projectPath: str
 
@@ -220,15 +237,15 @@ async def load_all_wells(request: LoadAllWellsRequest):
                 well_name = filename.replace('.ptrc', '')
                 
                 try:
-                    # Fetch from cache only (already preloaded at startup)
-                    well_data_dict = file_storage.get_cached_well_data(project_path, well_name)
+                    # Served from cache; wells the background preload has not reached yet are read now
+                    well_data_dict = file_storage.load_well_data(project_path, well_name)
                     if well_data_dict:
                         wells_dict[well_name] = well_data_dict
                         loaded_count += 1
-                        print(f"[LoadAllWells] Loaded well '{well_name}' from cache")
+                        print(f"[LoadAllWells] Loaded well '{well_name}'")
                     else:
-                        failed_wells.append({"well": well_name, "error": "Well not found in cache"})
-                        print(f"[LoadAllWells] Failed to load well '{well_name}': not in cache")
+                        failed_wells.append({"well": well_name, "error": "Well could not be loaded"})
+                        print(f"[LoadAllWells] Failed to load well '{well_name}'")
                 except Exception as e:
                     failed_wells.append({"well": well_name, "error": str(e)})
                     print(f"[LoadAllWells] Failed to load well '{well_name}': {e}")
@@ -263,7 +280,8 @@ async def set_current_project(request: SetCurrentProjectRequest):
     """
     Set the current opened project in JSON storage memory.
     This is called when a user opens an existing project.
-    Also triggers eager loading of all wells for the new project.
+    Also starts background preloading of all wells for the new project
+    (progress: GET /projects/preload-status).
     """
     try:
         project_path = os.path.abspath(request.projectPath)
@@ -285,16 +303,12 @@ async def set_current_project(request: SetCurrentProjectRequest):
         
         print(f"[Projects] Current project set to: {request.projectName} at {project_path}")
         
-        # EAGER LOADING: Preload all wells for the new project
+        # EAGER LOADING: Preload all wells for the new project in the background
+        # (active and selected wells first); a preload of the previous project is cancelled
         try:
             file_storage = get_file_well_storage()
-            
-            # Clear previous project cache (optional - saves memory)
-            # We could skip this if we want to keep multiple projects in cache
-            
-            # Preload the new project
-            stats = await file_storage.preload_project(project_path)
-            print(f"[Projects] Preloaded {stats['loaded_wells']}/{stats['total_wells']} wells for new project")
+            job = await asyncio.to_thread(file_storage.preloader.start, project_path)
+            print(f"[Projects] Preloading {job.total} wells for new project in the background")
         except Exception as e:
             print(f"[Projects] Warning: Failed to preload wells: {e}")
             # Don't fail the request if preload fails - wells will lazy load instead
@@ -312,6 +326,20 @@ async def set_current_project(request: SetCurrentProjectRequest):
         raise HTTPException(status_code=500, detail=f"Failed to set current project: {str(e)}")
 
 
+@router.get("/preload-status", response_model=PreloadStatusResponse)
+async def get_preload_status():
+    """Progress of the background preload of the current project."""
+    return get_file_well_storage().preloader.status()
+
+
+@router.post("/preload-cancel", response_model=PreloadStatusResponse)
+async def cancel_preload():
+    """Cancel the background preload; wells that are being read are finished."""
+    storage = get_file_well_storage()
+    storage.preloader.cancel()
+    return storage.preloader.status()
+
+
 @router.post("/migrate-wells", response_model=MigrateWellsResponse)
 async def migrate_wells_to_sqlite(request: MigrateWellsRequest = Body(...)):
     """
@@ -1,7 +1,10 @@
 import json
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
 from typing import Dict, Any, List
 from utils.sqlite_storage import SQLiteStorageService
+from utils.file_well_storage import get_file_well_storage
+from utils.well_cache_metrics import render_prometheus
 
 storage_service = SQLiteStorageService()
 router = APIRouter(prefix="/storage", tags=["storage-inspector"])
@@ -137,6 +140,16 @@ async def storage_info():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/cache-metrics", response_class=PlainTextResponse)
+async def well_cache_metrics():
+    """Well cache metrics in the Prometheus text exposition format"""
+    try:
+        storage = get_file_well_storage()
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return PlainTextResponse(render_prometheus(storage), media_type="text/plain; version=0.0.4")
+
+
 @router.delete("/clear-all")
 async def clear_all_storage_data():
     """DANGER: Clear all data from JSON storage (use for testing/debugging only)"""
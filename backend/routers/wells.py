@@ -3,15 +3,19 @@ import tempfile
 import traceback
 import shutil
 import lasio
+import numpy as np
 import hashlib
 import json
 import time
 import asyncio
+import logging
 from pathlib import Path
 from datetime import datetime
+from email.utils import formatdate
 from uuid import uuid4
-from typing import List
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Request, Response
+from fastapi.responses import StreamingResponse
 from werkzeug.utils import secure_filename
 
 from models import (
@@ -21,23 +25,34 @@ from models import (
     LogPlotResponse, CrossPlotRequest, CrossPlotResponse, LogMessage,
     LASBatchPreviewItem, LASBatchPreviewResponse, LASBatchImportRequest,
     LASBatchImportFileResult, LASBatchImportSummary, LASBatchImportResponse,
-    LogMetadata, ConstantMetadata, DatasetMetadata, WellMetadataResponse
+    LogMetadata, ConstantMetadata, DatasetMetadata, WellMetadataResponse,
+    LogSliceResponse, WellChangesResponse
 )
 from dependencies import (
-    WORKSPACE_ROOT, validate_path, allowed_file, sanitize_list
+    WORKSPACE_ROOT, validate_path, allowed_file, sanitize_list,
+    log_samples_payload, raw_log_samples, validate_log_encoding
 )
-from utils.fe_data_objects import Well, Dataset, Constant
+from utils.fe_data_objects import Well, Dataset, WellLog, Constant, LazyWell, is_survey_dataset
 from utils.LogPlot import LogPlotManager
 from utils.CPI import CrossPlotManager
 from utils.cpi_plotly import CPIPlotlyManager
 from utils.matplotlib_cpi_plot import MatplotlibCPIPlotter
 from utils.file_well_storage import get_file_well_storage, CACHE_LOCK
+from utils.ptrc_file_io import read_well_file
 from utils.sqlite_storage import SQLiteStorageService
 from utils.data_import_export import ImportLasFileCommand, create_well_from_las
+from utils.well_cache_metrics import SampledLog
+from utils.log_decimation import decimate, DECIMATE_MINMAX, DECIMATION_METHODS
+from utils.log_payload import BINARY_MEDIA_TYPE, negotiate_float_dtype, encode_binary_payload
+from utils.log_json import iter_model_json
 
 # Keep SQLite for non-well data (sessions, projects, etc.)
 session_storage = SQLiteStorageService()
 
+logger = logging.getLogger(__name__)
+# Per-request cache messages are sampled (see well_cache_metrics)
+_sampled_log = SampledLog(logger)
+
 
 router = APIRouter(prefix="/wells", tags=["wells"])
 
@@ -83,38 +98,45 @@ def store_well_in_session(well_path: str, well_data: dict):
 
 async def fetch_well_data(project_path: str, well_id: str):
     """
-    Fetch well data from cache ONLY - no disk access.
-    Returns tuple of (Well object, well_data dict, source)
+    Fetch well data from cache, loading it on demand if it is not cached yet.
+    Returns tuple of (LazyWell view, well_data dict, source)
     
     This helper ensures all endpoints use consistent data retrieval logic.
     Source will be: "memory-preload", "memory-lazy", or "memory-saved"
     
-    NOTE: This function ONLY serves data from cache. There is NO disk fallback.
-    If data is not cached, an HTTP 404 exception is raised.
+    NOTE: Wells the background preload has not reached yet jump its queue: they are
+    read right away (or the in-flight read is awaited). Only wells without a file
+    raise an HTTP 404 exception.
     """
     # Get the file-based storage service
     storage = get_file_well_storage()
+    file_key = storage.get_file_key(project_path, well_id)
+    with CACHE_LOCK:
+        cached = file_key in storage.cache
+    if not cached:
+        # Move the well to the front of a running preload as well; the preloader
+        # and this request share a single read of the file
+        storage.preloader.prioritize(project_path, well_id)
     
-    # Get data from cache only (NO disk access)
-    well_data = await asyncio.to_thread(storage.get_cached_well_data, project_path, well_id)
+    # Cache hit, or on-demand load shared with concurrent requests and the preloader
+    well_data = await asyncio.to_thread(storage.load_well_data, project_path, well_id)
     
     if well_data:
-        # Data was served from cache (memory)
-        file_key = storage.get_file_key(project_path, well_id)
         with CACHE_LOCK:
             cache_entry = storage.cache.get(file_key, {})
             source = cache_entry.get("source", "unknown")
-        print(f"[WellFetch] Served well '{well_id}' from memory ({source})")
+        _sampled_log.log(logging.DEBUG, "served", "[WellFetch] Served well '%s' from memory (%s)", well_id, source)
         
-        # Reconstruct Well object from data (non-blocking)
-        well = await asyncio.to_thread(Well.from_dict, well_data)
+        # Lazy view over the cached data: datasets, logs and samples are only
+        # materialized when an endpoint touches them
+        well = LazyWell(well_data)
         return well, well_data, f"memory-{source}"
     
-    # Well not found in cache - raise 404
-    print(f"[WellFetch] ERROR: Well '{well_id}' not found in cache for project '{project_path}'")
+    # No such well file in the project - raise 404
+    print(f"[WellFetch] ERROR: Well '{well_id}' not found in project '{project_path}'")
     raise HTTPException(
         status_code=404, 
-        detail=f"Well '{well_id}' not found in cache. The well may not be preloaded. Try switching to a different project."
+        detail=f"Well '{well_id}' not found in project"
     )
 
 
@@ -224,7 +246,8 @@ async def get_well_metadata(wellPath: str):
                 constants=constants_metadata
             ))
         
-        print(f"[MetadataFetch] Returned metadata for well '{well_name}' from cache ({source})")
+        _sampled_log.log(logging.DEBUG, "metadata", "[MetadataFetch] Returned metadata for well '%s' from cache (%s)",
+                         well_name, source)
         
         return WellMetadataResponse(
             success=True,
@@ -721,25 +744,10 @@ async def import_las_batch(request: LASBatchImportRequest):
                         storage = get_file_well_storage()
                         
                         # Reload the fresh well data from disk (the import just wrote it)
-                        with open(well_file_path, "r", encoding="utf-8") as f:
-                            well_data = json.load(f)
-                        
-                        # Update cache with the fresh data
-                        project_name = os.path.basename(resolved_project_path)
-                        file_key = f"{project_name}::{well_name}"
+                        well_data = read_well_file(well_file_path)
                         
-                        # Update cache entry with fresh data from disk
-                        if file_key in storage.cache:
-                            storage.cache.move_to_end(file_key)
-                            storage.cache[file_key]["data"] = well_data
-                            print(f"[BatchImport] Updated cache entry for: {file_key}")
-                        else:
-                            storage.cache[file_key] = {
-                                "data": well_data,
-                                "source": "saved",
-                                "project": project_name
-                            }
-                            print(f"[BatchImport] Added cache entry for: {file_key}")
+                        # Update cache and file index with the fresh data
+                        storage.update_cached_well(resolved_project_path, well_name, well_data, well_file_path)
                         
                         print(f"[BatchImport] Cache synchronized with disk for well: {well_name}")
                 except Exception as storage_err:
@@ -882,12 +890,148 @@ async def load_well(filePath: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Sample representations of dataset_payload()
+SAMPLES_LIST = "list"    # Python lists with None for NaN (response model validation)
+SAMPLES_ARRAY = "array"  # NumPy arrays for the streaming JSON encoder (see utils.log_json)
+SAMPLES_RAW = "raw"      # NumPy arrays, string logs as codes, for the binary payload (see utils.log_payload)
+
+
+def dataset_payload(dataset: Dataset, encoding: str = "plain", samples: str = SAMPLES_LIST,
+                    log_names: Optional[set] = None) -> dict:
+    """
+    Dataset with its logs and constants for the data browser endpoints.
+    samples selects the representation of log samples and the index (SAMPLES_*);
+    log_names restricts the logs that are included.
+    """
+    logs = []
+    for log in dataset.well_logs:
+        if log_names is not None and log.name not in log_names:
+            continue
+        logs.append({
+            "name": log.name,
+            "date": str(log.date) if hasattr(log, 'date') else '',
+            "description": log.description if hasattr(log, 'description') else '',
+            "dtst": log.dtst if hasattr(log, 'dtst') else dataset.name,
+            "interpolation": log.interpolation if hasattr(log, 'interpolation') else '',
+            "log_type": log.log_type if hasattr(log, 'log_type') else '',
+            **(raw_log_samples(log) if samples == SAMPLES_RAW
+               else log_samples_payload(log, encoding, arrays=samples == SAMPLES_ARRAY))
+        })
+    
+    constants = []
+    if hasattr(dataset, 'constants') and dataset.constants:
+        for const in dataset.constants:
+            constants.append({
+                "name": const.name if hasattr(const, 'name') else '',
+                "value": const.value if hasattr(const, 'value') else '',
+                "tag": const.tag if hasattr(const, 'tag') else ''
+            })
+    
+    index_log = dataset.index_log if hasattr(dataset, 'index_log') else []
+    return {
+        "name": dataset.name,
+        "type": dataset.type,
+        "wellname": dataset.wellname,
+        "index_name": dataset.index_name if hasattr(dataset, 'index_name') else 'DEPTH',
+        "index_log": sanitize_list(index_log) if samples == SAMPLES_LIST else index_log,
+        "well_logs": logs,
+        "constants": constants
+    }
+
+
+def json_stream_response(model, payload: dict, headers: Optional[dict] = None) -> StreamingResponse:
+    """
+    JSON response streamed in the shape of the response model (see utils.log_json).
+    Returning a Response skips the route's response model validation.
+    """
+    return StreamingResponse(iter_model_json(model, payload), media_type="application/json", headers=headers)
+
+
+def negotiated_response(request: Request, model, build, headers: Optional[dict] = None) -> Response:
+    """
+    Answer with the binary log payload if the client accepts it, else with
+    streamed JSON in the shape of the route's response model.
+    
+    Args:
+        model: Response model of the route
+        build: Callable(samples) returning the response dictionary (SAMPLES_ARRAY or SAMPLES_RAW)
+        headers: Extra response headers (e.g. revision_headers())
+    """
+    headers = {**(headers or {}), "Vary": "Accept"}
+    float_dtype = negotiate_float_dtype(request.headers.get("accept"))
+    if float_dtype is None:
+        return json_stream_response(model, build(SAMPLES_ARRAY), headers)
+    return Response(encode_binary_payload(build(SAMPLES_RAW), float_dtype), media_type=BINARY_MEDIA_TYPE,
+                    headers=headers)
+
+
+def revision_etag(revision: int, fingerprint: Optional[str], representation: Optional[str] = None) -> str:
+    """
+    Weak entity tag of a revision (the fingerprint guards against a reset revision database).
+    representation (see representation_tag()) tells apart the payloads of one revision.
+    """
+    tag = f"{revision}-{(fingerprint or '')[:12]}"
+    return f'W/"{tag}-{representation}"' if representation else f'W/"{tag}"'
+
+
+def representation_tag(request: Request, encoding: str = "plain") -> str:
+    """
+    Payload a negotiated response answers the request with: json or the binary
+    float dtype (float64/float32), followed by +categorical for that log encoding.
+    """
+    float_dtype = negotiate_float_dtype(request.headers.get("accept"))
+    tag = "json" if float_dtype is None else np.dtype(float_dtype).name
+    return tag if encoding == "plain" else f"{tag}+{encoding}"
+
+
+def revision_headers(etag: str, modified: Optional[float]) -> dict:
+    """ETag and Last-Modified response headers."""
+    headers = {"ETag": etag}
+    if modified:
+        headers["Last-Modified"] = formatdate(modified, usegmt=True)
+    return headers
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match lists etag (weak comparison) or is *."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+async def well_revision_headers(project_path: str, well_id: str,
+                                representation: Optional[str] = None) -> Optional[dict]:
+    """
+    Revision headers of a well (see FileWellStorageService.well_revision()),
+    or None if the well file does not exist.
+    """
+    storage = get_file_well_storage()
+    row = await asyncio.to_thread(storage.well_revision, project_path, well_id)
+    if row is None:
+        return None
+    return revision_headers(revision_etag(row["revision"], row["fingerprint"], representation), row["modified"])
+
+
 @router.get("/data", response_model=WellDataResponse)
-async def get_well_data(wellPath: str):
-    """Get complete well dataset data for data browser - prefers SQLite, falls back to disk"""
+async def get_well_data(request: Request, wellPath: str, encoding: str = "plain"):
+    """
+    Get complete well dataset data for data browser - prefers SQLite, falls back to disk.
+    encoding=categorical returns string logs as codes plus categories.
+    Clients accepting application/x-ptrc-logs get the binary payload (see utils.log_payload).
+    Responses carry the well revision and payload representation as ETag;
+    If-None-Match with the current one is answered with 304 Not Modified without
+    reading the well.
+    """
     try:
         if not wellPath:
             raise HTTPException(status_code=400, detail="Well path is required")
+        validate_log_encoding(encoding)
         
         resolved_path = os.path.abspath(wellPath)
         if not validate_path(resolved_path):
@@ -899,49 +1043,21 @@ async def get_well_data(wellPath: str):
         well_name = os.path.basename(resolved_path).replace('.ptrc', '')
         project_path = os.path.dirname(os.path.dirname(resolved_path))
         
+        # JSON and binary float64/float32 payloads of one revision are different entities
+        headers = await well_revision_headers(project_path, well_name, representation_tag(request, encoding))
+        if headers is not None and etag_matches(request, headers["ETag"]):
+            return Response(status_code=304, headers={**headers, "Vary": "Accept"})
+        
         # Use cache-backed fetch instead of multiple paths
         well, well_data, source = await fetch_well_data(project_path, well_name)
         
         store_well_in_session(resolved_path, well_data)
         
-        datasets = []
-        for dataset in well.datasets:
-            logs = []
-            for log in dataset.well_logs:
-                logs.append({
-                    "name": log.name,
-                    "date": str(log.date) if hasattr(log, 'date') else '',
-                    "description": log.description if hasattr(log, 'description') else '',
-                    "dtst": log.dtst if hasattr(log, 'dtst') else dataset.name,
-                    "interpolation": log.interpolation if hasattr(log, 'interpolation') else '',
-                    "log_type": log.log_type if hasattr(log, 'log_type') else '',
-                    "log": sanitize_list(log.log) if hasattr(log, 'log') else []
-                })
-            
-            constants = []
-            if hasattr(dataset, 'constants') and dataset.constants:
-                for const in dataset.constants:
-                    constants.append({
-                        "name": const.name if hasattr(const, 'name') else '',
-                        "value": const.value if hasattr(const, 'value') else '',
-                        "tag": const.tag if hasattr(const, 'tag') else ''
-                    })
-            
-            datasets.append({
-                "name": dataset.name,
-                "type": dataset.type,
-                "wellname": dataset.wellname,
-                "index_name": dataset.index_name if hasattr(dataset, 'index_name') else 'DEPTH',
-                "index_log": sanitize_list(dataset.index_log) if hasattr(dataset, 'index_log') else [],
-                "well_logs": logs,
-                "constants": constants
-            })
-        
-        return {
+        return negotiated_response(request, WellDataResponse, lambda samples: {
             "success": True,
             "wellName": well.well_name if hasattr(well, 'well_name') else os.path.basename(resolved_path).replace('.ptrc', ''),
-            "datasets": datasets
-        }
+            "datasets": [dataset_payload(dataset, encoding, samples) for dataset in well.datasets]
+        }, headers)
         
     except HTTPException:
         raise
@@ -951,11 +1067,16 @@ async def get_well_data(wellPath: str):
 
 
 @router.get("/dataset-details", response_model=DatasetDetailsResponse)
-async def get_dataset_details(wellPath: str, datasetName: str):
-    """Get specific dataset details for data browser"""
+async def get_dataset_details(request: Request, wellPath: str, datasetName: str, encoding: str = "plain"):
+    """
+    Get specific dataset details for data browser.
+    encoding=categorical returns string logs as codes plus categories.
+    Clients accepting application/x-ptrc-logs get the binary payload (see utils.log_payload).
+    """
     try:
         if not wellPath:
             raise HTTPException(status_code=400, detail="Well path is required")
+        validate_log_encoding(encoding)
         
         if not datasetName:
             raise HTTPException(status_code=400, detail="Dataset name is required")
@@ -984,41 +1105,119 @@ async def get_dataset_details(wellPath: str, datasetName: str):
         if not target_dataset:
             raise HTTPException(status_code=404, detail=f"Dataset \"{datasetName}\" not found")
         
-        logs = []
-        for log in target_dataset.well_logs:
-            logs.append({
-                "name": log.name,
-                "date": str(log.date) if hasattr(log, 'date') else '',
-                "description": log.description if hasattr(log, 'description') else '',
-                "dtst": log.dtst if hasattr(log, 'dtst') else target_dataset.name,
-                "interpolation": log.interpolation if hasattr(log, 'interpolation') else '',
-                "log_type": log.log_type if hasattr(log, 'log_type') else '',
-                "log": sanitize_list(log.log) if hasattr(log, 'log') else []
-            })
+        return negotiated_response(request, DatasetDetailsResponse, lambda samples: {
+            "success": True,
+            "dataset": dataset_payload(target_dataset, encoding, samples)
+        })
         
-        constants = []
-        if hasattr(target_dataset, 'constants') and target_dataset.constants:
-            for const in target_dataset.constants:
-                constants.append({
-                    "name": const.name if hasattr(const, 'name') else '',
-                    "value": const.value if hasattr(const, 'value') else '',
-                    "tag": const.tag if hasattr(const, 'tag') else ''
-                })
+    except HTTPException:
+        raise
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Upper bound of max_points for the log slice endpoint
+MAX_SLICE_POINTS = 100_000
+
+
+def log_slice(dataset: Dataset, log: WellLog, top: Optional[float], bottom: Optional[float],
+              max_points: int, method: str) -> dict:
+    """
+    Depths and samples of a log within [top, bottom], decimated to max_points.
+    The window is located with the dataset's depth index (binary search).
+    """
+    depth_index = dataset.depth_index
+    window = depth_index.locate(top, bottom)
+    if not isinstance(window, slice):
+        # Unsorted index: positions in depth order
+        window = window[np.argsort(dataset.index_log[window], kind="stable")]
+    # Short logs only cover the first len(log) depths
+    positions = np.arange(len(dataset.index_log))[window]
+    positions = positions[positions < len(log)]
+    depths = dataset.index_log[positions]
+    
+    categorical = log.is_categorical
+    values = log.values[positions]
+    keep = decimate(depths, values, max_points, method, categorical=categorical)
+    if keep is not None:
+        depths, values = depths[keep], values[keep]
+    if categorical:
+        lookup = np.array(log.categories + [None], dtype=object)
+        values = lookup[values].tolist()
+    # Arrays are written by the streaming JSON encoder (NaN as null)
+    return {
+        "name": log.name,
+        "dataset": dataset.name,
+        "log_type": log.log_type,
+        "samples": len(positions),
+        "decimated": keep is not None,
+        "depths": depths,
+        "values": values
+    }
+
+
+@router.get("/{well_id}/logs", response_model=LogSliceResponse)
+async def get_log_slice(well_id: str, projectPath: str, names: str, top: Optional[float] = None,
+                        bottom: Optional[float] = None, max_points: int = 1000,
+                        method: str = DECIMATE_MINMAX, dataset: Optional[str] = None):
+    """
+    Get the requested logs over a depth window, decimated for display.
+    names is a comma separated list of log names; each log is taken from `dataset`
+    or else from the first dataset holding it. Curves with more than max_points
+    samples in the window are decimated (minmax keeps every bucket's extremes,
+    lttb follows the curve shape).
+    """
+    try:
+        if not projectPath:
+            raise HTTPException(status_code=400, detail="Project path is required")
+        log_names = [name.strip() for name in names.split(",") if name.strip()]
+        if not log_names:
+            raise HTTPException(status_code=400, detail="At least one log name is required")
+        if method not in DECIMATION_METHODS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid method '{method}'. Expected one of: {', '.join(DECIMATION_METHODS)}"
+            )
+        if not 2 <= max_points <= MAX_SLICE_POINTS:
+            raise HTTPException(status_code=400, detail=f"max_points must be between 2 and {MAX_SLICE_POINTS}")
+        if top is not None and bottom is not None and top > bottom:
+            raise HTTPException(status_code=400, detail="top must not be below bottom")
         
-        dataset_details = {
-            "name": target_dataset.name,
-            "type": target_dataset.type,
-            "wellname": target_dataset.wellname,
-            "index_name": target_dataset.index_name if hasattr(target_dataset, 'index_name') else 'DEPTH',
-            "index_log": sanitize_list(target_dataset.index_log) if hasattr(target_dataset, 'index_log') else [],
-            "well_logs": logs,
-            "constants": constants
-        }
+        resolved_path = os.path.abspath(projectPath)
+        if not validate_path(resolved_path):
+            raise HTTPException(
+                status_code=403,
+                detail="Access denied: path outside petrophysics-workplace"
+            )
         
-        return {
+        well, well_data, source = await fetch_well_data(resolved_path, well_id)
+        
+        datasets = well.datasets
+        if dataset is not None:
+            datasets = [ds for ds in datasets if ds.name == dataset]
+            if not datasets:
+                raise HTTPException(status_code=404, detail=f"Dataset \"{dataset}\" not found")
+        
+        logs, missing = [], []
+        for name in log_names:
+            match = next(((ds, log) for ds in datasets for log in ds.well_logs if log.name == name), None)
+            if match is None:
+                missing.append(name)
+            else:
+                logs.append(log_slice(match[0], match[1], top, bottom, max_points, method))
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Logs not found: {', '.join(missing)}")
+        
+        return json_stream_response(LogSliceResponse, {
             "success": True,
-            "dataset": dataset_details
-        }
+            "wellName": well.well_name,
+            "top": top,
+            "bottom": bottom,
+            "method": method,
+            "maxPoints": max_points,
+            "logs": logs
+        })
         
     except HTTPException:
         raise
@@ -1028,8 +1227,12 @@ async def get_dataset_details(wellPath: str, datasetName: str):
 
 
 @router.get("/list", response_model=WellListResponse)
-async def list_wells(projectPath: str):
-    """List all wells in a project (reads from SQLite first, falls back to .ptrc files)"""
+async def list_wells(request: Request, response: Response, projectPath: str):
+    """
+    List all wells in a project from the well summary catalog.
+    The ETag covers the revisions of all wells of the project; If-None-Match
+    with the current one is answered with 304 Not Modified.
+    """
     try:
         if not projectPath:
             raise HTTPException(status_code=400, detail="Project path is required")
@@ -1046,31 +1249,30 @@ async def list_wells(projectPath: str):
             print(f"[Wells API] Project path does not exist: {resolved_path}")
             return {"wells": []}
         
-        # Get wells from file storage index
+        # Answered from the summary catalog, no well body is loaded
         storage = get_file_well_storage()
-        well_ids = storage.list_wells_in_project(resolved_path)
-        
-        if well_ids:
-            print(f"[Wells API] Found {len(well_ids)} wells in file index")
-            wells = []
-            for well_id in well_ids:
-                # Load minimal well data from cache only (already in memory - no I/O)
-                well_data = storage.get_cached_well_data(resolved_path, well_id)
-                if well_data:
-                    wells.append({
-                        "id": well_id,
-                        "name": well_data.get('name', well_id),
-                        "type": well_data.get('well_type', 'Dev'),
-                        "path": os.path.join(resolved_path, "10-WELLS", f"{well_id}.ptrc"),
-                        "created_at": well_data.get('date_created'),
-                        "datasets": len(well_data.get('datasets', []))  # Keep just the count
-                    })
-            wells.sort(key=lambda x: x['name'])
-            return {"wells": wells}
-        
-        # No wells found in cache index - return empty list
-        print(f"[Wells API] No wells found in cache for project: {resolved_path}")
-        return {"wells": []}
+        tag = await asyncio.to_thread(storage.project_revision_tag, resolved_path)
+        headers = revision_headers(revision_etag(tag["revision"], tag["fingerprint"]), tag["modified"])
+        if etag_matches(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+        
+        summaries = storage.catalog.wells(resolved_path)
+        _sampled_log.log(logging.DEBUG, "list", "[Wells API] Found %d wells in catalog", len(summaries))
+        wells = [
+            {
+                "id": summary["id"],
+                "name": summary["id"],
+                "type": summary.get("well_type") or 'Dev',
+                "path": os.path.join(resolved_path, "10-WELLS", f"{summary['id']}.ptrc"),
+                "created_at": summary.get("date_created"),
+                "datasets": len(summary["datasets"]),
+                "error": summary.get("error")
+            }
+            for summary in summaries
+        ]
+        wells.sort(key=lambda x: x['name'])
+        return {"wells": wells}
         
     except HTTPException:
         raise
@@ -1079,8 +1281,12 @@ async def list_wells(projectPath: str):
 
 
 @router.get("/datasets", response_model=WellDatasetsResponse)
-async def get_well_datasets(projectPath: str, wellName: str):
-    """Get all datasets for a well"""
+async def get_well_datasets(request: Request, response: Response, projectPath: str, wellName: str):
+    """
+    Get all datasets for a well.
+    Responses carry the well revision as ETag; If-None-Match with the current one
+    is answered with 304 Not Modified without reading the well.
+    """
     try:
         if not projectPath or not wellName:
             raise HTTPException(
@@ -1101,6 +1307,12 @@ async def get_well_datasets(projectPath: str, wellName: str):
         if not os.path.exists(well_file):
             raise HTTPException(status_code=404, detail=f"Well {wellName} not found")
         
+        headers = await well_revision_headers(resolved_path, wellName)
+        if headers is not None:
+            if etag_matches(request, headers["ETag"]):
+                return Response(status_code=304, headers=headers)
+            response.headers.update(headers)
+        
         # Use cache-backed fetch instead of direct file read
         well, well_data, source = await fetch_well_data(resolved_path, wellName)
         
@@ -1166,6 +1378,114 @@ async def get_well_datasets(projectPath: str, wellName: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def well_changes(row: dict, well_data: Optional[dict], since: int, encoding: str, samples: str) -> dict:
+    """
+    Changes of one well since a revision from its revision row (see utils.well_revisions):
+    datasets with a newer version stamp carry only their added or changed logs.
+    """
+    entry = {
+        "wellName": row["well_name"],
+        "path": row["path"],
+        "revision": row["revision"],
+        "deleted": row["deleted"],
+        "datasets": [],
+        "removedDatasets": []
+    }
+    if row["deleted"] or well_data is None:
+        return entry
+    
+    stamps = row["datasets"]
+    entry["removedDatasets"] = sorted(name for name, stamp in stamps.items()
+                                      if stamp.get("removed") and stamp["revision"] > since)
+    for dataset in LazyWell(well_data).datasets:
+        stamp = stamps.get(dataset.name)
+        if stamp is None or stamp.get("removed"):
+            # Written after the revision row was taken: send it whole, the next sync settles it
+            stamp = {"revision": row["revision"], "logs": {}}
+            log_names = None
+        elif stamp["revision"] <= since:
+            continue
+        else:
+            log_names = {name for name, log in stamp["logs"].items()
+                         if not log.get("removed") and log["revision"] > since}
+        entry["datasets"].append({
+            **dataset_payload(dataset, encoding, samples, log_names),
+            "revision": stamp["revision"],
+            "removedLogs": sorted(name for name, log in stamp["logs"].items()
+                                  if log.get("removed") and log["revision"] > since)
+        })
+    return entry
+
+
+@router.get("/changes", response_model=WellChangesResponse)
+async def get_well_changes(request: Request, projectPath: str, since: int = 0, wellName: Optional[str] = None,
+                           encoding: str = "plain"):
+    """
+    Delta sync: what changed in a well (wellName) or a whole project since a revision.
+    
+    Wells whose revision is newer than since are listed with the datasets that were
+    added or changed (each with only its added or changed logs, plus the index and
+    constants) and the names of removed datasets and logs; deleted wells are listed
+    with deleted set. Pass the returned revision as since of the next call.
+    since=0 (or a revision the server never handed out) returns every well in full.
+    Clients accepting application/x-ptrc-logs get the binary payload (see utils.log_payload).
+    """
+    try:
+        if not projectPath:
+            raise HTTPException(status_code=400, detail="Project path is required")
+        validate_log_encoding(encoding)
+        
+        resolved_path = os.path.abspath(projectPath)
+        if not validate_path(resolved_path):
+            raise HTTPException(
+                status_code=403,
+                detail="Access denied: path outside petrophysics-workplace"
+            )
+        
+        storage = get_file_well_storage()
+        if wellName:
+            row = await asyncio.to_thread(storage.well_revision, resolved_path, wellName)
+            if row is None:
+                # Deleted wells keep their revision row
+                row = storage.revisions.get(os.path.join(resolved_path, "10-WELLS", f"{wellName}.ptrc"))
+            if row is None:
+                raise HTTPException(status_code=404, detail=f"Well '{wellName}' not found in project")
+            rows = [row]
+        else:
+            rows = await asyncio.to_thread(storage.project_revisions, resolved_path)
+        
+        # Taken after the rows are current: later writes get a newer revision and show up next time
+        revision = storage.revisions.last_revision()
+        full = since <= 0 or since > revision
+        if full:
+            since = 0
+        
+        changed = []
+        for row in rows:
+            if row["revision"] <= since or (full and row["deleted"]):
+                continue
+            well_data = None
+            if not row["deleted"]:
+                well_data = await asyncio.to_thread(storage.load_well_data, resolved_path, row["well_name"])
+            changed.append((row, well_data))
+        
+        _sampled_log.log(logging.DEBUG, "changes", "[Wells API] %d of %d wells changed since revision %d",
+                         len(changed), len(rows), since)
+        return negotiated_response(request, WellChangesResponse, lambda samples: {
+            "success": True,
+            "since": since,
+            "revision": revision,
+            "full": full,
+            "wells": [well_changes(row, well_data, since, encoding, samples) for row, well_data in changed]
+        })
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/{well_id}/log-plot", response_model=LogPlotResponse)
 async def generate_log_plot(well_id: str, data: LogPlotRequest):
     """Generate a well log plot for specified logs"""
@@ -1284,8 +1604,14 @@ async def generate_cross_plot(well_id: str, data: CrossPlotRequest):
         print("[CROSS PLOT] Initializing CrossPlotManager...")
         manager = CrossPlotManager()
         
+        # Depth-aligned table so logs from different datasets are paired by depth
+        storage = get_file_well_storage()
+        log_table = await asyncio.to_thread(
+            storage.get_merged_dataframe, resolved_path, well_id, None, well_data
+        )
+        
         print("[CROSS PLOT] Creating cross plot with matplotlib...")
-        plot_image = manager.create_cross_plot(well, x_log_name, y_log_name)
+        plot_image = manager.create_cross_plot(well, x_log_name, y_log_name, log_table=log_table)
         
         if plot_image is None:
             print("[CROSS PLOT] Error: Failed to generate plot")
@@ -1366,36 +1692,44 @@ async def generate_cpi_plot(well_id: str, data: LogPlotRequest):
         # Convert well data to DataFrame
         import pandas as pd
         
-        # Collect all logs into a DataFrame
-        all_logs = {}
-        depth_log = None
+        def is_tops_dataset(dataset) -> bool:
+            return dataset.type.upper() == 'TOPS' or dataset.name.upper() == 'TOPS'
         
-        for dataset in well.datasets:
-            # Get depth/index log
-            if hasattr(dataset, 'index_log') and dataset.index_log:
-                if depth_log is None:
-                    depth_log = dataset.index_log
-                    all_logs['DEPTH'] = dataset.index_log
-            
-            # Get well logs
-            for wlog in dataset.well_logs:
-                all_logs[wlog.name] = wlog.log
+        # Depth-aligned merge of all log datasets (TOPS are passed separately; the REFERENCE
+        # index and surveys would only interleave empty rows), cached per well revision
+        storage = get_file_well_storage()
+        log_datasets = [dataset.name for dataset in well.datasets
+                        if not is_tops_dataset(dataset) and dataset.type.upper() != 'REFERENCE'
+                        and not is_survey_dataset(dataset)]
+        df_merged = await asyncio.to_thread(
+            storage.get_merged_dataframe, resolved_path, well_id, log_datasets, well_data
+        )
         
-        if not all_logs or 'DEPTH' not in all_logs:
+        if df_merged is None or not len(df_merged.index):
             raise HTTPException(status_code=400, detail="Well data must contain DEPTH log")
         
-        df_logs = pd.DataFrame(all_logs)
+        df_logs = df_merged.drop(columns=['DEPTH'], errors='ignore').rename_axis('DEPTH').reset_index()
+        
+        # TVD/TVDSS for scale tracks, converted in one batch from the cached trajectory table
+        trajectory = await asyncio.to_thread(storage.get_trajectory, resolved_path, well_id, well_data)
+        if trajectory is not None:
+            depths = df_logs['DEPTH'].to_numpy()
+            if 'TVD' not in df_logs.columns:
+                df_logs['TVD'] = trajectory.to_tvd(depths)
+            if 'TVDSS' not in df_logs.columns:
+                df_logs['TVDSS'] = trajectory.to_tvdss(depths)
         print(f"[CPI PLOT] DataFrame created with {len(df_logs)} rows and {len(df_logs.columns)} columns")
         
         # Load TOPS if available
         df_tops = None
         tops_found = False
         for dataset in well.datasets:
-            if dataset.type.upper() == 'TOPS' or dataset.name.upper() == 'TOPS':
+            if is_tops_dataset(dataset):
                 tops_data = {}
                 for wlog in dataset.well_logs:
                     if wlog.name.upper() == 'TOP':
-                        tops_data['top_name'] = wlog.log
+                        # Keep tops dictionary encoded (codes + names) for the TOPS track
+                        tops_data['top_name'] = wlog.to_categorical() if wlog.is_categorical else wlog.log
                         tops_found = True
                     elif 'DEPTH' in wlog.name.upper():
                         tops_data['depth'] = wlog.log
@@ -0,0 +1,77 @@
+"""Shared fixtures for the backend tests (run with `python -m pytest` from backend/)."""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from starlette.requests import Request
+
+import utils.file_well_storage as fws
+from utils.synthetic_wells import generate_synthetic_project
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Workspace with one synthetic project of three JSON wells; returns the project path."""
+    project_path = str(tmp_path / "workspace" / "P")
+    generate_synthetic_project(project_path, n_wells=3, n_samples=200, n_logs=3)
+    return project_path
+
+
+@pytest.fixture
+def storage(tmp_path, project):
+    """FileWellStorageService over the synthetic workspace, installed as the global instance."""
+    previous = fws.file_well_storage
+    service = fws.FileWellStorageService(os.path.dirname(project), index_db_path=str(tmp_path / "index.db"))
+    service.snapshot_path = str(tmp_path / "snapshot.bin")
+    service.cache.clear()
+    service.index_well_files()
+    fws.file_well_storage = service
+    yield service
+    service.preloader.cancel()
+    service.cache.clear()
+    fws.file_well_storage = previous
+
+
+@pytest.fixture
+def wells_router(monkeypatch, storage):
+    """routers.wells with path validation and session storage stubbed out."""
+    import routers.wells as wells
+    monkeypatch.setattr(wells, "validate_path", lambda path: True)
+    monkeypatch.setattr(wells, "store_well_in_session", lambda path, data: None)
+    return wells
+
+
+def make_request(accept=None, if_none_match=None) -> Request:
+    """Bare GET request with optional Accept and If-None-Match headers."""
+    headers = []
+    if accept:
+        headers.append((b"accept", accept.encode()))
+    if if_none_match:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": headers})
+
+
+def response_body(response) -> bytes:
+    """Body of a plain or streaming response."""
+    if not hasattr(response, "body_iterator"):
+        return response.body
+
+    async def collect():
+        chunks = []
+        async for chunk in response.body_iterator:
+            chunks.append(chunk if isinstance(chunk, bytes) else chunk.encode())
+        return b"".join(chunks)
+
+    return asyncio.run(collect())
+
+
+def response_json(response):
+    return json.loads(response_body(response))
@@ -0,0 +1,45 @@
+import asyncio
+import logging
+
+from fastapi import Response
+
+from conftest import make_request
+from utils.well_cache_metrics import Histogram, SampledLog, render_prometheus
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+    assert histogram.summary()["count"] == 4
+
+
+def test_sampled_log_keeps_one_message_in_every(caplog):
+    logger = logging.getLogger("tests.sampled")
+    sampled = SampledLog(logger, every=3)
+    with caplog.at_level(logging.DEBUG, logger="tests.sampled"):
+        for i in range(7):
+            sampled.log(logging.DEBUG, "hit", "hit %d", i)
+        sampled.log(logging.DEBUG, "miss", "miss")
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "hit 0", "hit 3 (2 similar suppressed)", "hit 6 (2 similar suppressed)", "miss"]
+
+
+def test_prometheus_exposition_counts_hits_misses_and_bytes(storage, project):
+    well_id = storage.list_wells_in_project(project)[0]
+    storage.load_well_data(project, well_id)
+    storage.load_well_data(project, well_id)
+
+    text = render_prometheus(storage)
+    assert 'well_cache_hits_total{source="lazy"} 1' in text
+    assert 'well_cache_misses_total{source="lazy"} 1' in text
+    assert "well_cache_disk_read_seconds_count 1" in text
+    assert 'well_cache_resident_bytes{project="' in text
+
+
+def test_well_listing_does_not_print_per_request(wells_router, project, capsys):
+    response = asyncio.run(wells_router.list_wells(make_request(), Response(), project))
+    assert len(response["wells"]) == 3
+    assert "[Wells API]" not in capsys.readouterr().out
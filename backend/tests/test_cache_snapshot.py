@@ -0,0 +1,42 @@
+import json
+import os
+
+import numpy as np
+
+
+def _load_all(storage, project):
+    return {well_id: storage.load_well_data(project, well_id) for well_id in storage.list_wells_in_project(project)}
+
+
+def test_snapshot_restores_unchanged_wells(storage, project):
+    expected = _load_all(storage, project)
+    result = storage.save_cache_snapshot()
+    assert result["written"] and result["wells"] == 3
+    assert not storage.save_cache_snapshot()["written"]
+
+    # An edit after the snapshot makes that well stale
+    changed = os.path.join(project, "10-WELLS", "SYN-0001.ptrc")
+    with open(changed) as f:
+        well = json.load(f)
+    well["well_type"] = "Vertical"
+    with open(changed, "w") as f:
+        json.dump(well, f)
+
+    storage.cache.clear()
+    restored = storage.restore_cache_snapshot()
+
+    key = storage.get_file_key(project, "SYN-0001")
+    assert restored["stale"] == [key]
+    assert sorted(restored["restored"]) == [storage.get_file_key(project, w) for w in ("SYN-0000", "SYN-0002")]
+
+    data = storage.get_cached_well_data(project, "SYN-0000")
+    expected_log = expected["SYN-0000"]["datasets"][0]["well_logs"][0]["log"]
+    np.testing.assert_array_equal(data["datasets"][0]["well_logs"][0]["log"], expected_log)
+    assert storage.cache.get(storage.get_file_key(project, "SYN-0000"))["source"] == "lazy"
+
+
+def test_missing_or_corrupt_snapshots_are_ignored(storage, tmp_path):
+    assert storage.restore_cache_snapshot(str(tmp_path / "missing.bin"))["restored"] == []
+    corrupt = tmp_path / "corrupt.bin"
+    corrupt.write_bytes(b"not a snapshot at all....")
+    assert storage.restore_cache_snapshot(str(corrupt))["restored"] == []
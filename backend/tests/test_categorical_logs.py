@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from dependencies import log_samples_payload, validate_log_encoding
+from models import WellLogInfo
+from utils.fe_data_objects import WellLog
+
+
+def _zone_log():
+    return WellLog("ZONE", "", "", "TOP", "str", ["A", "A", None, "B", "A"], "TOPS")
+
+
+def test_string_logs_are_dictionary_encoded():
+    log = _zone_log()
+    assert log.is_categorical and log.categories == ["A", "B"]
+    np.testing.assert_array_equal(log.values, [0, 0, -1, 1, 0])
+    starts, stops, codes = log.segments()
+    assert starts.tolist() == [0, 2, 3, 4] and stops.tolist() == [2, 3, 4, 5] and codes.tolist() == [0, -1, 1, 0]
+
+
+def test_categorical_payload_returns_codes_and_categories():
+    payload = log_samples_payload(_zone_log(), "categorical")
+    assert payload == {"log": None, "codes": [0, 0, -1, 1, 0], "categories": ["A", "B"]}
+
+
+def test_plain_payload_has_no_encoding_fields():
+    payload = log_samples_payload(_zone_log(), "plain")
+    assert payload == {"log": ["A", "A", None, "B", "A"]}
+    info = WellLogInfo(name="ZONE", date="", description="", dtst="TOPS", interpolation="TOP", log_type="str",
+                       **payload)
+    assert "codes" not in info.model_dump() and "categories" not in info.model_dump_json()
+
+
+def test_numeric_logs_stay_plain_with_categorical_encoding():
+    log = WellLog("GR", "", "", "CONTINUOUS", "float", [1.0, None], "WIRE")
+    assert log_samples_payload(log, "categorical") == {"log": [1.0, None]}
+
+
+def test_unknown_encoding_is_rejected():
+    with pytest.raises(HTTPException) as error:
+        validate_log_encoding("dictionary")
+    assert error.value.status_code == 400
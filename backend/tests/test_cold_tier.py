@@ -0,0 +1,56 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from utils.ptrc_file_io import columns_as_arrays, write_well_file
+from utils.synthetic_wells import generate_synthetic_well
+from utils.well_cache import freeze_well, thaw_well
+
+
+def _assert_same_well(actual, expected):
+    for dataset, expected_dataset in zip(actual["datasets"], expected["datasets"]):
+        np.testing.assert_array_equal(dataset["index_log"], expected_dataset["index_log"])
+        for log, expected_log in zip(dataset["well_logs"], expected_dataset["well_logs"]):
+            if isinstance(expected_log["log"], np.ndarray):
+                np.testing.assert_array_equal(log["log"], expected_log["log"])
+            else:
+                assert list(log["log"]) == list(expected_log["log"])
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_freeze_thaw_round_trip(codec):
+    well = columns_as_arrays(generate_synthetic_well("W1", n_samples=300, n_logs=3, seed=1))
+    well["datasets"][0]["well_logs"][0]["log"][5] = np.nan
+
+    frozen = freeze_well(well, codec)
+    thawed = thaw_well(frozen)
+
+    _assert_same_well(thawed, well)
+    # Thawing twice works: the frozen header is not consumed
+    _assert_same_well(thaw_well(frozen), well)
+    assert thawed["datasets"][0]["well_logs"][0]["log"].flags.writeable
+
+
+def test_mixed_sample_types_have_no_cold_form():
+    well = generate_synthetic_well("W1", n_samples=10, n_logs=1, seed=1)
+    well["datasets"][0]["well_logs"][0]["log"][0] = "bad"
+    assert freeze_well(well) is None
+
+
+def test_idle_wells_are_compressed_and_thawed_on_access(storage, project):
+    # Long enough for the compressed columns to outweigh the header
+    well_id = "LONG"
+    write_well_file(os.path.join(project, "10-WELLS", "LONG.ptrc"),
+                    generate_synthetic_well(well_id, n_samples=2000, n_logs=3, seed=1))
+    expected = storage.load_well_data(project, well_id)
+    file_key = storage.get_file_key(project, well_id)
+    time.sleep(0.01)
+
+    assert storage.compress_idle_wells(idle_seconds=0.001) == [file_key]
+    entry = storage.cache.get(file_key)
+    assert entry["data"] is None and entry["bytes"] < entry["frozen"]["raw_bytes"]
+
+    _assert_same_well(storage.load_well_data(project, well_id), expected)
+    assert storage.cache.cold_hits == 1 and storage.cache.get(file_key)["data"] is not None
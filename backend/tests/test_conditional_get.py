@@ -0,0 +1,76 @@
+import asyncio
+import json
+import os
+
+from fastapi import Response
+
+import utils.file_well_storage as fws
+from conftest import make_request
+from utils.log_payload import BINARY_MEDIA_TYPE
+from utils.ptrc_file_io import read_well_file, write_well_file
+
+
+def _edit_well_type(project, well_id, well_type):
+    path = os.path.join(project, "10-WELLS", f"{well_id}.ptrc")
+    with open(path) as f:
+        well = json.load(f)
+    well["well_type"] = well_type
+    with open(path, "w") as f:
+        json.dump(well, f)
+
+
+def test_well_data_etag_is_per_representation(wells_router, project):
+    well_path = f"{project}/10-WELLS/SYN-0000.ptrc"
+    as_json = asyncio.run(wells_router.get_well_data(make_request(), well_path))
+    as_binary = asyncio.run(wells_router.get_well_data(make_request(BINARY_MEDIA_TYPE), well_path))
+    categorical = asyncio.run(wells_router.get_well_data(make_request(), well_path, encoding="categorical"))
+    etag = as_json.headers["ETag"]
+    assert len({etag, as_binary.headers["ETag"], categorical.headers["ETag"]}) == 3
+
+    not_modified = asyncio.run(wells_router.get_well_data(make_request(if_none_match=etag), well_path))
+    assert not_modified.status_code == 304 and not_modified.headers["ETag"] == etag
+
+    # A JSON tag must not answer a binary request with 304
+    binary = asyncio.run(wells_router.get_well_data(make_request(BINARY_MEDIA_TYPE, if_none_match=etag), well_path))
+    assert binary.status_code == 200 and binary.media_type == BINARY_MEDIA_TYPE
+
+
+def test_external_edit_changes_the_etag(wells_router, project):
+    response = Response()
+    asyncio.run(wells_router.get_well_datasets(make_request(), response, project, "SYN-0001"))
+    etag = response.headers["ETag"]
+    request = make_request(if_none_match=etag)
+    assert asyncio.run(wells_router.get_well_datasets(request, Response(), project, "SYN-0001")).status_code == 304
+
+    _edit_well_type(project, "SYN-0001", "Vertical")
+
+    response = Response()
+    asyncio.run(wells_router.get_well_datasets(make_request(if_none_match=etag), response, project, "SYN-0001"))
+    assert response.headers["ETag"] != etag
+
+
+def test_well_list_etag_covers_every_well(wells_router, project):
+    response = Response()
+    asyncio.run(wells_router.list_wells(make_request(), response, project))
+    etag = response.headers["ETag"]
+    assert asyncio.run(wells_router.list_wells(make_request(if_none_match=etag), Response(), project)).status_code == 304
+
+    _edit_well_type(project, "SYN-0002", "Vertical")
+
+    listed = asyncio.run(wells_router.list_wells(make_request(if_none_match=etag), Response(), project))
+    assert isinstance(listed, dict) and len(listed["wells"]) == 3
+
+
+def test_writes_in_child_processes_are_not_recorded(storage, project, monkeypatch):
+    well_path = os.path.join(project, "10-WELLS", "SYN-0000.ptrc")
+    revision = storage.well_revision(project, "SYN-0000")["revision"]
+    well = read_well_file(well_path)
+    well["well_type"] = "Vertical"
+
+    monkeypatch.setattr(fws.os, "getpid", lambda: storage.revisions.owner_pid + 1)
+    write_well_file(well_path, well)
+    assert storage.revisions.get(well_path)["revision"] == revision
+
+    monkeypatch.undo()
+    write_well_file(well_path, well)
+    assert storage.revisions.get(well_path)["revision"] > revision
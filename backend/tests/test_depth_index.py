@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from utils.fe_data_objects import DepthIndex
+
+
+def _brute_force(depths, top, bottom):
+    depths = np.asarray(depths, dtype=np.float64)
+    return np.flatnonzero((depths >= top) & (depths <= bottom))
+
+
+@pytest.mark.parametrize("depths", [
+    np.round(1000.0 + 0.1524 * np.arange(200), 4),
+    np.array([1.0, 1.5, 3.0, 3.0, 7.25, 9.0]),
+    np.array([5.0, 1.0, 3.0, 2.0, 4.0]),
+])
+@pytest.mark.parametrize("top, bottom", [(1.0, 3.0), (1000.1524, 1010.0), (-5.0, 1e6), (3.0, 3.0), (50.0, 10.0)])
+def test_windows_match_a_linear_scan(depths, top, bottom):
+    index = DepthIndex(depths)
+    window = index.locate(top, bottom)
+    positions = np.arange(len(depths))[window]
+    np.testing.assert_array_equal(positions, _brute_force(depths, top, bottom))
+
+
+def test_sorted_index_windows_are_views():
+    depths = np.arange(10, dtype=np.float64)
+    index = DepthIndex(depths)
+    assert index.is_sorted and index.is_uniform
+    assert np.shares_memory(index.window(depths, 2.0, 5.0), depths)
+
+
+def test_trailing_nan_depths_are_ignored():
+    index = DepthIndex(np.array([1.0, 2.0, 3.0, np.nan]))
+    assert index.is_sorted and index.bottom == 3.0
+    assert index.locate(None, None) == slice(0, 3)
+
+
+def test_position_returns_nearest_sample_in_stored_order():
+    index = DepthIndex(np.array([3.0, 1.0, 2.0]))
+    assert not index.is_sorted
+    assert index.position(1.1) == 1
+    assert index.position(2.9) == 0
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+import numpy as np
+
+from utils.depth_merge import merge_datasets
+from utils.fe_data_objects import Dataset, WellLog
+
+
+def _dataset(name, depths, logs):
+    well_logs = [WellLog(log_name, "", "", interpolation, log_type, samples, name)
+                 for log_name, interpolation, log_type, samples in logs]
+    return Dataset(datetime.now(), name, "Cont", "W1", index_log=depths, index_name="DEPTH", well_logs=well_logs)
+
+
+def test_merge_aligns_on_union_depths():
+    wire = _dataset("WIRE", [100.0, 100.5, 101.0], [("GR", "CONTINUOUS", "float", [1.0, 2.0, 3.0])])
+    # Float noise below DEPTH_DECIMALS still lines up with the WIRE depths
+    tops = _dataset("TOPS", [100.50000001, 102.0], [("TOPS", "TOP", "str", ["A", "B"])])
+
+    frame = merge_datasets([wire, tops])
+
+    np.testing.assert_array_equal(frame.index.values, [100.0, 100.5, 101.0, 102.0])
+    np.testing.assert_array_equal(frame["GR"].values, [1.0, 2.0, 3.0, np.nan])
+    assert frame["TOPS"].isna().tolist() == [True, False, True, False]
+    assert frame["TOPS"].iloc[[1, 3]].tolist() == ["A", "B"]
+    assert list(frame["TOPS"].cat.categories) == ["A", "B"]
+
+
+def test_duplicate_log_names_get_suffixes():
+    first = _dataset("A", [1.0, 2.0], [("GR", "CONTINUOUS", "float", [1.0, 2.0])])
+    second = _dataset("B", [2.0, 3.0], [("GR", "CONTINUOUS", "float", [5.0, 6.0])])
+
+    frame = merge_datasets([first, second])
+
+    assert list(frame.columns) == ["GR", "GR_dup"]
+    np.testing.assert_array_equal(frame["GR_dup"].values, [np.nan, 5.0, 6.0])
@@ -0,0 +1,25 @@
+import json
+
+from utils.fe_data_objects import LazyWell, Well
+from utils.synthetic_wells import generate_synthetic_well
+
+
+def test_lazy_well_serializes_like_an_eager_well():
+    data = generate_synthetic_well("W1", n_samples=20, n_logs=2, seed=1)
+    lazy = LazyWell(data).to_dict()
+    eager = Well.from_dict(data).to_dict()
+    assert json.dumps(lazy, sort_keys=True, default=str) == json.dumps(eager, sort_keys=True, default=str)
+
+
+def test_metadata_access_does_not_materialize_samples():
+    data = generate_synthetic_well("W1", n_samples=20, n_logs=2, seed=1)
+    well = LazyWell(data)
+    assert well._datasets is None
+
+    dataset = well.datasets[0]
+    log = dataset.well_logs[0]
+    assert (log.name, log.log_type, len(log)) == ("LOG00", "float", 20)
+    assert log._source is not None and dataset._index_log is None
+
+    assert log.values[0] == data["datasets"][0]["well_logs"][0]["log"][0]
+    assert log._source is None
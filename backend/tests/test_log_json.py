@@ -0,0 +1,46 @@
+import json
+
+import numpy as np
+
+from dependencies import sanitize_list
+from models import WellDataResponse
+from routers.wells import SAMPLES_ARRAY, SAMPLES_LIST, dataset_payload
+from utils.fe_data_objects import LazyWell
+from utils.log_json import encode_number_array, iter_model_json
+from utils.ptrc_file_io import columns_as_arrays
+from utils.synthetic_wells import generate_synthetic_well
+
+
+def _reference(values):
+    return json.dumps(sanitize_list(values), separators=(",", ":")).encode()
+
+
+def test_number_arrays_print_like_repr():
+    rng = np.random.default_rng(3)
+    values = np.concatenate([
+        np.round(rng.normal(0, 1000, 500), 4),
+        rng.normal(0, 1, 100),
+        [0.0, -0.0, 1e-05, 1e16, 123456789.125, 2.5e-300, np.nan, np.inf, -np.inf],
+    ])
+    assert encode_number_array(values) == _reference(values)
+    assert encode_number_array(np.arange(5, dtype=np.int32)) == b"[0,1,2,3,4]"
+    assert encode_number_array(np.empty(0)) == b"[]"
+
+
+def test_streamed_response_matches_the_response_model():
+    data = columns_as_arrays(generate_synthetic_well("W1", n_samples=100, n_logs=2, seed=2))
+    data["datasets"][0]["well_logs"][0]["log"][7] = np.nan
+    well = LazyWell(data)
+
+    def payload(samples, encoding):
+        return {"success": True, "wellName": " W1 ",
+                "datasets": [dataset_payload(dataset, encoding, samples) for dataset in well.datasets]}
+
+    for encoding in ("plain", "categorical"):
+        streamed = b"".join(iter_model_json(WellDataResponse, payload(SAMPLES_ARRAY, encoding)))
+        model = WellDataResponse.model_validate(payload(SAMPLES_LIST, encoding))
+        expected = json.dumps(model.model_dump(mode="json"), ensure_ascii=False, separators=(",", ":")).encode()
+        assert streamed == expected
+
+    plain = b"".join(iter_model_json(WellDataResponse, payload(SAMPLES_ARRAY, "plain")))
+    assert b'"codes"' not in plain and b'"categories"' not in plain
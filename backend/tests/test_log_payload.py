@@ -0,0 +1,51 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from conftest import make_request, response_body, response_json
+from utils.log_payload import (BINARY_MEDIA_TYPE, FLOAT32, FLOAT64, decode_binary_payload, encode_binary_payload,
+                               negotiate_float_dtype)
+
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, None),
+    ("application/json", None),
+    (BINARY_MEDIA_TYPE, FLOAT64),
+    (f"application/json, {BINARY_MEDIA_TYPE};dtype=float32", FLOAT32),
+    (f"{BINARY_MEDIA_TYPE};q=0", None),
+])
+def test_accept_negotiation(accept, expected):
+    assert negotiate_float_dtype(accept) == expected
+
+
+def test_payload_round_trip_keeps_nan_and_codes():
+    payload = {"name": "W1", "logs": [{"log": np.array([1.5, np.nan]), "codes": None},
+                                      {"log": None, "codes": np.array([0, -1], dtype=np.int32), "categories": ["A"]}]}
+
+    decoded = decode_binary_payload(encode_binary_payload(payload))
+
+    assert decoded["name"] == "W1" and decoded["logs"][1]["categories"] == ["A"]
+    np.testing.assert_array_equal(decoded["logs"][0]["log"], [1.5, np.nan])
+    assert decoded["logs"][1]["codes"].dtype == np.int32
+
+    as_float32 = decode_binary_payload(encode_binary_payload(payload, FLOAT32))
+    assert as_float32["logs"][0]["log"].dtype == np.float32
+
+
+def test_well_data_endpoint_serves_json_and_binary_alike(wells_router, project):
+    well_path = f"{project}/10-WELLS/SYN-0000.ptrc"
+    as_json = response_json(asyncio.run(wells_router.get_well_data(make_request(), well_path)))
+    response = asyncio.run(wells_router.get_well_data(make_request(BINARY_MEDIA_TYPE), well_path))
+    assert response.media_type == BINARY_MEDIA_TYPE
+    as_binary = decode_binary_payload(response_body(response))
+
+    for json_dataset, binary_dataset in zip(as_json["datasets"], as_binary["datasets"]):
+        np.testing.assert_array_equal(binary_dataset["index_log"], json_dataset["index_log"])
+        for json_log, binary_log in zip(json_dataset["well_logs"], binary_dataset["well_logs"]):
+            if binary_log.get("categories") is None:
+                values = np.array([np.nan if v is None else v for v in json_log["log"]])
+                np.testing.assert_array_equal(binary_log["log"], values)
+            else:
+                lookup = np.array(binary_log["categories"] + [None], dtype=object)
+                assert lookup[binary_log["codes"]].tolist() == json_log["log"]
@@ -0,0 +1,57 @@
+import os
+from datetime import datetime
+
+import numpy as np
+
+from utils.fe_data_objects import Dataset, WellLog
+from utils.log_resampling import regular_index, resample_dataset, resample_project
+from utils.ptrc_file_io import read_well_file
+
+
+def _dataset(logs, depths=(100.0, 101.0, 102.0, 103.0)):
+    well_logs = [WellLog(name, "", "", interpolation, log_type, samples, "SRC")
+                 for name, interpolation, log_type, samples in logs]
+    return Dataset(datetime.now(), "SRC", "Cont", "W1", index_log=list(depths), index_name="DEPTH",
+                   well_logs=well_logs)
+
+
+def _log(dataset, name):
+    return next(log for log in dataset.well_logs if log.name == name)
+
+
+def test_continuous_logs_are_interpolated_linearly():
+    dataset = _dataset([("GR", "CONTINUOUS", "float", [0.0, 10.0, None, 30.0])])
+    result = resample_dataset(dataset, new_index=[99.0, 100.5, 101.0, 101.5, 103.0])
+    np.testing.assert_array_equal(_log(result, "GR").values, [np.nan, 5.0, 10.0, np.nan, 30.0])
+
+
+def test_top_logs_hold_the_last_value():
+    dataset = _dataset([("ZONE", "TOP", "str", ["A", None, "B", None])], depths=(100.0, 101.0, 102.0, 103.0))
+    result = resample_dataset(dataset, new_index=[99.5, 100.0, 101.9, 102.5])
+    assert _log(result, "ZONE").log.tolist() == [None, "A", None, "B"]
+
+
+def test_point_logs_take_the_nearest_sample_within_tolerance():
+    dataset = _dataset([("CORE", "POINT", "float", [1.0, 2.0, 3.0, 4.0])])
+    result = resample_dataset(dataset, new_index=[100.1, 100.5, 102.9], tolerance=0.2)
+    np.testing.assert_array_equal(_log(result, "CORE").values, [1.0, np.nan, 4.0])
+
+
+def test_step_resampling_covers_the_source_range():
+    dataset = _dataset([("GR", "CONTINUOUS", "float", [0.0, 1.0, 2.0, 3.0])])
+    result = resample_dataset(dataset, step=0.5, name="RES")
+    np.testing.assert_array_equal(result.index_log, regular_index(100.0, 103.0, 0.5))
+    np.testing.assert_allclose(_log(result, "GR").values, np.arange(7) / 2)
+    assert result.name == "RES" and result.metadata["resampled_from"] == "SRC"
+
+
+def test_project_resampling_writes_in_the_calling_process(storage, project):
+    well_path = os.path.join(project, "10-WELLS", "SYN-0000.ptrc")
+    revision = storage.well_revision(project, "SYN-0000")["revision"]
+
+    result = resample_project(project, "WIRE", step=0.5, max_workers=2)
+
+    assert result["resampled"] == ["SYN-0000", "SYN-0001", "SYN-0002"] and result["failed"] == []
+    assert "WIRE_RS" in [dataset["name"] for dataset in read_well_file(well_path)["datasets"]]
+    # The write listener ran here, not in a worker
+    assert storage.revisions.get(well_path)["revision"] > revision
@@ -0,0 +1,60 @@
+import asyncio
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from conftest import response_json
+from models import LogSliceResponse
+from utils.log_decimation import DECIMATE_LTTB, DECIMATE_MINMAX, decimate
+
+
+def test_minmax_keeps_spikes_and_gaps():
+    depths = np.arange(1000, dtype=np.float64)
+    values = np.sin(depths / 50)
+    values[500] = 10.0
+    values[700:720] = np.nan
+
+    keep = decimate(depths, values, 100, DECIMATE_MINMAX)
+
+    assert len(keep) <= 100 and np.all(np.diff(keep) > 0)
+    assert 500 in keep
+    assert np.isnan(values[keep]).any()
+
+
+def test_lttb_stays_within_budget_and_keeps_the_end_points():
+    depths = np.arange(1000, dtype=np.float64)
+    keep = decimate(depths, np.cos(depths / 30), 50, DECIMATE_LTTB)
+    assert len(keep) <= 50 and keep[0] == 0 and keep[-1] == 999
+
+
+def test_string_logs_keep_zone_changes():
+    codes = np.repeat(np.arange(5, dtype=np.int32), 100)
+    keep = decimate(np.arange(500, dtype=np.float64), codes, 20, categorical=True)
+    assert keep.tolist() == [0, 100, 200, 300, 400]
+
+
+def test_curves_within_the_budget_are_not_decimated():
+    assert decimate(np.arange(10.0), np.arange(10.0), 10) is None
+
+
+def test_log_slice_endpoint_windows_and_decimates(wells_router, project):
+    response = asyncio.run(wells_router.get_log_slice("SYN-0000", project, "LOG00,TOPS", top=1005.0, bottom=1025.0,
+                                                      max_points=20))
+    payload = LogSliceResponse.model_validate(response_json(response))
+
+    wire, tops = payload.logs
+    assert wire.dataset == "WIRE" and wire.decimated and len(wire.depths) <= 20
+    assert 1005.0 <= min(wire.depths) and max(wire.depths) <= 1025.0
+    assert tops.dataset == "TOPS" and not tops.decimated
+
+
+@pytest.mark.parametrize("kwargs, status", [
+    ({"names": "LOG00", "method": "every-nth"}, 400),
+    ({"names": "LOG00", "top": 1010.0, "bottom": 1000.0}, 400),
+    ({"names": "NOPE"}, 404),
+])
+def test_log_slice_endpoint_rejects_bad_requests(wells_router, project, kwargs, status):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(wells_router.get_log_slice("SYN-0000", project, **kwargs))
+    assert error.value.status_code == status
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from utils.fe_data_objects import WellLog, encode_log_values
+
+
+def test_numeric_samples_become_float64_with_nan_for_missing():
+    values, categories = encode_log_values([1, 2.5, None, float("nan")])
+    assert categories is None
+    assert values.dtype == np.float64
+    np.testing.assert_array_equal(values, [1.0, 2.5, np.nan, np.nan])
+
+
+def test_numeric_strings_are_not_coerced():
+    values, categories = encode_log_values(["1.5", "2", None])
+    assert categories == ["1.5", "2"]
+    np.testing.assert_array_equal(values, [0, 1, -1])
+
+
+def test_strings_mixed_with_numbers_are_rejected():
+    with pytest.raises(ValueError):
+        encode_log_values([1.0, "2.0"])
+
+
+def test_well_log_round_trips_through_dict():
+    log = WellLog("GR", "", "", "linear", "float", [10.0, None, 30.0], "WIRE")
+    assert isinstance(log.values, np.ndarray)
+    assert WellLog.from_dict(log.to_dict()).to_list() == [10.0, None, 30.0]
+
+
+def test_cached_well_columns_are_float64_arrays(storage, project):
+    well_id = storage.list_wells_in_project(project)[0]
+    well_data = storage.load_well_data(project, well_id)
+    dataset = well_data["datasets"][0]
+    assert isinstance(dataset["index_log"], np.ndarray) and dataset["index_log"].dtype == np.float64
+    for log in dataset["well_logs"]:
+        if log["log_type"] == "float":
+            assert isinstance(log["log"], np.ndarray) and log["log"].dtype == np.float64
@@ -0,0 +1,38 @@
+import numpy as np
+
+from utils.fe_data_objects import Survey, SurveyData, TrajectoryTable
+
+
+def test_vertical_well_tvd_equals_md():
+    tvd, north, east = Survey.compute_tvd_minimum_curvature([100.0, 200.0, 350.0], [0, 0, 0], [0, 0, 0])
+    np.testing.assert_allclose(tvd, [100.0, 200.0, 350.0])
+    np.testing.assert_allclose(north, 0.0, atol=1e-12)
+    np.testing.assert_allclose(east, 0.0, atol=1e-12)
+
+
+def test_build_section_follows_a_circular_arc():
+    # Building 0 -> 90 degrees due east over a quarter circle of radius 1000
+    radius = 1000.0
+    md = [0.0, radius * np.pi / 2]
+    tvd, north, east = Survey.compute_tvd_minimum_curvature(md, [0.0, 90.0], [90.0, 90.0])
+    np.testing.assert_allclose([tvd[-1], east[-1], north[-1]], [radius, radius, 0.0], atol=1e-9)
+
+
+def test_arc_split_into_stations_gives_the_same_end_point():
+    radius = 500.0
+    md = np.linspace(0.0, radius * np.pi / 2, 10)
+    inc = np.degrees(md / radius)
+    tvd, north, east = Survey.compute_tvd_minimum_curvature(md, inc, np.full(10, 0.0))
+    np.testing.assert_allclose(radius * np.sin(md / radius), tvd, atol=1e-9)
+    np.testing.assert_allclose(radius * (1 - np.cos(md / radius)), north, atol=1e-9)
+
+
+def test_trajectory_table_converts_md_outside_the_survey():
+    survey = Survey([SurveyData(100.0, 0.0, 0.0), SurveyData(200.0, 0.0, 0.0), SurveyData(300.0, 60.0, 0.0)])
+    table = TrajectoryTable.from_survey(survey, elevation=25.0)
+
+    tvd = table.to_tvd([50.0, 150.0, 300.0, 310.0])
+    assert tvd[0] == 50.0 and tvd[1] == 150.0
+    # Below the last station the hole continues on the last (about 60 degree) table segment
+    np.testing.assert_allclose(tvd[3] - tvd[2], 10.0 * np.cos(np.radians(60.0)), rtol=1e-2)
+    np.testing.assert_allclose(table.to_tvdss([150.0]), [125.0])
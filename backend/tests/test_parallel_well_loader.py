@@ -0,0 +1,42 @@
+import glob
+import os
+
+import numpy as np
+import pytest
+
+from utils.parallel_well_loader import _collect, _read_well_shared, load_wells_in_processes
+from utils.ptrc_file_io import read_well_file
+from utils.well_file_index import file_fingerprint
+
+
+def _assert_same_well(actual, expected):
+    for dataset, expected_dataset in zip(actual["datasets"], expected["datasets"]):
+        np.testing.assert_array_equal(dataset["index_log"], expected_dataset["index_log"])
+        for log, expected_log in zip(dataset["well_logs"], expected_dataset["well_logs"]):
+            if isinstance(expected_log["log"], np.ndarray):
+                np.testing.assert_array_equal(log["log"], expected_log["log"])
+            else:
+                assert list(log["log"]) == list(expected_log["log"])
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_process_loads_match_in_process_reads(project, max_workers):
+    file_paths = sorted(glob.glob(os.path.join(project, "10-WELLS", "*.ptrc")))
+    missing = os.path.join(project, "10-WELLS", "MISSING.ptrc")
+
+    results = {path: (well, fingerprint, error)
+               for path, well, fingerprint, error in load_wells_in_processes(file_paths + [missing], max_workers)}
+
+    assert results[missing][0] is None and results[missing][2]
+    for file_path in file_paths:
+        well, fingerprint, error = results[file_path]
+        assert error is None
+        assert fingerprint == file_fingerprint(file_path, with_hash=True)
+        _assert_same_well(well, read_well_file(file_path, arrays=True))
+
+
+def test_worker_columns_are_float64_arrays(project):
+    file_path = sorted(glob.glob(os.path.join(project, "10-WELLS", "*.ptrc")))[0]
+    _, well, _, error = _collect(_read_well_shared(file_path))
+    assert error is None
+    assert well["datasets"][0]["well_logs"][0]["log"].dtype == np.float64
@@ -0,0 +1,67 @@
+import json
+
+import numpy as np
+import pytest
+
+from utils.ptrc_file_io import (FORMAT_JSON, FORMAT_V2, convert_project_wells, detect_well_format,
+                                read_well_file, read_well_log, write_well_file)
+from utils.synthetic_wells import generate_synthetic_well
+
+
+def _well():
+    well = generate_synthetic_well("W1", n_samples=50, n_logs=2, seed=1)
+    well["datasets"][0]["well_logs"][0]["log"][3] = None
+    return well
+
+
+def test_v2_round_trip_matches_json(tmp_path):
+    well = _well()
+    write_well_file(str(tmp_path / "json.ptrc"), well, fmt=FORMAT_JSON)
+    write_well_file(str(tmp_path / "v2.ptrc"), well, fmt=FORMAT_V2)
+
+    assert detect_well_format(str(tmp_path / "v2.ptrc")) == FORMAT_V2
+    from_json = read_well_file(str(tmp_path / "json.ptrc"))
+    from_v2 = read_well_file(str(tmp_path / "v2.ptrc"))
+    assert json.dumps(from_v2, sort_keys=True) == json.dumps(from_json, sort_keys=True)
+
+
+def test_v2_single_log_read(tmp_path):
+    well = _well()
+    file_path = str(tmp_path / "v2.ptrc")
+    write_well_file(file_path, well, fmt=FORMAT_V2)
+
+    values = read_well_log(file_path, "WIRE", "LOG00")
+    assert values.dtype == np.float64 and np.isnan(values[3])
+    tops = read_well_log(file_path, "TOPS", "TOPS")
+    assert tops.tolist() == well["datasets"][1]["well_logs"][0]["log"]
+
+
+@pytest.mark.parametrize("fmt", [FORMAT_JSON, FORMAT_V2])
+def test_numpy_scalars_are_written_as_numbers(tmp_path, fmt):
+    well = _well()
+    well["datasets"][0]["constants"] += [{"name": "NLOGS", "value": np.int64(5), "tag": ""},
+                                         {"name": "CORED", "value": np.bool_(True), "tag": ""},
+                                         {"name": "RW", "value": np.float32(0.25), "tag": "ohmm"}]
+    file_path = str(tmp_path / "well.ptrc")
+    write_well_file(file_path, well, fmt=fmt)
+
+    constants = {c["name"]: c["value"] for c in read_well_file(file_path)["datasets"][0]["constants"]}
+    assert (constants["NLOGS"], constants["CORED"], constants["RW"]) == (5, True, 0.25)
+    assert type(constants["NLOGS"]) is int
+
+    well["datasets"][0]["constants"].append({"name": "BAD", "value": object(), "tag": ""})
+    with pytest.raises(TypeError):
+        write_well_file(file_path, well, fmt=fmt)
+    assert read_well_file(file_path)["datasets"][0]["constants"][-1]["name"] == "RW"
+
+
+def test_rewrites_keep_the_existing_format(tmp_path):
+    file_path = str(tmp_path / "v2.ptrc")
+    write_well_file(file_path, _well(), fmt=FORMAT_V2)
+    assert write_well_file(file_path, read_well_file(file_path, arrays=True)) == FORMAT_V2
+
+
+def test_convert_project_wells(project):
+    result = convert_project_wells(project, FORMAT_V2)
+    assert len(result["converted"]) == 3 and not result["failed"]
+    assert convert_project_wells(project, FORMAT_V2)["skipped"] == result["converted"]
@@ -0,0 +1,46 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.file_well_storage import INFLIGHT_LOADS
+
+
+def test_concurrent_misses_share_one_load(storage, project, monkeypatch):
+    well_id = storage.list_wells_in_project(project)[0]
+    release = threading.Event()
+    loads = []
+    load = storage._load_well_file_sync
+
+    def slow_load(file_path):
+        loads.append(file_path)
+        release.wait(5)
+        return load(file_path)
+
+    monkeypatch.setattr(storage, "_load_well_file_sync", slow_load)
+    requests = 8
+    with ThreadPoolExecutor(requests) as pool:
+        futures = [pool.submit(storage.load_well_data, project, well_id) for _ in range(requests)]
+        # Hold the first load until every other request waits on it
+        deadline = time.monotonic() + 5
+        while storage.saved_loads < requests - 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        results = [future.result(5) for future in futures]
+
+    assert len(loads) == 1
+    assert all(result is results[0] for result in results)
+    assert storage.saved_loads == requests - 1
+    assert not INFLIGHT_LOADS
+
+
+def test_failed_load_releases_waiters(storage, project, monkeypatch):
+    def failing_load(file_path):
+        raise OSError("unreadable")
+
+    monkeypatch.setattr(storage, "_load_well_file_sync", failing_load)
+    well_id = storage.list_wells_in_project(project)[0]
+    assert storage.load_well_data(project, well_id) is None
+    assert not INFLIGHT_LOADS
+
+    monkeypatch.undo()
+    assert storage.load_well_data(project, well_id) is not None
@@ -0,0 +1,24 @@
+import dataclasses
+
+import pytest
+
+from utils.fe_data_objects import Constant, Dataset, LazyWellLog, Well, WellLog
+from utils.synthetic_wells import generate_synthetic_well
+
+
+@pytest.mark.parametrize("cls", [Constant, Dataset, Well, WellLog, LazyWellLog])
+def test_domain_objects_have_no_instance_dict(cls):
+    assert "__slots__" in vars(cls)
+    assert "__dict__" not in vars(cls)
+
+
+def test_constants_are_immutable():
+    constant = Constant("KB", 21.5, "m")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        constant.value = 0.0
+
+
+def test_dataset_to_dict_serializes_constants():
+    data = generate_synthetic_well("W1", n_samples=5, n_logs=1, seed=1)
+    dataset = Well.from_dict(data).datasets[0]
+    assert dataset.to_dict()["constants"] == data["datasets"][0]["constants"]
@@ -0,0 +1,70 @@
+import json
+import os
+
+from utils.well_file_index import file_fingerprint, read_fingerprint
+
+
+def _well_path(project, well_id):
+    return os.path.join(project, "10-WELLS", f"{well_id}.ptrc")
+
+
+def _bump_mtime(file_path):
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_cached_well_is_reloaded_after_an_external_edit(storage, project):
+    well_id = storage.list_wells_in_project(project)[0]
+    file_path = _well_path(project, well_id)
+    storage.load_well_data(project, well_id)
+
+    with open(file_path) as f:
+        well = json.load(f)
+    well["datasets"][0]["well_logs"][0]["log"][0] = -1.0
+    with open(file_path, "w") as f:
+        json.dump(well, f)
+    _bump_mtime(file_path)
+
+    data = storage.load_well_data(project, well_id)
+    assert data["datasets"][0]["well_logs"][0]["log"][0] == -1.0
+    assert storage.stale_reloads == 1
+
+
+def test_touched_file_with_the_same_content_is_not_reloaded(storage, project):
+    well_id = storage.list_wells_in_project(project)[0]
+    file_path = _well_path(project, well_id)
+    first = storage.load_well_data(project, well_id)
+    _bump_mtime(file_path)
+
+    assert storage.load_well_data(project, well_id) is first
+    assert storage.stale_reloads == 0
+
+
+def test_deleted_file_is_dropped_from_the_cache(storage, project):
+    well_id = storage.list_wells_in_project(project)[0]
+    storage.load_well_data(project, well_id)
+    os.remove(_well_path(project, well_id))
+
+    assert storage.get_cached_well_data(project, well_id) is None
+    assert storage.get_file_key(project, well_id) not in storage.cache
+
+
+def test_load_fingerprint_hashes_the_bytes_read(storage, project, monkeypatch):
+    import utils.well_file_index as well_file_index
+    monkeypatch.setattr(well_file_index, "file_hash", lambda *args: (_ for _ in ()).throw(AssertionError("re-read")))
+    file_path = _well_path(project, storage.list_wells_in_project(project)[0])
+
+    _, fingerprint = storage._load_well_file_sync(file_path)
+    monkeypatch.undo()
+    assert fingerprint == file_fingerprint(file_path, with_hash=True)
+
+
+def test_read_fingerprint_skips_the_hash_when_the_file_changed(tmp_path):
+    file_path = str(tmp_path / "well.ptrc")
+    with open(file_path, "wb") as f:
+        f.write(b"x" * 1000)
+    before = file_fingerprint(file_path)
+    with open(file_path, "ab") as f:
+        f.write(b"y")
+
+    assert read_fingerprint(file_path, before, b"x" * 1000) == before
@@ -0,0 +1,48 @@
+import numpy as np
+
+from utils.well_cache import WellCache, estimate_size
+
+
+def _cache(max_bytes=300):
+    return WellCache(max_bytes=max_bytes, active_fraction=0.5, rss_limit_bytes=0)
+
+
+def _put(cache, key, project="P", size=100):
+    return cache.put(key, {"data": {}, "project": project, "source": "lazy"}, size=size)
+
+
+def test_probation_entries_are_evicted_before_reused_ones():
+    cache = _cache()
+    for key in ("a", "b", "c"):
+        _put(cache, key)
+    assert cache.lookup("a") is not None
+
+    assert _put(cache, "d") == ["b"]
+    assert sorted(cache.keys()) == ["a", "c", "d"]
+    assert cache.total_bytes == 300 and cache.evictions == 1
+
+
+def test_active_project_entries_survive_scans_of_other_projects():
+    cache = _cache(max_bytes=400)
+    cache.set_active_project("ACTIVE")
+    _put(cache, "active-1", project="ACTIVE")
+    _put(cache, "active-2", project="ACTIVE")
+    for i in range(10):
+        _put(cache, f"other-{i}", project="OTHER")
+
+    assert "active-1" in cache and "active-2" in cache
+    assert cache.total_bytes <= 400
+
+
+def test_switching_the_active_project_demotes_its_entries():
+    cache = _cache(max_bytes=400)
+    cache.set_active_project("A")
+    _put(cache, "a-1", project="A")
+    _put(cache, "b-1", project="B")
+    cache.set_active_project("B")
+    assert cache.stats()["segments"]["active"]["entries"] == 1
+
+
+def test_estimate_size_counts_array_buffers():
+    values = np.zeros(1000)
+    assert estimate_size({"log": values}) >= values.nbytes
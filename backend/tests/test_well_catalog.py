@@ -0,0 +1,72 @@
+import asyncio
+import json
+import os
+
+from fastapi import Response
+
+from conftest import make_request
+from models import WellListResponse
+from utils.cli_service import ListAllWellsCommand, ListOfDatasetCommand
+from utils.well_file_index import summarize_well
+
+
+def test_catalog_summaries_are_rebuilt_once_per_change(storage, project):
+    catalog = storage.catalog
+    wells = catalog.wells(project)
+    assert [well["id"] for well in wells] == ["SYN-0000", "SYN-0001", "SYN-0002"]
+    assert catalog.rebuilt == 3
+
+    catalog.wells(project)
+    assert catalog.rebuilt == 3
+
+    file_path = wells[0]["path"]
+    with open(file_path) as f:
+        well = json.load(f)
+    well["datasets"].pop()
+    with open(file_path, "w") as f:
+        json.dump(well, f)
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert len(catalog.well(project, "SYN-0000")["datasets"]) == 1
+    assert catalog.rebuilt == 4
+
+
+def test_summary_counts_nulls_and_log_depth_ranges():
+    well = {"well_name": "W1", "well_type": "Dev", "date_created": "", "datasets": [{
+        "name": "WIRE", "type": "Cont", "index_name": "DEPTH", "constants": [],
+        "index_log": [100.0, 101.0, 102.0, 103.0],
+        "well_logs": [{"name": "GR", "log_type": "float", "log": [None, 1.0, 2.0, None]},
+                      {"name": "ZONE", "log_type": "str", "log": ["A", "A", "B", None]}],
+    }]}
+
+    dataset = summarize_well(well)["datasets"][0]
+    assert (dataset["samples"], dataset["top"], dataset["bottom"], dataset["logs"]) == (4, 100.0, 103.0, 2)
+    gr, zone = dataset["well_logs"]
+    assert (gr["nulls"], gr["top"], gr["bottom"]) == (2, 101.0, 102.0)
+    assert (zone["nulls"], zone["top"], zone["bottom"]) == (1, 100.0, 102.0)
+
+
+def test_find_dataset(storage, project):
+    matches = storage.catalog.find_dataset(project, "TOPS")
+    assert len(matches) == 3 and matches[0]["dataset"]["name"] == "TOPS"
+
+
+def test_unreadable_wells_are_listed_with_their_error(wells_router, storage, project):
+    storage.catalog.wells(project)
+    with open(os.path.join(project, "10-WELLS", "SYN-0001.ptrc"), "w") as f:
+        f.write("{not json")
+
+    broken = storage.catalog.well(project, "SYN-0001")
+    assert broken["error"] and broken["datasets"] == []
+    assert [match["well"]["id"] for match in storage.catalog.find_dataset(project, "TOPS")] == ["SYN-0000", "SYN-0002"]
+
+    success, message, data = ListAllWellsCommand().execute({}, {"project_path": project})
+    assert success and data["count"] == 3 and "SYN-0001 (error loading)" in message
+    assert data["wells"][1]["datasets"] == "error" and data["wells"][1]["error"] == broken["error"]
+
+    success, message, _ = ListOfDatasetCommand().execute({"well_name": "SYN-0001"}, {"project_path": project})
+    assert not success and "Error reading well 'SYN-0001'" in message
+
+    listed = WellListResponse.model_validate(asyncio.run(wells_router.list_wells(make_request(), Response(), project)))
+    assert [well.error is not None for well in listed.wells] == [False, True, False]
@@ -0,0 +1,47 @@
+import asyncio
+import copy
+import os
+
+from conftest import make_request, response_json
+from models import WellChangesResponse
+from utils.ptrc_file_io import write_well_file
+
+
+def _changes(wells_router, project, since, well_name=None):
+    response = asyncio.run(wells_router.get_well_changes(make_request(), project, since=since, wellName=well_name,
+                                                         encoding="plain"))
+    return WellChangesResponse.model_validate(response_json(response))
+
+
+def test_since_zero_returns_every_well_in_full(wells_router, project):
+    changes = _changes(wells_router, project, 0)
+    assert changes.full and [well.wellName for well in changes.wells] == ["SYN-0000", "SYN-0001", "SYN-0002"]
+    assert {dataset.name for dataset in changes.wells[0].datasets} == {"WIRE", "TOPS"}
+
+    assert _changes(wells_router, project, changes.revision).wells == []
+
+
+def test_changes_carry_only_changed_logs_and_removals(wells_router, storage, project):
+    since = _changes(wells_router, project, 0).revision
+
+    well = copy.deepcopy(storage.load_well_data(project, "SYN-0000"))
+    wire = next(dataset for dataset in well["datasets"] if dataset["name"] == "WIRE")
+    wire["well_logs"] = [log for log in wire["well_logs"] if log["name"] != "LOG02"]
+    wire["well_logs"][0]["log"][0] = 42.0
+    well["datasets"] = [wire]
+    well_path = os.path.join(project, "10-WELLS", "SYN-0000.ptrc")
+    write_well_file(well_path, well)
+    storage.update_cached_well(project, "SYN-0000", well, well_path)
+    assert storage.delete_well(project, "SYN-0002")
+
+    changes = _changes(wells_router, project, since)
+    assert not changes.full and changes.revision > since
+    edited, deleted = changes.wells
+    assert edited.wellName == "SYN-0000" and edited.revision > since
+    assert edited.removedDatasets == ["TOPS"]
+    (dataset,) = edited.datasets
+    assert [log.name for log in dataset.well_logs] == ["LOG00"] and dataset.removedLogs == ["LOG02"]
+    assert dataset.well_logs[0].log[0] == 42.0
+    assert deleted.wellName == "SYN-0002" and deleted.deleted
+
+    assert _changes(wells_router, project, since, "SYN-0001").wells == []
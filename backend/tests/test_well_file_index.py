@@ -0,0 +1,33 @@
+import os
+import shutil
+
+from utils.ptrc_file_io import write_well_file
+from utils.synthetic_wells import generate_synthetic_well
+from utils.well_file_index import WellFileIndex
+
+
+def _touch_dir(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_only_changed_wells_folders_are_rescanned(tmp_path, project):
+    workspace = os.path.dirname(project)
+    index = WellFileIndex(str(tmp_path / "index.db"))
+    assert index.scan_workspace(workspace) == {"wells_dirs": 1, "rescanned": 1, "removed": 0, "files": 3}
+    assert index.scan_workspace(workspace)["rescanned"] == 0
+    index.close()
+
+    # The index persists: a new instance starts from the stored folder state
+    wells_dir = os.path.join(project, "10-WELLS")
+    write_well_file(os.path.join(wells_dir, "NEW.ptrc"), generate_synthetic_well("NEW", n_samples=5, n_logs=1))
+    _touch_dir(wells_dir)
+    index = WellFileIndex(str(tmp_path / "index.db"))
+    stats = index.scan_workspace(workspace)
+    assert stats["rescanned"] == 1 and stats["files"] == 4
+    assert "NEW" in [well for _, _, well in index.files()]
+
+    shutil.rmtree(project)
+    assert index.scan_workspace(workspace)["removed"] == 1 and index.files() == []
+    index.close()
+
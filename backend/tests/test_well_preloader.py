@@ -0,0 +1,52 @@
+import asyncio
+import threading
+
+from utils.well_preloader import COMPLETED, PRELOAD_THREAD, PreloadJob
+
+
+def test_wells_are_queued_in_priority_order(storage, project):
+    well_ids = ["SYN-0000", "SYN-0001", "SYN-0002", "SYN-0003"]
+    job = PreloadJob(storage, project, well_ids, ["SYN-0002", "SYN-0003", "UNKNOWN"], PRELOAD_THREAD, 1)
+    assert job.priority_wells == ["SYN-0002", "SYN-0003"]
+
+    assert job._next() == "SYN-0002"
+    assert job.prioritize("SYN-0001")
+    assert not job.prioritize("SYN-0002")
+    assert [job._next() for _ in range(4)] == ["SYN-0001", "SYN-0003", "SYN-0000", None]
+
+
+def test_restarting_a_running_preload_loads_the_active_well_first(storage, project, monkeypatch):
+    loaded, started, release = [], threading.Event(), threading.Event()
+
+    def preload_well(project_path, well_id):
+        loaded.append(well_id)
+        started.set()
+        return release.wait(10)
+
+    monkeypatch.setattr(storage, "preload_well", preload_well)
+    job = storage.preloader.start(project, priority_wells=[], mode=PRELOAD_THREAD, workers=1)
+    assert started.wait(10)
+
+    assert storage.preloader.start(project, priority_wells=["SYN-0002", "SYN-0001"], mode=PRELOAD_THREAD) is job
+    release.set()
+    assert job.wait(10)
+    assert loaded == ["SYN-0000", "SYN-0002", "SYN-0001"]
+
+
+def test_preload_runs_in_the_background_and_reports_progress(storage, project):
+    job = storage.preloader.start(project, priority_wells=["SYN-0001"], mode=PRELOAD_THREAD, workers=2)
+    assert job.wait(10)
+
+    status = storage.preloader.status()
+    assert status["state"] == COMPLETED and status["progress"] == 1.0
+    assert status["loaded_wells"] == 3 and status["failed_wells"] == []
+    assert all(storage.get_file_key(project, well_id) in storage.cache
+               for well_id in storage.list_wells_in_project(project))
+
+
+def test_requested_wells_jump_the_preload_queue(wells_router, storage, project):
+    job = PreloadJob(storage, project, storage.list_wells_in_project(project), [], PRELOAD_THREAD, 1)
+    storage.preloader.job = job
+
+    asyncio.run(wells_router.fetch_well_data(project, "SYN-0002"))
+    assert job._next() == "SYN-0002"
@@ -22,7 +22,7 @@ class CrossPlotManager:
     def __init__(self):
         self.figure = None
     
-    def create_cross_plot(self, well_data, x_log_name, y_log_name):
+    def create_cross_plot(self, well_data, x_log_name, y_log_name, log_table=None):
         """
         Create a cross plot between two logs
         Uses the same data search pattern as LogPlot.py
@@ -31,6 +31,8 @@ class CrossPlotManager:
             well_data: Well object with datasets
             x_log_name: Name of X-axis log
             y_log_name: Name of Y-axis log
+            log_table: Optional depth-aligned DataFrame (Well.to_dataframe); when it holds
+                       both logs, samples are paired by depth instead of by position
             
         Returns:
             Base64 encoded PNG image
@@ -41,25 +43,30 @@ class CrossPlotManager:
         x_log_data = None
         y_log_data = None
         
-        print(f"[CrossPlot] Searching for X-log: {x_log_name}")
-        for dataset in well_data.datasets:
-            for well_log in dataset.well_logs:
-                if well_log.name == x_log_name:
-                    x_log_data = well_log.log
-                    print(f"[CrossPlot] Found X-log: {x_log_name} with {len(x_log_data)} points")
+        if log_table is not None and x_log_name in log_table.columns and y_log_name in log_table.columns:
+            x_log_data = log_table[x_log_name].to_numpy()
+            y_log_data = log_table[y_log_name].to_numpy()
+            print(f"[CrossPlot] Using depth-aligned table with {len(log_table)} depths")
+        else:
+            print(f"[CrossPlot] Searching for X-log: {x_log_name}")
+            for dataset in well_data.datasets:
+                for well_log in dataset.well_logs:
+                    if well_log.name == x_log_name:
+                        x_log_data = well_log.log
+                        print(f"[CrossPlot] Found X-log: {x_log_name} with {len(x_log_data)} points")
+                        break
+                if x_log_data is not None:
                     break
-            if x_log_data is not None:
-                break
-        
-        print(f"[CrossPlot] Searching for Y-log: {y_log_name}")
-        for dataset in well_data.datasets:
-            for well_log in dataset.well_logs:
-                if well_log.name == y_log_name:
-                    y_log_data = well_log.log
-                    print(f"[CrossPlot] Found Y-log: {y_log_name} with {len(y_log_data)} points")
+        
+            print(f"[CrossPlot] Searching for Y-log: {y_log_name}")
+            for dataset in well_data.datasets:
+                for well_log in dataset.well_logs:
+                    if well_log.name == y_log_name:
+                        y_log_data = well_log.log
+                        print(f"[CrossPlot] Found Y-log: {y_log_name} with {len(y_log_data)} points")
+                        break
+                if y_log_data is not None:
                     break
-            if y_log_data is not None:
-                break
         
         if x_log_data is None:
             print(f"[CrossPlot] Error: X-log '{x_log_name}' not found")
@@ -76,24 +83,22 @@ class CrossPlotManager:
             x_log_data = x_log_data[:min_len]
             y_log_data = y_log_data[:min_len]
         
-        # Filter out NaN and None values
-        valid_indices = []
-        for i in range(len(x_log_data)):
-            x_val = x_log_data[i]
-            y_val = y_log_data[i]
-            if (x_val is not None and y_val is not None and 
-                not np.isnan(x_val) and not np.isnan(y_val) and
-                np.isfinite(x_val) and np.isfinite(y_val)):
-                valid_indices.append(i)
-        
-        if not valid_indices:
+        if x_log_data.dtype.kind != 'f' or y_log_data.dtype.kind != 'f':
+            print("[CrossPlot] Error: Cross plots require numeric logs")
+            return None
+        
+        # Filter out NaN and infinite values (vectorized over the log arrays)
+        valid_mask = np.isfinite(x_log_data) & np.isfinite(y_log_data)
+        valid_count = int(np.count_nonzero(valid_mask))
+        
+        if not valid_count:
             print("[CrossPlot] Error: No valid data points found")
             return None
         
-        x_valid = [x_log_data[i] for i in valid_indices]
-        y_valid = [y_log_data[i] for i in valid_indices]
+        x_valid = x_log_data[valid_mask]
+        y_valid = y_log_data[valid_mask]
         
-        print(f"[CrossPlot] Valid data points: {len(valid_indices)} out of {len(x_log_data)}")
+        print(f"[CrossPlot] Valid data points: {valid_count} out of {len(x_log_data)}")
         
         # Create the figure
         fig = Figure(figsize=(8, 8))
@@ -110,7 +115,7 @@ class CrossPlotManager:
                 poly_func = np.poly1d(coeffs)
                 
                 # Create trend line
-                x_trend = np.linspace(min(x_valid), max(x_valid), 100)
+                x_trend = np.linspace(x_valid.min(), x_valid.max(), 100)
                 y_trend = poly_func(x_trend)
                 
                 ax.plot(x_trend, y_trend, 'r--', linewidth=2, alpha=0.8, 
@@ -118,8 +123,8 @@ class CrossPlotManager:
                 
                 # Calculate R-squared
                 y_pred = poly_func(x_valid)
-                ss_res = np.sum((np.array(y_valid) - y_pred) ** 2)
-                ss_tot = np.sum((np.array(y_valid) - np.mean(y_valid)) ** 2)
+                ss_res = np.sum((y_valid - y_pred) ** 2)
+                ss_tot = np.sum((y_valid - np.mean(y_valid)) ** 2)
                 r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
                 
                 print(f"[CrossPlot] Trend line: y = {coeffs[0]:.4f}x + {coeffs[1]:.4f}, R² = {r_squared:.4f}")
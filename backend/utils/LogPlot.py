@@ -23,6 +23,28 @@ class LogPlotManager:
         self.main_figure = None
         self.layout_config = None
     
+    @staticmethod
+    def _valid_samples(index_values, log_values):
+        """
+        Pair index and log samples and drop missing values
+        
+        Args:
+            index_values: Depth/index array of the dataset
+            log_values: Log sample array (float64 with NaN for missing)
+            
+        Returns:
+            Tuple of (index, values) arrays containing only valid samples
+        """
+        if log_values.dtype.kind != 'f':
+            # String logs have no numeric curve to draw
+            return np.empty(0), np.empty(0)
+        
+        n = min(len(index_values), len(log_values))
+        index_values = np.asarray(index_values[:n], dtype=np.float64)
+        log_values = log_values[:n]
+        mask = ~np.isnan(log_values)
+        return index_values[mask], log_values[mask]
+    
     def load_xml_layout(self, xml_path):
         """
         Load and parse XML layout configuration
@@ -113,7 +135,7 @@ class LogPlotManager:
                     'index': dataset.index_log,
                     'index_name': dataset.index_name or index_name
                 }
-                if shared_index is None and dataset.index_log:
+                if shared_index is None and len(dataset.index_log):
                     shared_index = dataset.index_log
         
         if shared_index is None:
@@ -171,17 +193,14 @@ class LogPlotManager:
                 
                 log_data = available_logs[curve_name]
                 log_values = log_data['log']
-                index_values = log_data['index'] or shared_index
+                index_values = log_data['index'] if len(log_data['index']) else shared_index
                 
                 # Filter valid data
-                valid_data = [(idx, val) for idx, val in zip(index_values, log_values)
-                             if val is not None and not np.isnan(val)]
+                valid_idx, valid_vals = self._valid_samples(index_values, log_values)
                 
-                if not valid_data:
+                if not len(valid_vals):
                     continue
                 
-                valid_idx, valid_vals = zip(*valid_data)
-                
                 # Convert line style
                 dash_style = 'solid'
                 if curve_config['linestyle'] == 'dashed':
@@ -238,8 +257,8 @@ class LogPlotManager:
                     prev_idx, prev_vals = previous_curve_data
                     
                     # Find common depth range
-                    min_depth = max(min(valid_idx), min(prev_idx))
-                    max_depth = min(max(valid_idx), max(prev_idx))
+                    min_depth = max(valid_idx.min(), prev_idx.min())
+                    max_depth = min(valid_idx.max(), prev_idx.max())
                     
                     # Create fill
                     x_combined = list(valid_vals) + list(reversed(prev_vals))
@@ -458,7 +477,7 @@ class LogPlotManager:
                             'index': dataset.index_log,
                             'index_name': dataset.index_name or index_name
                         })
-                        if shared_index is None and dataset.index_log:
+                        if shared_index is None and len(dataset.index_log):
                             shared_index = dataset.index_log
                         print(f"[LogPlot] Found {log_name} with {len(well_log.log)} points")
                         break
@@ -495,15 +514,12 @@ class LogPlotManager:
             
             # Get log values and index values
             log_values = track['log']
-            index_values = track['index'] or shared_index
+            index_values = track['index'] if len(track['index']) else shared_index
             
             # Filter valid data
-            valid_data = [(idx, val) for idx, val in zip(index_values, log_values) 
-                         if val is not None and not np.isnan(val)]
+            valid_idx, valid_vals = self._valid_samples(index_values, log_values)
             
-            if valid_data:
-                valid_idx, valid_vals = zip(*valid_data)
-                
+            if len(valid_vals):
                 # Add trace to subplot
                 # Note: In well logs, depth is on y-axis and log values on x-axis
                 fig.add_trace(
@@ -0,0 +1,114 @@
+"""
+Log payload benchmark: JSON vs binary responses of /api/wells/data.
+
+Builds the /wells/data response of one large synthetic well and encodes it:
+- json:     sanitize pass (NaN to None), response model validation and JSON encoding
+- stream:   streaming JSON encoder writing samples from NumPy arrays (see log_json)
+- float64:  binary payload with raw float64 column buffers (see log_payload)
+- float32:  binary payload with float32 column buffers
+
+and reports the encode time and the bytes on the wire of each. The streamed
+JSON is checked to be identical to the json body, and the binary payloads are
+decoded again to check that samples (and NaN) round-trip.
+
+Usage (from the backend directory):
+    python -m utils.benchmark_log_payload [--samples 50000] [--logs 40] [--repeat 3]
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, Any, Callable
+
+import numpy as np
+
+from models import WellDataResponse
+from routers.wells import dataset_payload, SAMPLES_ARRAY, SAMPLES_RAW
+from utils.fe_data_objects import Well
+from utils.log_json import iter_model_json
+from utils.log_payload import FLOAT64, FLOAT32, encode_binary_payload, decode_binary_payload
+from utils.synthetic_wells import generate_synthetic_well
+
+
+def _json_response(well: Well) -> bytes:
+    """What FastAPI does for the JSON response: build, validate, serialize."""
+    payload = {"success": True, "wellName": well.well_name,
+               "datasets": [dataset_payload(dataset) for dataset in well.datasets]}
+    content = WellDataResponse.model_validate(payload).model_dump(mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def _stream_response(well: Well) -> bytes:
+    payload = {"success": True, "wellName": well.well_name,
+               "datasets": [dataset_payload(dataset, samples=SAMPLES_ARRAY) for dataset in well.datasets]}
+    return b"".join(iter_model_json(WellDataResponse, payload))
+
+
+def _binary_response(well: Well, float_dtype: str) -> bytes:
+    payload = {"success": True, "wellName": well.well_name,
+               "datasets": [dataset_payload(dataset, samples=SAMPLES_RAW) for dataset in well.datasets]}
+    return encode_binary_payload(payload, float_dtype)
+
+
+def _time(encode: Callable[[], bytes], repeat: int) -> Dict[str, Any]:
+    """Best of repeat runs."""
+    best, body = float("inf"), b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = encode()
+        best = min(best, time.perf_counter() - start)
+    return {"ms": best * 1000, "bytes": len(body), "body": body}
+
+
+def _check_round_trip(well: Well, body: bytes, float_dtype: str):
+    """Samples of the decoded payload match the well (NaN positions included)."""
+    decoded = decode_binary_payload(body)
+    for dataset, decoded_dataset in zip(well.datasets, decoded["datasets"]):
+        for log, decoded_log in zip(dataset.well_logs, decoded_dataset["well_logs"]):
+            if log.is_categorical:
+                assert np.array_equal(decoded_log["codes"], log.values)
+            else:
+                expected = np.asarray(log.values, dtype=float_dtype)
+                assert np.array_equal(decoded_log["log"], expected, equal_nan=True), log.name
+
+
+def run_benchmark(n_samples: int = 50000, n_logs: int = 40, repeat: int = 3) -> Dict[str, Dict[str, Any]]:
+    """
+    Encode the response of one synthetic well in every format.
+
+    Returns:
+        {"json": {...}, "stream": {...}, "float64": {...}, "float32": {...}} with ms and bytes
+    """
+    well = Well.from_dict(generate_synthetic_well("BENCH-1", n_samples=n_samples, n_logs=n_logs))
+    results = {
+        "json": _time(lambda: _json_response(well), repeat),
+        "stream": _time(lambda: _stream_response(well), repeat),
+        "float64": _time(lambda: _binary_response(well, FLOAT64), repeat),
+        "float32": _time(lambda: _binary_response(well, FLOAT32), repeat)
+    }
+    assert results["stream"]["body"] == results["json"]["body"], "streamed JSON differs"
+    _check_round_trip(well, results["float64"]["body"], FLOAT64)
+    _check_round_trip(well, results["float32"]["body"], FLOAT32)
+    for result in results.values():
+        del result["body"]
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Log payload benchmark (JSON vs binary)")
+    parser.add_argument("--samples", type=int, default=50000)
+    parser.add_argument("--logs", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Synthetic well: {args.logs} logs x {args.samples} samples")
+    results = run_benchmark(args.samples, args.logs, args.repeat)
+
+    print(f"{'format':<12}{'encode ms':>12}{'MB':>10}")
+    for name, result in results.items():
+        print(f"{name:<12}{result['ms']:>12.1f}{result['bytes'] / 1024 / 1024:>10.2f}")
+
+    json_ms = results["json"]["ms"]
+    for name in ("stream", "float64", "float32"):
+        print(f"{name}: {json_ms / results[name]['ms']:.1f}x faster, "
+              f"{results['json']['bytes'] / results[name]['bytes']:.1f}x smaller than JSON")
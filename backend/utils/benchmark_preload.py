@@ -0,0 +1,81 @@
+"""
+Preload benchmark: thread pool vs worker processes.
+
+Generates a synthetic project and preloads it with FileWellStorageService in
+both modes, reporting wall time and throughput:
+- thread:  asyncio.to_thread per well, parsing holds the GIL
+- process: wells are parsed in worker processes and their columns handed back
+           through shared memory (see parallel_well_loader)
+
+Each mode starts from an empty cache and a fresh file index.
+
+Usage (from the backend directory):
+    python -m utils.benchmark_preload [--wells 200] [--samples 5000] [--logs 12] [--format json|v2] [--workers N]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Dict, Any, Optional
+
+from utils.file_well_storage import FileWellStorageService, PRELOAD_THREAD, PRELOAD_PROCESS, PRELOADED_PROJECTS, MB
+from utils.ptrc_file_io import FORMAT_JSON, FORMAT_V2
+from utils.synthetic_wells import generate_synthetic_project
+
+
+def _preload(workspace: str, project_path: str, mode: str, workers: int) -> Dict[str, Any]:
+    """Preload the project once with an empty cache and index, returning timing and cache size."""
+    service = FileWellStorageService(workspace, index_db_path=os.path.join(workspace, f"index-{mode}.db"))
+    service.cache.clear()
+    PRELOADED_PROJECTS.clear()
+    try:
+        start = time.perf_counter()
+        stats = asyncio.run(service.preload_project(project_path, max_concurrent=workers, mode=mode))
+        seconds = time.perf_counter() - start
+        return {
+            "seconds": seconds,
+            "wells": stats["loaded_wells"],
+            "wells_per_second": stats["loaded_wells"] / seconds if seconds else 0.0,
+            "cache_mb": service.cache.total_bytes / MB
+        }
+    finally:
+        service.cache.clear()
+        PRELOADED_PROJECTS.clear()
+        service.index.close()
+
+
+def run_benchmark(n_wells: int = 200, n_samples: int = 5000, n_logs: int = 12, fmt: str = FORMAT_JSON,
+                  workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the benchmark on a temporary synthetic project.
+
+    Returns:
+        {"thread": {...}, "process": {...}} with seconds, wells, wells_per_second and cache_mb
+    """
+    workers = workers or os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as workspace:
+        project_path = os.path.join(workspace, "SYNTHETIC")
+        generate_synthetic_project(project_path, n_wells=n_wells, fmt=fmt, n_samples=n_samples, n_logs=n_logs)
+        return {mode: _preload(workspace, project_path, mode, workers) for mode in (PRELOAD_THREAD, PRELOAD_PROCESS)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Preload benchmark (thread vs process)")
+    parser.add_argument("--wells", type=int, default=200)
+    parser.add_argument("--samples", type=int, default=5000)
+    parser.add_argument("--logs", type=int, default=12)
+    parser.add_argument("--format", choices=[FORMAT_JSON, FORMAT_V2], default=FORMAT_JSON)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    print(f"Synthetic project: {args.wells} wells x {args.logs} logs x {args.samples} samples ({args.format})")
+    results = run_benchmark(args.wells, args.samples, args.logs, args.format, args.workers)
+
+    print(f"{'mode':<12}{'seconds':>12}{'wells/s':>12}{'cache MB':>12}")
+    for mode, result in results.items():
+        print(f"{mode:<12}{result['seconds']:>12.2f}{result['wells_per_second']:>12.1f}{result['cache_mb']:>12.1f}")
+
+    speedup = results[PRELOAD_THREAD]["seconds"] / results[PRELOAD_PROCESS]["seconds"]
+    print(f"Process speedup: {speedup:.2f}x")
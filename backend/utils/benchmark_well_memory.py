@@ -0,0 +1,80 @@
+"""
+Memory benchmark for well representations.
+
+Generates a synthetic project, loads every well twice and reports the resident
+cost per well:
+- dict:    legacy representation, the parsed JSON dictionaries and lists of floats
+- objects: Well.from_dict(), slotted domain objects with NumPy-backed samples
+
+Bytes are measured with tracemalloc, objects as the number of live allocations
+that remain after loading.
+
+Usage (from the backend directory):
+    python -m utils.benchmark_well_memory [--wells 50] [--samples 5000] [--logs 12] [--format json|v2]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import tracemalloc
+from typing import Callable, Dict, Any, List
+
+from utils.fe_data_objects import Well
+from utils.ptrc_file_io import read_well_file, FORMAT_JSON, FORMAT_V2
+from utils.synthetic_wells import generate_synthetic_project
+
+
+def _measure(paths: List[str], loader: Callable[[str], Any]) -> Dict[str, float]:
+    """Load all wells with loader and return bytes/objects retained per well."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    wells = [loader(path) for path in paths]
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    count = sum(stat.count_diff for stat in stats)
+    del wells
+    return {
+        "bytes_per_well": size / len(paths),
+        "objects_per_well": count / len(paths)
+    }
+
+
+def run_benchmark(n_wells: int = 50, n_samples: int = 5000, n_logs: int = 12, fmt: str = FORMAT_JSON) -> Dict[str, Dict[str, float]]:
+    """
+    Run the benchmark on a temporary synthetic project.
+
+    Returns:
+        {"dict": {...}, "objects": {...}} with bytes_per_well and objects_per_well
+    """
+    with tempfile.TemporaryDirectory() as project_path:
+        paths = generate_synthetic_project(project_path, n_wells=n_wells, fmt=fmt,
+                                           n_samples=n_samples, n_logs=n_logs)
+        return {
+            "dict": _measure(paths, read_well_file),
+            "objects": _measure(paths, lambda path: Well.from_dict(read_well_file(path, arrays=True)))
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Well memory benchmark")
+    parser.add_argument("--wells", type=int, default=50)
+    parser.add_argument("--samples", type=int, default=5000)
+    parser.add_argument("--logs", type=int, default=12)
+    parser.add_argument("--format", choices=[FORMAT_JSON, FORMAT_V2], default=FORMAT_JSON)
+    args = parser.parse_args()
+
+    print(f"Synthetic project: {args.wells} wells x {args.logs} logs x {args.samples} samples ({args.format})")
+    results = run_benchmark(args.wells, args.samples, args.logs, args.format)
+
+    print(f"{'representation':<16}{'bytes/well':>16}{'objects/well':>16}")
+    for name, result in results.items():
+        print(f"{name:<16}{result['bytes_per_well']:>16,.0f}{result['objects_per_well']:>16,.0f}")
+
+    saving = 1 - results["objects"]["bytes_per_well"] / results["dict"]["bytes_per_well"]
+    print(f"Memory saving: {saving:.1%}")
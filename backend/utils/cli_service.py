@@ -13,6 +13,11 @@ import pandas as pd
 
 from utils.fe_data_objects import Well, Dataset, WellLog, Constant
 from utils.las_file_io import read_las_file, get_well_name_from_las
+from utils.ptrc_file_io import convert_project_wells, FORMAT_V2, FORMAT_JSON
+from utils.well_catalog import get_well_catalog
+from utils.log_resampling import resample_project
+from utils.reservoir_summary import (compute_project_ressum, ressum_table, export_ressum,
+                                     DEFAULT_PHI_CUTOFF, DEFAULT_SW_CUTOFF, DEFAULT_VSH_CUTOFF)
 from utils.data_import_export import (create_well_from_las,
                                       ImportLasFileCommand,
                                       ImportLasFilesFromFolderCommand,
@@ -413,30 +418,25 @@ class ListAllWellsCommand(CLICommand):
             return False, "Wells directory not found", None
 
         try:
-            well_files = [
-                f for f in os.listdir(wells_dir) if f.endswith('.ptrc')
-            ]
-            well_names = [f.replace('.ptrc', '') for f in well_files]
+            # Dataset counts come from the summary catalog, no well is loaded
+            summaries = get_well_catalog().wells(project_path)
+            well_names = [summary['id'] for summary in summaries]
 
             if not well_names:
                 return True, "No wells found in project", {'wells': []}
 
             wells_info = []
-            for well_name in sorted(well_names):
-                well_path = os.path.join(wells_dir, f'{well_name}.ptrc')
-                try:
-                    well = Well.deserialize(well_path)
-                    dataset_count = len(well.datasets) if hasattr(
-                        well, 'datasets') else 0
+            for summary in summaries:
+                if summary.get('error'):
                     wells_info.append({
-                        'name': well_name,
-                        'datasets': dataset_count
+                        'name': summary['id'],
+                        'datasets': 'error',
+                        'error': summary['error']
                     })
-                except Exception as e:
+                else:
                     wells_info.append({
-                        'name': well_name,
-                        'datasets': 'error',
-                        'error': str(e)
+                        'name': summary['id'],
+                        'datasets': len(summary['datasets'])
                     })
 
             message_parts = [f"Found {len(well_names)} well(s) in project:"]
@@ -475,35 +475,24 @@ class ListOfDatasetCommand(CLICommand):
         if not project_path:
             return False, "No project loaded", None
 
-        well_path = os.path.join(project_path, '10-WELLS', f'{well_name}.ptrc')
-
-        if not os.path.exists(well_path):
-            return False, f"Well '{well_name}' not found", None
-
         try:
-            well = Well.deserialize(well_path)
+            summary = get_well_catalog().well(project_path, well_name)
+            if summary is None:
+                return False, f"Well '{well_name}' not found", None
+            if summary.get('error'):
+                return False, f"Error reading well '{well_name}': {summary['error']}", None
 
-            if not well.datasets:
+            if not summary['datasets']:
                 return True, f"Well '{well_name}' has no datasets", {
                     'datasets': []
                 }
 
-            datasets_info = []
-            for dataset in well.datasets:
-                log_count = len(dataset.well_logs) if hasattr(
-                    dataset, 'well_logs') else 0
-                const_count = len(dataset.constants) if hasattr(
-                    dataset, 'constants') else 0
-                datasets_info.append({
-                    'name':
-                    dataset.name,
-                    'type':
-                    dataset.type if hasattr(dataset, 'type') else 'unknown',
-                    'logs':
-                    log_count,
-                    'constants':
-                    const_count
-                })
+            datasets_info = [{
+                'name': dataset['name'],
+                'type': dataset.get('type') or 'unknown',
+                'logs': dataset['logs'],
+                'constants': dataset['constants']
+            } for dataset in summary['datasets']]
 
             message_parts = [
                 f"Well '{well_name}' has {len(datasets_info)} dataset(s):"
@@ -547,28 +536,10 @@ class FindWithDatasetCommand(CLICommand):
             return False, "Wells directory not found", None
 
         try:
-            well_files = [
-                f for f in os.listdir(wells_dir) if f.endswith('.ptrc')
-            ]
-            matching_wells = []
-
-            for well_file in well_files:
-                well_name = well_file.replace('.ptrc', '')
-                well_path = os.path.join(wells_dir, well_file)
-
-                try:
-                    well = Well.deserialize(well_path)
-                    for dataset in well.datasets:
-                        if dataset.name == dataset_name:
-                            log_count = len(dataset.well_logs) if hasattr(
-                                dataset, 'well_logs') else 0
-                            matching_wells.append({
-                                'well_name': well_name,
-                                'logs': log_count
-                            })
-                            break
-                except Exception:
-                    continue
+            matching_wells = [{
+                'well_name': match['well']['id'],
+                'logs': match['dataset']['logs']
+            } for match in get_well_catalog().find_dataset(project_path, dataset_name)]
 
             if not matching_wells:
                 return True, f"No wells found with dataset '{dataset_name}'", {
@@ -1114,6 +1085,162 @@ class LoadMultipleDatasetsCommand(CLICommand):
             return False, f"Error loading datasets: {str(e)}", None
 
 
+class ConvertWellsFormatCommand(CLICommand):
+    """Rewrite all well files of the project in another .ptrc format."""
+
+    def __init__(self):
+        super().__init__(
+            "CONVERT_WELLS_FORMAT",
+            "Rewrite all .ptrc well files in place as binary v2 or legacy JSON. Usage: CONVERT_WELLS_FORMAT [v2|json]"
+        )
+
+    def execute(self, args: Dict[str, Any],
+                context: Dict[str, Any]) -> Tuple[bool, str, Any]:
+        fmt = args.get('format', FORMAT_V2).lower()
+
+        if fmt not in (FORMAT_V2, FORMAT_JSON):
+            return False, f"Unknown format '{fmt}'. Use 'v2' or 'json'", None
+
+        project_path = context.get('project_path')
+        if not project_path:
+            return False, "No project loaded", None
+
+        try:
+            stats = convert_project_wells(project_path, fmt)
+
+            message_parts = [
+                f"✓ Converted {len(stats['converted'])} well(s) to '{fmt}' format ({len(stats['skipped'])} already converted)"
+            ]
+            for failure in stats['failed']:
+                message_parts.append(f"  - {failure['well']}: {failure['error']}")
+
+            return not stats['failed'], "\n".join(message_parts), stats
+        except Exception as e:
+            return False, f"Error converting wells: {str(e)}", None
+
+
+class ResampleDatasetCommand(CLICommand):
+    """Resample a dataset in every well of the project."""
+
+    def __init__(self):
+        super().__init__(
+            "RESAMPLE_DATASET",
+            "Resample a dataset in all wells onto a regular step or onto another dataset's depths "
+            "(CONTINUOUS: linear, TOP: hold, POINT: nearest within tolerance). "
+            "Usage: RESAMPLE_DATASET dataset_name step|reference_dataset [output_name] [tolerance]"
+        )
+
+    def execute(self, args: Dict[str, Any],
+                context: Dict[str, Any]) -> Tuple[bool, str, Any]:
+        dataset_name = args.get('dataset_name')
+        target = args.get('target')
+
+        if not all([dataset_name, target]):
+            return False, "Missing required arguments: dataset_name, step|reference_dataset", None
+
+        project_path = context.get('project_path')
+        if not project_path:
+            return False, "No project loaded", None
+
+        # A number is a regular step, anything else names the reference dataset
+        try:
+            step, reference_dataset = float(target), None
+            if step <= 0:
+                return False, "Resampling step must be positive", None
+        except ValueError:
+            step, reference_dataset = None, target
+
+        tolerance = args.get('tolerance')
+        if tolerance is not None:
+            try:
+                tolerance = float(tolerance)
+            except ValueError:
+                return False, f"Invalid tolerance: {tolerance}", None
+
+        try:
+            stats = resample_project(project_path, dataset_name, step=step,
+                                     reference_dataset=reference_dataset,
+                                     output_name=args.get('output_name'),
+                                     tolerance=tolerance)
+
+            target_desc = f"step {step}" if step is not None else f"'{reference_dataset}' depths"
+            message_parts = [
+                f"✓ Resampled '{dataset_name}' onto {target_desc} as '{stats['output']}' in {len(stats['resampled'])} well(s) ({len(stats['skipped'])} skipped)"
+            ]
+            for failure in stats['failed']:
+                message_parts.append(f"  - {failure['well']}: {failure['error']}")
+
+            return not stats['failed'], "\n".join(message_parts), stats
+        except Exception as e:
+            return False, f"Error resampling dataset: {str(e)}", None
+
+
+class ReservoirSummaryCommand(CLICommand):
+    """Compute reservoir summaries (RESSUM) for every zone of every well in the project."""
+
+    def __init__(self):
+        super().__init__(
+            "RESSUM",
+            "Compute net pay reservoir summaries per zone for all wells (zones from the TOPS dataset). "
+            "Usage: RESSUM dataset_name phi_log sw_log vsh_log [phi_cutoff sw_cutoff vsh_cutoff] [output_csv_path]"
+        )
+
+    def execute(self, args: Dict[str, Any],
+                context: Dict[str, Any]) -> Tuple[bool, str, Any]:
+        dataset_name = args.get('dataset_name')
+        phi_log = args.get('phi_log')
+        sw_log = args.get('sw_log')
+        vsh_log = args.get('vsh_log')
+
+        if not all([dataset_name, phi_log, sw_log, vsh_log]):
+            return False, "Missing required arguments: dataset_name, phi_log, sw_log, vsh_log", None
+
+        project_path = context.get('project_path')
+        if not project_path:
+            return False, "No project loaded", None
+
+        try:
+            cutoffs = {
+                'phi_cutoff': float(args.get('phi_cutoff') or DEFAULT_PHI_CUTOFF),
+                'sw_cutoff': float(args.get('sw_cutoff') or DEFAULT_SW_CUTOFF),
+                'vsh_cutoff': float(args.get('vsh_cutoff') or DEFAULT_VSH_CUTOFF)
+            }
+        except ValueError:
+            return False, "Cutoffs must be numbers", None
+
+        output_csv_path = args.get('output_csv_path')
+        file_abs_path = None
+        if output_csv_path:
+            file_abs_path = os.path.realpath(os.path.join(project_path, output_csv_path))
+            if not file_abs_path.startswith(os.path.realpath(project_path) + os.sep):
+                return False, "Access denied: file path outside project directory", None
+
+        try:
+            stats = compute_project_ressum(project_path, dataset_name, phi_log, sw_log, vsh_log, **cutoffs)
+            table = ressum_table(stats['rows'])
+
+            message_parts = [
+                f"✓ Computed {len(table)} zone summaries for {len(stats['computed'])} well(s) ({len(stats['skipped'])} skipped)"
+            ]
+            if file_abs_path:
+                os.makedirs(os.path.dirname(file_abs_path), exist_ok=True)
+                export_ressum(stats['rows'], file_abs_path)
+                message_parts.append(f"  Exported to {output_csv_path}")
+            for failure in stats['failed']:
+                message_parts.append(f"  - {failure['well']}: {failure['error']}")
+
+            return not stats['failed'], "\n".join(message_parts), {
+                'columns': table.columns.tolist(),
+                'rows': table.astype(object).where(table.notna(), None).values.tolist(),
+                'computed': stats['computed'],
+                'skipped': stats['skipped'],
+                'failed': stats['failed'],
+                'output_csv_path': output_csv_path
+            }
+        except Exception as e:
+            return False, f"Error computing RESSUM: {str(e)}", None
+
+
 class CLIService:
     """Service for executing CLI commands."""
 
@@ -1146,6 +1273,9 @@ class CLIService:
             DBWellInfoCommand(),
             DBStatsCommand(),
             LoadMultipleDatasetsCommand(),
+            ConvertWellsFormatCommand(),
+            ResampleDatasetCommand(),
+            ReservoirSummaryCommand(),
         ]
 
         for cmd in commands:
@@ -1304,6 +1434,33 @@ class CLIService:
             if len(parts) >= 3:
                 args = {'well_name': parts[1], 'folder_path': parts[2]}
 
+        elif cmd_name == "CONVERT_WELLS_FORMAT":
+            args = {'format': parts[1]} if len(parts) >= 2 else {}
+
+        elif cmd_name == "RESSUM":
+            if len(parts) >= 5:
+                args = {
+                    'dataset_name': parts[1],
+                    'phi_log': parts[2],
+                    'sw_log': parts[3],
+                    'vsh_log': parts[4]
+                }
+                if len(parts) >= 8:
+                    args.update({'phi_cutoff': parts[5], 'sw_cutoff': parts[6], 'vsh_cutoff': parts[7]})
+                    if len(parts) > 8:
+                        args['output_csv_path'] = parts[8]
+                elif len(parts) > 5:
+                    args['output_csv_path'] = parts[5]
+
+        elif cmd_name == "RESAMPLE_DATASET":
+            if len(parts) >= 3:
+                args = {
+                    'dataset_name': parts[1],
+                    'target': parts[2],
+                    'output_name': parts[3] if len(parts) > 3 else None,
+                    'tolerance': parts[4] if len(parts) > 4 else None
+                }
+
         return cmd_name, args
 
     def _split_command(self, command_str: str) -> List[str]:
@@ -12,6 +12,8 @@ import os
 from typing import Dict, List, Optional, Tuple
 import xml.etree.ElementTree as ET
 
+from utils.fe_data_objects import run_length_segments
+
 
 class CPIPlotlyManager:
     """
@@ -84,6 +86,7 @@ class CPIPlotlyManager:
                         'plot': curve_elem.get('plot', 'line'),
                         'zone_label_spacing': int(curve_elem.get('zone_label_spacing') or 15),
                         'decimals': int(curve_elem.get('decimals') or 2),
+                        'major_grid': float(curve_elem.get('major_grid')) if curve_elem.get('major_grid') is not None else None,
                     }
                     track['curves'].append(curve)
                 
@@ -563,6 +566,51 @@ class CPIPlotlyManager:
                 row=1,
                 col=col_idx
             )
+            return
+        
+        # Secondary scale (e.g. TVDSS): label the depths where the scale curve
+        # crosses each major grid value
+        for curve_info in track_data.get('curves', []):
+            curve_name = curve_info['name']
+            if curve_name not in df_logs.columns:
+                print(f'[CPI Plotly] Warning: Scale curve {curve_name} not found in data')
+                continue
+            
+            scale_values = pd.to_numeric(df_logs[curve_name], errors='coerce').to_numpy(dtype=float)
+            depths = df_logs[self.controlling_depth_log].to_numpy(dtype=float)
+            valid = np.isfinite(scale_values) & np.isfinite(depths)
+            if np.count_nonzero(valid) < 2:
+                continue
+            scale_values = scale_values[valid]
+            depths = depths[valid]
+            order = np.argsort(scale_values, kind='stable')
+            
+            major = curve_info.get('major_grid') or global_props.get('major_y_tick', 25)
+            first = np.ceil(scale_values[order[0]] / major) * major
+            ticks = np.arange(first, scale_values[order[-1]] + major / 2, major) + 0.0  # no '-0' labels
+            tick_depths = np.interp(ticks, scale_values[order], depths[order])
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=np.full(len(ticks), 0.5),
+                    y=tick_depths,
+                    mode='text',
+                    text=[f'{tick:g}' for tick in ticks],
+                    textfont=dict(size=global_props.get('curve_names_font_size', 8)),
+                    showlegend=False,
+                    hovertemplate=f'{curve_name}: %{{text}}<br>Depth: %{{y:.2f}} m<extra></extra>'
+                ),
+                row=1,
+                col=col_idx
+            )
+        
+        fig.update_xaxes(
+            range=[0, 1],
+            showticklabels=False,
+            showgrid=False,
+            row=1,
+            col=col_idx
+        )
     
     def _plot_tops_track(
         self,
@@ -581,11 +629,21 @@ class CPIPlotlyManager:
         tops_in_range = df_tops[
             (df_tops['depth'] >= depth_min) & 
             (df_tops['depth'] <= depth_max)
-        ]
-        
-        for _, top_row in tops_in_range.iterrows():
-            depth = top_row['depth']
-            top_name = top_row.get('top_name', top_row.get('TOP', 'Unknown'))
+        ].sort_values('depth', kind='stable')
+        
+        # Consecutive rows with the same name (tops sampled per depth) collapse into one top
+        name_column = next((name for name in ('top_name', 'TOP') if name in tops_in_range.columns), None)
+        depths = tops_in_range['depth'].to_numpy(dtype=float)
+        if name_column is not None:
+            codes, categories = self._column_codes(tops_in_range[name_column])
+            starts, _, run_codes = run_length_segments(codes)
+            tops = [(depths[start], categories[code] if code >= 0 else 'Unknown')
+                    for start, code in zip(starts, run_codes)]
+        else:
+            tops = [(depth, 'Unknown') for depth in depths]
+        
+        for depth, top_name in tops:
+            depth = float(depth)
             
             # Add horizontal line
             fig.add_shape(
@@ -636,30 +694,38 @@ class CPIPlotlyManager:
             print('[CPI Plotly] Warning: FLUID column not found')
             return
         
-        fluid_data = df_logs['FLUID']
-        
         # Load color map if available
         color_map = self._load_fluid_color_map(spec_folder, global_props)
         
-        # Create colored segments
-        for fluid_val in fluid_data.dropna().unique():
-            mask = fluid_data == fluid_val
-            color = color_map.get(int(fluid_val), 'gray') if color_map else 'gray'
+        # Group run-length segments by fluid value
+        runs_by_fluid: Dict = {}
+        for top, bottom, fluid_val in self._column_segments(df_logs['FLUID'], depth_data):
+            runs_by_fluid.setdefault(fluid_val, []).append((top, bottom))
+        
+        # One filled trace per fluid value, each run drawn as a rectangle
+        for fluid_val, runs in runs_by_fluid.items():
+            try:
+                fluid_key = int(fluid_val)
+            except (TypeError, ValueError):
+                fluid_key = fluid_val
+            color = color_map.get(fluid_key, 'gray') if color_map else 'gray'
+            
+            x_values, y_values = [], []
+            for top, bottom in runs:
+                x_values += [0, 1, 1, 0, 0, None]
+                y_values += [top, top, bottom, bottom, top, None]
             
             fig.add_trace(
                 go.Scatter(
-                    x=[0.5] * len(depth_data[mask]),
-                    y=depth_data[mask],
-                    mode='markers',
-                    marker=dict(
-                        color=color,
-                        size=20,
-                        symbol='square',
-                        line=dict(width=0)
-                    ),
-                    name=f'Fluid {int(fluid_val)}',
+                    x=x_values,
+                    y=y_values,
+                    mode='lines',
+                    fill='toself',
+                    fillcolor=color,
+                    line=dict(width=0, color=color),
+                    name=f'Fluid {fluid_key}',
                     showlegend=False,
-                    hovertemplate=f'Fluid: {int(fluid_val)}<br>Depth: %{{y:.2f}} m<extra></extra>'
+                    hovertemplate=f'Fluid: {fluid_key}<br>Depth: %{{y:.2f}} m<extra></extra>'
                 ),
                 row=1,
                 col=col_idx
@@ -737,22 +803,29 @@ class CPIPlotlyManager:
         color = curves[0].get('color', 'black')
         decimals = curves[0].get('decimals', 2)
         
-        # Add text annotations at intervals
-        interval = max(1, len(text_data) // 50)  # Limit number of labels
-        
-        for i in range(0, len(text_data), interval):
-            if pd.notna(text_data.iloc[i]):
-                fig.add_annotation(
-                    x=0.5,
-                    y=depth_data.iloc[i],
-                    text=f'{text_data.iloc[i]:.{decimals}f}',
-                    showarrow=False,
-                    font=dict(size=8, color=color),
-                    xref=f'x{col_idx}' if col_idx > 1 else 'x',
-                    yref='y',
-                    xanchor='center',
-                    yanchor='middle'
-                )
+        if pd.api.types.is_numeric_dtype(text_data.dtype):
+            # Add text annotations at intervals
+            interval = max(1, len(text_data) // 50)  # Limit number of labels
+            labels = [(depth_data.iloc[i], f'{text_data.iloc[i]:.{decimals}f}')
+                      for i in range(0, len(text_data), interval) if pd.notna(text_data.iloc[i])]
+        else:
+            # String logs: one label per run of equal values, at the middle of the run
+            segments = self._column_segments(text_data, depth_data)
+            interval = max(1, len(segments) // 50)  # Limit number of labels
+            labels = [((top + bottom) / 2, str(value)) for top, bottom, value in segments[::interval]]
+        
+        for depth, label in labels:
+            fig.add_annotation(
+                x=0.5,
+                y=depth,
+                text=label,
+                showarrow=False,
+                font=dict(size=8, color=color),
+                xref=f'x{col_idx}' if col_idx > 1 else 'x',
+                yref='y',
+                xanchor='center',
+                yanchor='middle'
+            )
         
         fig.update_xaxes(
             range=[0, 1],
@@ -762,6 +835,28 @@ class CPIPlotlyManager:
             col=col_idx
         )
     
+    @staticmethod
+    def _column_codes(values: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+        """Integer codes (-1 for missing) and categories of a column, reusing Categorical codes."""
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            return values.cat.codes.to_numpy(), values.cat.categories
+        return pd.factorize(values)
+
+    def _column_segments(self, values: pd.Series, depth_data: pd.Series) -> List[Tuple[float, float, object]]:
+        """
+        Run-length segments of a column as (top, bottom, value) along depth_data.
+        A segment ends where the next one starts (the last one at the last depth);
+        runs of missing samples are dropped.
+        """
+        if not len(depth_data):
+            return []
+        codes, categories = self._column_codes(values.loc[depth_data.index])
+        depths = depth_data.to_numpy(dtype=float)
+        starts, stops, run_codes = run_length_segments(codes)
+        bottoms = depths[np.minimum(stops, len(depths) - 1)]
+        return [(float(depths[start]), float(bottom), categories[code])
+                for start, bottom, code in zip(starts.tolist(), bottoms, run_codes.tolist()) if code >= 0]
+    
     def _load_fluid_color_map(self, spec_folder: Optional[str], global_props: Dict) -> Optional[Dict]:
         """Load fluid color mapping from CSV file."""
         fluid_color_file_name = global_props.get('fluid_color_file_name')
@@ -0,0 +1,112 @@
+"""
+Depth-aligned merge engine for well datasets.
+
+Builds one union depth index for a set of datasets and places every log onto it
+with sorted-index arithmetic (np.unique + np.searchsorted), instead of chaining
+pandas outer joins. Depths are rounded to DEPTH_DECIMALS before matching so that
+indexes written by different tools line up despite float noise.
+
+Samples land only on the depths their own dataset defines; other rows are NaN.
+String logs become pandas Categorical columns built from their codes, so the
+zone/facies names are never expanded per sample. No interpolation is done here.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Depth matching precision (0.1 mm)
+DEPTH_DECIMALS = 4
+
+DEFAULT_INDEX_NAME = "DEPTH"
+
+
+def _rounded_index(dataset) -> np.ndarray:
+    index = np.asarray(dataset.index_log)
+    if index.dtype.kind != 'f':
+        index = index.astype(np.float64)
+    return np.round(index, DEPTH_DECIMALS)
+
+
+def union_depth_index(indexes: Iterable[np.ndarray]) -> np.ndarray:
+    """
+    Build the sorted union of several depth indexes (NaN depths are dropped).
+
+    Args:
+        indexes: Rounded float64 depth arrays
+
+    Returns:
+        Sorted float64 array of unique depths
+    """
+    finite = [index[np.isfinite(index)] for index in indexes]
+    if not finite:
+        return np.empty(0, dtype=np.float64)
+    return np.unique(np.concatenate(finite))
+
+
+def _unique_column_name(name: str, columns: Dict[str, np.ndarray]) -> str:
+    """Suffix duplicate log names with _dup, _dup2, ... (first occurrence keeps the name)."""
+    if name not in columns:
+        return name
+    candidate = f"{name}_dup"
+    counter = 2
+    while candidate in columns:
+        candidate = f"{name}_dup{counter}"
+        counter += 1
+    return candidate
+
+
+def merge_datasets(datasets: List, index_name: Optional[str] = None) -> pd.DataFrame:
+    """
+    Merge datasets onto one union depth index.
+
+    Each dataset is aligned in a single pass: the positions of its depths in the
+    union index are computed once with searchsorted and reused for every log.
+    Datasets without a depth index are skipped. Logs shorter than their index
+    are aligned on their available samples; duplicate depths keep the last sample.
+
+    Args:
+        datasets: Dataset objects (anything with index_log and well_logs)
+        index_name: Name of the resulting index (defaults to the first dataset's index name)
+
+    Returns:
+        pd.DataFrame indexed by depth with one column per log
+    """
+    indexed = []
+    for dataset in datasets:
+        if dataset is None or not len(dataset.index_log):
+            continue
+        indexed.append((dataset, _rounded_index(dataset)))
+
+    if index_name is None:
+        index_name = next((ds.index_name for ds, _ in indexed if ds.index_name), DEFAULT_INDEX_NAME)
+
+    union = union_depth_index(index for _, index in indexed)
+    n_rows = len(union)
+    columns: Dict[str, np.ndarray] = {}
+
+    for dataset, index in indexed:
+        rows = np.flatnonzero(np.isfinite(index))
+        positions = np.searchsorted(union, index[rows])
+
+        for well_log in dataset.well_logs:
+            values = well_log.values
+            # rows is ascending, so the samples present in a short log are a prefix
+            count = int(np.searchsorted(rows, len(values))) if len(values) < len(index) else len(rows)
+            source_rows = rows[:count]
+            target = positions[:count]
+
+            if well_log.categories is None:
+                column = np.full(n_rows, np.nan)
+                column[target] = values[source_rows]
+            else:
+                # String logs stay dictionary encoded: only the codes are aligned
+                codes = np.full(n_rows, -1, dtype=np.int32)
+                codes[target] = values[source_rows]
+                column = pd.Categorical.from_codes(codes, categories=pd.Index(well_log.categories, dtype=object))
+
+            columns[_unique_column_name(well_log.name, columns)] = column
+
+    return pd.DataFrame(columns, index=pd.Index(union, name=index_name))
@@ -6,7 +6,7 @@ import matplotlib.pyplot as plt
 import lasio
 from dataclasses import dataclass, field
 from scipy.interpolate import interp1d
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import logging
 import numpy as np
@@ -20,18 +20,25 @@ logging.basicConfig(level=logging.INFO)
 interpolation_type = Literal["POINT", "TOP", "CONTINUOUS"]
 # Define the custom type for value type
 value_type = Literal["str", "float"]
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Constant:
     name: str
     value: Union[float,str, datetime]
     tag: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'value': self.value,
+            'tag': self.tag
+        }
     
 @dataclass
 class Constants:
     constants: List[Constant]
     
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RESSUM:
     well: str
     interval: str
@@ -115,8 +122,12 @@ class LogFrame(pd.DataFrame):
         """Filter WellLog data by depth range."""
         if min_depth >= max_depth:
             raise ValueError("Minimum depth must be less than maximum depth.")
-        filtered_data = self[(self['DEPT'] >= min_depth) & (self['DEPT'] <= max_depth)]
-        return LogFrame(filtered_data)
+        window = self.depth_index().locate(min_depth, max_depth)
+        return LogFrame(self.iloc[window])
+
+    def depth_index(self) -> 'DepthIndex':
+        """Sorted depth index over the DEPT column."""
+        return DepthIndex(self['DEPT'].to_numpy(dtype=np.float64))
 
     def add_log(self, name: str, data: List[float]) -> None:
         """Add a new log to the WellLog."""
@@ -146,69 +157,296 @@ class LogFrame(pd.DataFrame):
         plt.grid(True)
         plt.show()
         
-@dataclass
+def _is_missing(value: Any) -> bool:
+    """True for samples that represent a missing value (None or NaN)."""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+# pandas type inference of object arrays (None skipped) that hold only numbers
+_NUMERIC_INFERRED_TYPES = {"floating", "integer", "mixed-integer-float", "boolean", "empty"}
+
+
+def encode_log_values(log: Any, log_type: value_type = 'float') -> Tuple[np.ndarray, Optional[List[str]]]:
+    """
+    Convert raw log samples into the array-backed storage used by WellLog.
+
+    Numeric logs become float64 arrays with NaN for missing samples. String logs
+    are dictionary encoded into int32 codes plus a category list, with -1 marking
+    a missing sample. Strings are never parsed as numbers: a log of numeric strings
+    is a string log, and strings mixed with numbers raise ValueError.
+
+    Returns:
+        Tuple of (values, categories). categories is None for numeric logs.
+    """
+    if log is None:
+        log = []
+
+    # Fast path: numeric arrays (LAS imports, DataFrame columns) need no per-sample checks
+    if isinstance(log, np.ndarray) and log.dtype.kind in 'fiub':
+        return np.asarray(log, dtype=np.float64), None
+
+    if log_type != 'str':
+        try:
+            array = np.asarray(log)
+        except ValueError:
+            # Ragged samples, rejected by the validating path below
+            array = None
+        if array is not None and array.ndim == 1:
+            if array.dtype.kind in 'fiub':
+                return array.astype(np.float64, copy=False), None
+            # Numbers with None (JSON null): converted without a per-sample loop
+            if array.dtype.kind == 'O' and pd.api.types.infer_dtype(array, skipna=True) in _NUMERIC_INFERRED_TYPES:
+                return array.astype(np.float64), None
+        # Strings (numeric-looking ones included) and mixed samples: validating path below
+
+    samples = log.tolist() if isinstance(log, np.ndarray) else list(log)
+    non_missing = [v for v in samples if not _is_missing(v)]
+
+    if all(isinstance(v, (int, float, np.integer, np.floating)) for v in non_missing):
+        if log_type == 'str' and not non_missing:
+            return np.full(len(samples), -1, dtype=np.int32), []
+        return np.array([np.nan if v is None else v for v in samples], dtype=np.float64), None
+
+    if not all(isinstance(v, str) for v in non_missing):
+        raise ValueError("All elements of 'values' must be of the same category: either all numeric (int/float) or all str.")
+
+    # Categories in order of first appearance, missing samples (None/NaN) get -1
+    codes, categories = pd.factorize(np.array(samples, dtype=object))
+    return codes.astype(np.int32, copy=False), list(categories)
+
+
+def run_length_segments(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Collapse an integer code array into runs of equal consecutive codes.
+
+    Returns:
+        Tuple of (starts, stops, codes): run i covers positions starts[i]:stops[i]
+    """
+    codes = np.asarray(codes)
+    if not len(codes):
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, codes[:0]
+    starts = np.concatenate(([0], np.flatnonzero(codes[1:] != codes[:-1]) + 1))
+    stops = np.append(starts[1:], len(codes))
+    return starts, stops, codes[starts]
+
+
+def columns_as_arrays(well: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace the numeric index and log sample lists of a well dictionary by float64
+    arrays (NaN for missing), in place. String logs and columns with mixed sample
+    types stay lists.
+    """
+    for dataset in well.get("datasets", []):
+        index_log = dataset.get("index_log")
+        if isinstance(index_log, list):
+            try:
+                values, categories = encode_log_values(index_log, "float")
+            except ValueError:
+                categories = ()
+            if categories is None:
+                dataset["index_log"] = values
+        for log in dataset.get("well_logs", []):
+            samples = log.get("log")
+            if not isinstance(samples, list) or log.get("log_type", "float") == "str":
+                continue
+            try:
+                values, categories = encode_log_values(samples, log.get("log_type", "float"))
+            except ValueError:
+                continue
+            if categories is None:
+                log["log"] = values
+    return well
+
+
+def log_array_to_list(values: np.ndarray) -> List[Any]:
+    """Convert a float64 log array to a JSON-ready list with None for NaN."""
+    result = values.tolist()
+    for i in np.flatnonzero(np.isnan(values)).tolist():
+        result[i] = None
+    return result
+
+
+class DepthIndex:
+    """
+    Sorted view of a depth index for binary-search depth windows.
+
+    Sorted indexes (trailing NaN depths allowed) are used as they are, so windows
+    are zero-copy slices. Unsorted indexes keep a stable argsort and windows return
+    positions in original order. Uniformly sampled indexes are detected and their
+    window bounds are computed arithmetically instead of by searchsorted.
+    """
+
+    __slots__ = ('source', 'depths', 'order', 'count', 'start', 'step')
+
+    # Relative tolerance on the step for uniform sampling detection
+    UNIFORM_RTOL = 1e-6
+
+    def __init__(self, index_log: np.ndarray):
+        self.source = index_log
+        depths = np.asarray(index_log, dtype=np.float64)
+        finite = np.isfinite(depths)
+        # Number of leading finite depths; NaN depths only allowed as a tail
+        self.count = int(np.argmin(finite)) if not finite.all() else len(depths)
+
+        head = depths[:self.count]
+        if finite[self.count:].any() or np.any(head[1:] < head[:-1]):
+            self.order = np.argsort(depths, kind='stable')
+            self.count = int(np.count_nonzero(finite))
+            self.depths = depths[self.order]
+        else:
+            self.order = None
+            self.depths = depths
+
+        self.start = None
+        self.step = None
+        if self.count >= 2:
+            first = self.depths[0]
+            step = (self.depths[self.count - 1] - first) / (self.count - 1)
+            if step > 0:
+                expected = first + step * np.arange(self.count)
+                if np.allclose(self.depths[:self.count], expected, rtol=0, atol=abs(step) * self.UNIFORM_RTOL):
+                    self.start = float(first)
+                    self.step = float(step)
+
+    @property
+    def is_sorted(self) -> bool:
+        """True if the index is sorted as stored (windows are zero-copy)."""
+        return self.order is None
+
+    @property
+    def is_uniform(self) -> bool:
+        """True if the index has a constant positive step."""
+        return self.step is not None
+
+    @property
+    def top(self) -> Optional[float]:
+        return float(self.depths[0]) if self.count else None
+
+    @property
+    def bottom(self) -> Optional[float]:
+        return float(self.depths[self.count - 1]) if self.count else None
+
+    def bounds(self, top: Optional[float] = None, bottom: Optional[float] = None) -> Tuple[int, int]:
+        """
+        Positions [start, stop) of the depths within [top, bottom] in sorted order.
+        None leaves that side of the window open.
+        """
+        start, stop = 0, self.count
+        if self.is_uniform:
+            # Tolerance keeps depths that are equal to a bound up to float noise
+            tolerance = self.UNIFORM_RTOL
+            if top is not None:
+                start = math.ceil((top - self.start) / self.step - tolerance)
+            if bottom is not None:
+                stop = math.floor((bottom - self.start) / self.step + tolerance) + 1
+        else:
+            valid = self.depths[:self.count]
+            if top is not None:
+                start = int(np.searchsorted(valid, top, side='left'))
+            if bottom is not None:
+                stop = int(np.searchsorted(valid, bottom, side='right'))
+        start = min(max(start, 0), self.count)
+        stop = min(max(stop, start), self.count)
+        return start, stop
+
+    def locate(self, top: Optional[float] = None, bottom: Optional[float] = None) -> Union[slice, np.ndarray]:
+        """
+        Locate the samples within [top, bottom].
+
+        Returns:
+            A slice for sorted indexes, otherwise an array of positions in original order
+        """
+        start, stop = self.bounds(top, bottom)
+        if self.order is None:
+            return slice(start, stop)
+        return np.sort(self.order[start:stop])
+
+    def window(self, values: np.ndarray, top: Optional[float] = None, bottom: Optional[float] = None) -> np.ndarray:
+        """Samples of values (aligned with this index) within [top, bottom]; a view when sorted."""
+        return values[self.locate(top, bottom)]
+
+    def position(self, depth: float) -> int:
+        """Position (in stored order) of the sample nearest to depth, or -1 for an empty index."""
+        if not self.count:
+            return -1
+        if self.is_uniform:
+            i = int(round((depth - self.start) / self.step))
+            i = min(max(i, 0), self.count - 1)
+        else:
+            valid = self.depths[:self.count]
+            i = int(np.searchsorted(valid, depth))
+            if i == self.count or (i > 0 and depth - valid[i - 1] <= valid[i] - depth):
+                i -= 1
+        return i if self.order is None else int(self.order[i])
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+
 class WellLog:
-    """Data class representing a well log."""
-    name: str
-    date: str
-    description: str
-    log: List[Union[str, float]]  # New attribute for log values
-    log_type: value_type
-    interpolation: interpolation_type
-    dtst: str
+    """
+    Class representing a well log.
 
-    def __init__(self, name: str, date: str, description: str, interpolation: interpolation_type, log_type: value_type, log: List[Union[str, float]], dtst: str):
-        # Enforce that all values are either str or numeric (int/float), allowing None for missing values
-        if not log:
-            self.name = name
-            self.date = date
-            self.description = description
-            self.log = log
-            self.log_type = log_type
-            self.interpolation = interpolation
-            self.dtst = dtst
-            return
-        
-        # Filter out None values for type checking
-        non_none_values = [v for v in log if v is not None]
-        
-        if non_none_values:
-            # Check if all non-None values are numeric (int or float) OR all are strings
-            all_numeric = all(isinstance(v, (int, float)) for v in non_none_values)
-            all_strings = all(isinstance(v, str) for v in non_none_values)
-            
-            if not (all_numeric or all_strings):
-                raise ValueError("All elements of 'values' must be of the same category: either all numeric (int/float) or all str.")
-            
-            # Convert all numeric values to float for consistency, keeping None as is
-            if all_numeric:
-                log = [float(v) if v is not None else None for v in log]
+    Samples are stored in `values` as a NumPy array: float64 with NaN for missing
+    samples for numeric logs, or int32 codes into `categories` (-1 for missing)
+    for string logs. The `log` property exposes the samples as an array.
+    """
 
-        # Assign the validated values to the instance
+    __slots__ = ('name', 'date', 'description', 'log_type', 'interpolation', 'dtst', 'values', 'categories')
+
+    def __init__(self, name: str, date: str, description: str, interpolation: interpolation_type, log_type: value_type, log: List[Union[str, float]], dtst: str):
         self.name = name
         self.date = date
         self.description = description
-        self.log = log
         self.log_type = log_type
         self.interpolation = interpolation
         self.dtst = dtst
-        
-    def __post_init__(self):
-        
-        # Enforce that all elements in 'values' match the specified 'values_type'
-        if self.log_type == "str":
-            if not all(isinstance(v, str) for v in self.values):
-                raise ValueError("All elements in 'values' must be of type 'str'.")
-        elif self.log_type == "float":
-            if not all(isinstance(v, float) for v in self.values):
-                raise ValueError("All elements in 'values' must be of type 'float'.")
-        else:
-            raise ValueError("Invalid 'values_type'. Must be either 'str' or 'float'.")
-        
-        # Ensures that 'interp' is one of the allowed values if not using Literal
-        if self.interp not in {"POINT", "TOP", "CONTINUOUS"}:
-            raise ValueError(f"Invalid value for interp. Must be one of: 'POINT', 'CONTINUOUS', 'TOP'.")
-        
+        # Validated and converted to array storage by the property setter
+        self.log = log
+
+    @property
+    def log(self) -> np.ndarray:
+        """Log samples as an array (float64 for numeric logs, object array of str/None for string logs)."""
+        if self.categories is None:
+            return self.values
+        lookup = np.array(self.categories + [None], dtype=object)
+        return lookup[self.values]
+
+    @log.setter
+    def log(self, log: Union[List[Union[str, float]], np.ndarray]):
+        self.values, self.categories = encode_log_values(log, self.log_type)
+
+    @property
+    def is_categorical(self) -> bool:
+        """True if the log holds dictionary-encoded string samples."""
+        return self.categories is not None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def segments(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Run-length segments (starts, stops, codes) of a string log; codes index `categories`."""
+        if self.categories is None:
+            raise ValueError(f"Log '{self.name}' is not a string log")
+        return run_length_segments(self.values)
+
+    def to_categorical(self) -> pd.Categorical:
+        """String log samples as a pandas Categorical sharing the codes (missing samples are NaN)."""
+        if self.categories is None:
+            raise ValueError(f"Log '{self.name}' is not a string log")
+        return pd.Categorical.from_codes(self.values, categories=self.categories)
+
+    def __repr__(self) -> str:
+        return (f"WellLog(name={self.name!r}, log_type={self.log_type!r}, interpolation={self.interpolation!r}, "
+                f"dtst={self.dtst!r}, samples={len(self.values)})")
+
+    def to_list(self) -> List[Any]:
+        """Log samples as a JSON-ready list with None for missing samples."""
+        if self.categories is None:
+            return log_array_to_list(self.values)
+        return self.log.tolist()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert WellLog to a dictionary for JSON serialization."""
         return {
@@ -217,7 +455,7 @@ class WellLog:
             "description": self.description,
             "interpolation": self.interpolation,
             "log_type": self.log_type,
-            "log": self.log,  # Serialize the logs
+            "log": self.to_list(),  # Serialize the logs
             "dtst": self.dtst,
         }
 
@@ -234,7 +472,7 @@ class WellLog:
             dtst=data['dtst'],
         )
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Dataset:
     """Data class representing a dataset of well logs."""
     date_created: datetime
@@ -246,6 +484,54 @@ class Dataset:
     index_name: str = ""
     well_logs: List[WellLog] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _depth_index: Optional[DepthIndex] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        # Index samples are kept as a float64 array with NaN for missing depths
+        self.index_log, _ = encode_log_values(self.index_log)
+
+    @property
+    def depth_index(self) -> DepthIndex:
+        """Sorted depth index over index_log (rebuilt when index_log is replaced)."""
+        depth_index = getattr(self, '_depth_index', None)
+        if depth_index is None or depth_index.source is not self.index_log:
+            depth_index = DepthIndex(self.index_log)
+            self._depth_index = depth_index
+        return depth_index
+
+    def depth_slice(self, top: Optional[float] = None, bottom: Optional[float] = None) -> Union[slice, np.ndarray]:
+        """
+        Locate the samples within [top, bottom] with a binary search on the depth index.
+
+        Returns:
+            A slice (zero-copy windows) for sorted indexes, otherwise positions in original order
+        """
+        return self.depth_index.locate(top, bottom)
+
+    def log_window(self, log_name: str, top: Optional[float] = None, bottom: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get depths and samples of a log within [top, bottom].
+
+        Args:
+            log_name: Name of the log
+            top: Top depth (None for no limit)
+            bottom: Bottom depth (None for no limit)
+
+        Returns:
+            Tuple of (depths, samples); array views when the index is sorted
+        """
+        well_log = next((log for log in self.well_logs if log.name == log_name), None)
+        if well_log is None:
+            raise KeyError(f"Log '{log_name}' not found in dataset '{self.name}'")
+        window = self.depth_slice(top, bottom)
+        values = well_log.log
+        if len(values) < len(self.index_log):
+            # Short logs only cover the first len(values) depths
+            if isinstance(window, slice):
+                window = slice(min(window.start, len(values)), min(window.stop, len(values)))
+            else:
+                window = window[window < len(values)]
+        return self.index_log[window], values[window]
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert Dataset to a dictionary for JSON serialization."""
@@ -254,8 +540,8 @@ class Dataset:
             "name": self.name,
             "type": self.type,
             "wellname": self.wellname,
-            "constants": [vars(constant) for constant in self.constants],
-            "index_log": self.index_log,
+            "constants": [constant.to_dict() for constant in self.constants],
+            "index_log": log_array_to_list(self.index_log),
             "index_name": self.index_name,
             "well_logs": [log.to_dict() for log in self.well_logs],
             "metadata": self.metadata,
@@ -288,7 +574,7 @@ class Dataset:
         """
         data_dict = {}
         
-        if self.index_log and self.index_name:
+        if len(self.index_log) and self.index_name:
             data_dict[self.index_name] = self.index_log
         
         for well_log in self.well_logs:
@@ -301,6 +587,16 @@ class Dataset:
         
         return df
 
+    def resample(self, new_index: Optional[np.ndarray] = None, step: Optional[float] = None,
+                 tolerance: Optional[float] = None, name: Optional[str] = None) -> 'Dataset':
+        """
+        Resample all logs onto a new depth index or regular step, following each log's
+        interpolation type (see utils.log_resampling.resample_dataset).
+        """
+        from utils.log_resampling import resample_dataset
+
+        return resample_dataset(self, new_index=new_index, step=step, tolerance=tolerance, name=name)
+
     def export_to_las(self, output_path: str, well_name: str = None) -> bool:
         """
         Export Dataset to a LAS (Log ASCII Standard) file.
@@ -319,12 +615,12 @@ class Dataset:
             las.well.WELL = lasio.HeaderItem('WELL', value=well_name)
             las.well.DATE = lasio.HeaderItem('DATE', value=self.date_created.strftime('%Y-%m-%d'))
             
-            if self.index_log and self.index_name:
-                index_data = np.array(self.index_log)
+            if len(self.index_log) and self.index_name:
+                index_data = self.index_log
                 
                 df_data = {self.index_name: index_data}
                 for log in self.well_logs:
-                    log_data = np.array(log.log)
+                    log_data = log.log
                     if len(log_data) == len(index_data):
                         df_data[log.name] = log_data
                 
@@ -386,17 +682,13 @@ class Dataset:
         if index_name not in df.columns:
             raise ValueError(f"LAS file must contain the column: {index_name}")
 
-        index_log = df[index_name].tolist()
-        # Replace NaN values with None in index log
-        index_log = [None if (isinstance(v, float) and math.isnan(v)) else v for v in index_log]
+        index_log = df[index_name].to_numpy()
         #df_logs = df.drop(columns=[index_name])
         # Set interpolation based on dataset type
         interp = "POINT" if dataset_type == 'Point' else "CONTINUOUS"
         logs = []
         for col_index, column in enumerate(df.columns):
-            log_values = df.iloc[:, col_index].tolist()  # Get values of the current column as a list
-            # Replace NaN values with None to avoid "nan" in JSON
-            log_values = [None if (isinstance(v, float) and math.isnan(v)) else v for v in log_values]
+            log_values = df.iloc[:, col_index].to_numpy()  # Column values as an array (NaN for missing)
             log_type = 'float'
                 
             well_log = WellLog(
@@ -440,17 +732,13 @@ class Dataset:
         if index_name not in df.columns:
             raise ValueError(f"LAS file must contain the column: {index_name}")
 
-        index_log = df[index_name].tolist()
-        # Replace NaN values with None in index log
-        index_log = [None if (isinstance(v, float) and math.isnan(v)) else v for v in index_log]
+        index_log = df[index_name].to_numpy()
         #df_logs = df.drop(columns=[index_name])
         # Set interpolation based on dataset type
         interp = "POINT" if dataset_type == 'Point' else "CONTINUOUS"
         logs = []
         for col_index, column in enumerate(df.columns):
-            log_values = df.iloc[:, col_index].tolist()  # Get values of the current column as a list
-            # Replace NaN values with None to avoid "nan" in JSON
-            log_values = [None if (isinstance(v, float) and math.isnan(v)) else v for v in log_values]
+            log_values = df.iloc[:, col_index].to_numpy()  # Column values as an array (NaN for missing)
             log_type = 'float'
                 
             well_log = WellLog(
@@ -483,7 +771,7 @@ class Dataset:
         index = 'DEPTH' # Always use 'DEPTH' as reference
         interp = "CONTINUOUS"
         bot = math.ceil(bottom)
-        refvalues = np.arange(0, bot, 0.5).tolist()  # Includes 2000.0
+        refvalues = np.arange(0, bot, 0.5)  # Includes 2000.0
         index_log = refvalues
         #df_logs = df.drop(columns=[index_name])
         logs = []
@@ -527,7 +815,7 @@ class Dataset:
             metadata={'source': 'Created with new well creation'}
         )
 
-@dataclass
+@dataclass(slots=True)
 class Well:
     """Data class representing a well."""
     date_created: datetime
@@ -554,12 +842,17 @@ class Well:
         """
         Convert Well data to a single pandas DataFrame by merging specified datasets.
         
+        Datasets are aligned on one union depth index (see utils.depth_merge);
+        duplicate log names get a '_dup' suffix.
+        
         Args:
             dataset_names: List of dataset names to include. If None, include all datasets.
             
         Returns:
-            pd.DataFrame: Merged DataFrame with all datasets
+            pd.DataFrame: Merged DataFrame indexed by depth with all datasets
         """
+        from utils.depth_merge import merge_datasets
+
         if dataset_names is None:
             datasets_to_merge = self.datasets
         else:
@@ -568,16 +861,7 @@ class Well:
         if not datasets_to_merge:
             return pd.DataFrame()
         
-        dfs = [ds.to_dataframe() for ds in datasets_to_merge]
-        
-        if len(dfs) == 1:
-            return dfs[0]
-        
-        merged_df = dfs[0]
-        for df in dfs[1:]:
-            merged_df = merged_df.join(df, how='outer', rsuffix='_dup')
-        
-        return merged_df
+        return merge_datasets(datasets_to_merge)
 
     def summary(self) -> Dict[str, Any]:
         """Generate a summary of the Well, including dataset names."""
@@ -596,17 +880,16 @@ class Well:
             'datasets': [dataset.to_dict() for dataset in self.datasets]
         }
 
-    def serialize(self, filename: str):
-        """Serialize Well to a file."""
-        with open(filename, 'w') as file:
-            json.dump(self.to_dict(), file, default=str)
+    def serialize(self, filename: str, fmt: str = None):
+        """Serialize Well to a .ptrc file (keeps the existing file's format unless fmt is given)."""
+        from utils.ptrc_file_io import write_well_file
+        write_well_file(filename, self.to_dict(), fmt=fmt)
 
     @staticmethod
     def deserialize(filepath: str) -> 'Well':
-        """Deserialize Well from a file."""
-        with open(filepath, 'r') as file:
-            data = json.load(file)
-            return Well.from_dict(data)
+        """Deserialize Well from a .ptrc file (legacy JSON or binary v2)."""
+        from utils.ptrc_file_io import read_well_file
+        return Well.from_dict(read_well_file(filepath, arrays=True))
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'Well':
@@ -618,7 +901,138 @@ class Well:
             well_type=data['well_type'],
             datasets=datasets
         )
-@dataclass
+
+
+class LazyWellLog(WellLog):
+    """
+    WellLog view over a cached log dictionary.
+    Metadata is available immediately; samples are converted and validated on first access.
+    """
+
+    __slots__ = ('_source', '_values', '_categories')
+
+    def __init__(self, data: Dict[str, Any]):
+        self.name = data['name']
+        self.date = data['date']
+        self.description = data['description']
+        self.log_type = data['log_type']
+        self.interpolation = data['interpolation']
+        self.dtst = data['dtst']
+        self._source = data
+        self._values = None
+        self._categories = None
+
+    def _materialize(self):
+        if self._source is not None:
+            self._values, self._categories = encode_log_values(self._source.get('log'), self.log_type)
+            self._source = None
+
+    @property
+    def values(self) -> np.ndarray:
+        self._materialize()
+        return self._values
+
+    @values.setter
+    def values(self, values: np.ndarray):
+        self._source = None
+        self._values = values
+
+    @property
+    def categories(self) -> Optional[List[str]]:
+        self._materialize()
+        return self._categories
+
+    @categories.setter
+    def categories(self, categories: Optional[List[str]]):
+        self._source = None
+        self._categories = categories
+
+    def __len__(self) -> int:
+        if self._source is not None:
+            samples = self._source.get('log')
+            return len(samples) if samples is not None else 0
+        return len(self._values)
+
+
+class LazyDataset(Dataset):
+    """
+    Dataset view over a cached dataset dictionary.
+    Logs are only turned into (lazy) WellLog objects and the index only converted when touched.
+    """
+
+    __slots__ = ('_source', '_constants', '_index_log', '_well_logs')
+
+    def __init__(self, data: Dict[str, Any]):
+        self.date_created = datetime.fromisoformat(data['date_created'])
+        self.name = data['name']
+        self.type = data['type']
+        self.wellname = data['wellname']
+        self.index_name = data['index_name']
+        self.metadata = data['metadata']
+        self._source = data
+        self._constants = None
+        self._index_log = None
+        self._well_logs = None
+
+    @property
+    def constants(self) -> List[Constant]:
+        if self._constants is None:
+            self._constants = [Constant(**constant) for constant in self._source['constants']]
+        return self._constants
+
+    @constants.setter
+    def constants(self, constants: List[Constant]):
+        self._constants = constants
+
+    @property
+    def index_log(self) -> np.ndarray:
+        if self._index_log is None:
+            self._index_log, _ = encode_log_values(self._source['index_log'])
+        return self._index_log
+
+    @index_log.setter
+    def index_log(self, index_log):
+        self._index_log, _ = encode_log_values(index_log)
+
+    @property
+    def well_logs(self) -> List[WellLog]:
+        if self._well_logs is None:
+            self._well_logs = [LazyWellLog(log) for log in self._source['well_logs']]
+        return self._well_logs
+
+    @well_logs.setter
+    def well_logs(self, well_logs: List[WellLog]):
+        self._well_logs = well_logs
+
+
+class LazyWell(Well):
+    """
+    Well view over cached well data (the Well.to_dict() layout).
+    Construction only reads the well header; datasets, logs and samples are
+    materialized on first access, so metadata-only callers never pay for a full rebuild.
+    """
+
+    __slots__ = ('_source', '_datasets')
+
+    def __init__(self, data: Dict[str, Any]):
+        self.date_created = datetime.fromisoformat(data['date_created'])
+        self.well_name = data['well_name']
+        self.well_type = data['well_type']
+        self._source = data
+        self._datasets = None
+
+    @property
+    def datasets(self) -> List[Dataset]:
+        if self._datasets is None:
+            self._datasets = [LazyDataset(ds) for ds in self._source.get('datasets', [])]
+        return self._datasets
+
+    @datasets.setter
+    def datasets(self, datasets: List[Dataset]):
+        self._datasets = datasets
+
+
+@dataclass(slots=True, frozen=True)
 class SurveyData:
     depth: float
     deviation: float
@@ -638,6 +1052,29 @@ class SurveyData:
             azimuth=data['azimuth']
         )
 
+# Mnemonics recognised when reading surveys and elevations from well datasets
+SURVEY_INCLINATION_NAMES = ('INCL', 'INC', 'DEVI', 'DEV', 'DEVIATION', 'INCLINATION')
+SURVEY_AZIMUTH_NAMES = ('AZIM', 'AZI', 'HAZI', 'AZIMUTH')
+ELEVATION_CONSTANT_NAMES = ('EKB', 'KB', 'EDF', 'EREF', 'ELEV', 'EGL')
+
+# Measured depth step of cached MD->TVD tables
+TRAJECTORY_TABLE_STEP = 0.5
+
+
+def _survey_logs(dataset: 'Dataset') -> Tuple[Optional[WellLog], Optional[WellLog]]:
+    """Inclination and azimuth logs of a dataset (None where missing)."""
+    logs = {well_log.name.upper(): well_log for well_log in dataset.well_logs if not well_log.is_categorical}
+    inclination = next((logs[name] for name in SURVEY_INCLINATION_NAMES if name in logs), None)
+    azimuth = next((logs[name] for name in SURVEY_AZIMUTH_NAMES if name in logs), None)
+    return inclination, azimuth
+
+
+def is_survey_dataset(dataset: 'Dataset') -> bool:
+    """True if the dataset holds a directional survey (inclination and azimuth logs)."""
+    inclination, azimuth = _survey_logs(dataset)
+    return inclination is not None and azimuth is not None
+
+
 @dataclass
 class Survey:
     data: List[SurveyData] = field(default_factory=list)
@@ -652,6 +1089,25 @@ class Survey:
         survey_data = [SurveyData.from_dict(item) for item in data['data']]
         return cls(data=survey_data)
 
+    @classmethod
+    def from_dataset(cls, dataset: 'Dataset') -> Optional['Survey']:
+        """
+        Build a Survey from a dataset holding inclination and azimuth logs indexed by measured depth.
+
+        Returns:
+            Survey, or None if the dataset has no inclination/azimuth logs
+        """
+        inclination, azimuth = _survey_logs(dataset)
+        if inclination is None or azimuth is None:
+            return None
+
+        count = min(len(dataset.index_log), len(inclination.values), len(azimuth.values))
+        md = dataset.index_log[:count]
+        inc = inclination.values[:count]
+        azi = azimuth.values[:count]
+        valid = np.isfinite(md) & np.isfinite(inc) & np.isfinite(azi)
+        return cls(data=[SurveyData(*station) for station in zip(md[valid].tolist(), inc[valid].tolist(), azi[valid].tolist())])
+
     def add_data(self, survey_data: SurveyData):
         self.data.append(survey_data)
         
@@ -663,59 +1119,161 @@ class Survey:
             for row in reader:
                 depth, deviation, azimuth = map(float, row)
                 self.add_data(SurveyData(depth, deviation, azimuth))
-                
-    def compute_tvd_minimum_curvature(depths, deviations, azimuths):
-        """Compute Total Vertical Depth (TVD) using the Minimum Curvature method."""
-        tvds = [depths[0]]  # TVD at the first depth point
-        norths = [0]  # TVD at the first depth point
-        souths = [0]  # TVD at the first depth point
-        cumulative_tvd = [depths[0]]  # Cumulative TVD starts with the first depth point
-        pi = 3.141592653589793
-        for i in range(1, len(depths)):
-            D = depths[i] - depths[i - 1]  # Calculate vertical distance
-            deviation_radians = np.radians(0.5*(deviations[i - 1]+deviations[i]))  # Convert deviation to radians
-            azimuth_radians = np.radians(0.5*(azimuths[i - 1]+azimuths[i]))  # Convert deviation to radians
-
-            # Calculate vertical depth change using the deviation
-            vertical_distance = D * np.cos(deviation_radians)
-            
-            # Calculate vertical depth change using the deviation
-            horizontl_distance = D * np.sin(deviation_radians)
-            north = horizontl_distance*np.cos(azimuth_radians)
-            south = horizontl_distance*np.sin(azimuth_radians)
-            # Update TVD without constraints
-            new_tvd = tvds[i - 1] + vertical_distance
-            new_north = norths[i-1] + north
-            new_south = souths[i-1] + south
-            
-            tvds.append(new_tvd)
-            norths.append(new_north)
-            souths.append(new_south)
-        return tvds, norths, souths
 
-    def interpolate(self, step: float = 0.5) -> List[SurveyData]:
-        depths = np.array([d.depth for d in self.data])
-        deviations = np.array([d.deviation for d in self.data])
-        azimuths = np.array([d.azimuth for d in self.data])
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Stations as (measured depth, inclination, azimuth) arrays sorted by measured depth."""
+        md = np.array([d.depth for d in self.data], dtype=np.float64)
+        inc = np.array([d.deviation for d in self.data], dtype=np.float64)
+        azi = np.array([d.azimuth for d in self.data], dtype=np.float64)
+        order = np.argsort(md, kind='stable')
+        return md[order], inc[order], azi[order]
+
+    @staticmethod
+    def compute_tvd_minimum_curvature(depths, deviations, azimuths) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute TVD, northing and easting with the minimum curvature method.
+
+        Each course between stations is treated as a circular arc; the ratio factor
+        2/dogleg * tan(dogleg/2) corrects the balanced-tangential terms. All stations
+        are processed at once. TVD at the first station equals its measured depth.
+
+        Args:
+            depths: Measured depths of the stations (sorted)
+            deviations: Inclinations in degrees
+            azimuths: Azimuths in degrees
+
+        Returns:
+            Tuple of (tvd, north, east) arrays
+        """
+        md = np.asarray(depths, dtype=np.float64)
+        if not len(md):
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty.copy(), empty.copy()
+
+        inc = np.radians(np.asarray(deviations, dtype=np.float64))
+        azi = np.radians(np.asarray(azimuths, dtype=np.float64))
+        inc1, inc2 = inc[:-1], inc[1:]
+        azi1, azi2 = azi[:-1], azi[1:]
+
+        cos_dogleg = np.cos(inc2 - inc1) - np.sin(inc1) * np.sin(inc2) * (1 - np.cos(azi2 - azi1))
+        dogleg = np.arccos(np.clip(cos_dogleg, -1.0, 1.0))
+        ratio = np.ones_like(dogleg)
+        curved = dogleg > 1e-9
+        ratio[curved] = 2 / dogleg[curved] * np.tan(dogleg[curved] / 2)
 
-        # Create interpolators
-        deviation_interp = interp1d(depths, deviations, kind='linear', fill_value="extrapolate")
-        azimuth_interp = interp1d(depths, azimuths, kind='linear', fill_value="extrapolate")
+        half_course = np.diff(md) / 2 * ratio
+        d_tvd = half_course * (np.cos(inc1) + np.cos(inc2))
+        d_north = half_course * (np.sin(inc1) * np.cos(azi1) + np.sin(inc2) * np.cos(azi2))
+        d_east = half_course * (np.sin(inc1) * np.sin(azi1) + np.sin(inc2) * np.sin(azi2))
+
+        tvd = np.concatenate(([md[0]], md[0] + np.cumsum(d_tvd)))
+        north = np.concatenate(([0.0], np.cumsum(d_north)))
+        east = np.concatenate(([0.0], np.cumsum(d_east)))
+        return tvd, north, east
+
+    def trajectory(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Trajectory at the survey stations as (md, tvd, north, east) arrays."""
+        md, inc, azi = self.arrays()
+        tvd, north, east = Survey.compute_tvd_minimum_curvature(md, inc, azi)
+        return md, tvd, north, east
+
+    def interpolate_arrays(self, step: float = 0.5) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Interpolate inclination and azimuth at a regular measured depth step.
+        Azimuths are unwrapped first so courses crossing north interpolate the short way.
+
+        Returns:
+            Tuple of (md, inclination, azimuth) arrays
+        """
+        depths, deviations, azimuths = self.arrays()
 
         # Generate new depth values at specified intervals
         new_depths = np.arange(depths.min(), depths.max() + step, step)
 
-        # Interpolate to find corresponding values
-        new_deviations = deviation_interp(new_depths)
-        new_azimuths = azimuth_interp(new_depths)
+        unwrapped = np.degrees(np.unwrap(np.radians(azimuths)))
+        new_deviations = interp1d(depths, deviations, kind='linear', fill_value="extrapolate")(new_depths)
+        new_azimuths = np.mod(interp1d(depths, unwrapped, kind='linear', fill_value="extrapolate")(new_depths), 360.0)
+        return new_depths, new_deviations, new_azimuths
+
+    def interpolate(self, step: float = 0.5) -> List[SurveyData]:
+        new_depths, new_deviations, new_azimuths = self.interpolate_arrays(step)
 
         # Combine interpolated data into new list of SurveyData instances
-        interpolated_data = [
-            SurveyData(depth, deviation, azimuth) 
-            for depth, deviation, azimuth in zip(new_depths, new_deviations, new_azimuths)
+        return [
+            SurveyData(depth, deviation, azimuth)
+            for depth, deviation, azimuth in zip(new_depths.tolist(), new_deviations.tolist(), new_azimuths.tolist())
         ]
 
-        return interpolated_data
+
+@dataclass(slots=True, frozen=True, eq=False)
+class TrajectoryTable:
+    """
+    MD -> TVD/TVDSS lookup table for a well.
+
+    Built once from the survey at TRAJECTORY_TABLE_STEP with minimum curvature, then
+    any depth array is converted with a single np.interp. Above the first station the
+    hole is taken as vertical; below the last station it continues on the last tangent.
+    """
+    md: np.ndarray
+    tvd: np.ndarray
+    north: np.ndarray
+    east: np.ndarray
+    elevation: float = 0.0
+
+    @classmethod
+    def from_survey(cls, survey: Survey, elevation: float = 0.0, step: float = TRAJECTORY_TABLE_STEP) -> 'TrajectoryTable':
+        if len(survey.data) < 2:
+            md, tvd, north, east = survey.trajectory()
+        else:
+            md, inc, azi = survey.interpolate_arrays(step)
+            tvd, north, east = Survey.compute_tvd_minimum_curvature(md, inc, azi)
+        return cls(md=md, tvd=tvd, north=north, east=east, elevation=float(elevation))
+
+    @classmethod
+    def from_well(cls, well: 'Well') -> Optional['TrajectoryTable']:
+        """
+        Build the table from the first dataset of the well holding a survey
+        (inclination and azimuth logs); the elevation comes from a KB/DF/reference constant.
+
+        Returns:
+            TrajectoryTable, or None if the well has no survey
+        """
+        survey = None
+        elevation = 0.0
+        for dataset in well.datasets:
+            if survey is None:
+                candidate = Survey.from_dataset(dataset)
+                if candidate is not None and candidate.data:
+                    survey = candidate
+            for constant in dataset.constants:
+                if constant.name.upper() in ELEVATION_CONSTANT_NAMES and not elevation:
+                    try:
+                        elevation = float(constant.value)
+                    except (TypeError, ValueError):
+                        pass
+        if survey is None:
+            return None
+        return cls.from_survey(survey, elevation)
+
+    def to_tvd(self, md_values) -> np.ndarray:
+        """Convert measured depths (any array-like) to TVD."""
+        md_values = np.asarray(md_values, dtype=np.float64)
+        tvd = np.interp(md_values, self.md, self.tvd)
+
+        above = md_values < self.md[0]
+        tvd[above] = self.tvd[0] - (self.md[0] - md_values[above])
+
+        below = md_values > self.md[-1]
+        if np.any(below):
+            slope = (self.tvd[-1] - self.tvd[-2]) / (self.md[-1] - self.md[-2]) if len(self.md) >= 2 else 1.0
+            tvd[below] = self.tvd[-1] + (md_values[below] - self.md[-1]) * slope
+        return tvd
+
+    def to_tvdss(self, md_values) -> np.ndarray:
+        """Convert measured depths to TVD subsea (TVD below the reference elevation)."""
+        return self.to_tvd(md_values) - self.elevation
+
+
 class Interpolation:
     # Define the allowed constant values
     ALLOWED_VALUES = {"POINT", "TOPS", "CONTINUOUS"}
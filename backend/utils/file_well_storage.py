@@ -1,99 +1,165 @@
 """
 File-based Well Storage Service for Petrophysics Workspace
-Uses .ptrc (JSON) files with in-memory cache for eager/lazy loading
+Uses .ptrc files (legacy JSON or binary v2, see ptrc_file_io) with in-memory cache for eager/lazy loading
 SQLite is NOT used for well data - only for other data types
 """
 
-import json
-import glob
 import os
+import time
+import hashlib
 import asyncio
+import logging
 import threading
 from collections import OrderedDict
-from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import Future
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+import pandas as pd
 
-# Global index to store file paths (loaded during startup)
+from utils.fe_data_objects import LazyWell, TrajectoryTable
+from utils.ptrc_file_io import (read_well_bytes, parse_well_bytes, write_well_file, convert_project_wells,
+                                add_write_listener, FORMAT_V2)
+from utils.well_file_index import (WellFileIndex, INDEX_DB_FILE, WELLS_DIR_NAME, project_id,
+                                   file_fingerprint, file_hash, read_fingerprint)
+from utils.well_cache import (WellCache, MB, DEFAULT_COLD_AFTER_SECONDS, DEFAULT_COLD_CODEC,
+                              freeze_well, thaw_well, frozen_size)
+from utils.well_change_detector import WellChangeDetector
+from utils.well_preloader import WellPreloader, PRELOAD_THREAD, PRELOAD_PROCESS
+from utils.well_catalog import WellCatalog
+from utils.well_cache_metrics import CacheMetrics, SampledLog
+from utils.well_cache_snapshot import CacheSnapshot, CacheSnapshotter, write_snapshot, DEFAULT_SNAPSHOT_FILE
+from utils.well_revisions import WellRevisionStore
+
+
+logger = logging.getLogger(__name__)
+# Per-request messages (hits, misses, evictions) are sampled, see well_cache_metrics
+_sampled_log = SampledLog(logger)
+
+# Global index to store file paths (loaded during startup from the persistent WellFileIndex)
+# Keys are "<normalized project path>::<well name>", so projects sharing a folder name do not collide
 GLOBAL_FILE_INDEX: Dict[str, str] = {}
 
-# Project-aware in-memory cache with metadata
-# Structure: {cache_key: {"data": well_dict, "source": "preload|lazy", "project": project_name}}
-IN_MEMORY_CACHE: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+# Project-aware, byte-budgeted in-memory cache (segmented LRU, see well_cache)
+# Entries: {cache_key: {"data": well_dict, "source": "preload|lazy|saved", "project": project_id, "bytes": size}}
+# Idle entries move to the compressed cold tier ("data" None, "frozen" set), see compress_idle_wells
+IN_MEMORY_CACHE = WellCache()
 
-# Track which projects have been preloaded
+# Track which projects (by project_id) have been preloaded
 PRELOADED_PROJECTS: set = set()
 
-# Active project (protected from eviction)
+# Active project id (protected from eviction)
 ACTIVE_PROJECT: Optional[str] = None
 
-# Cache size limit (soft limit - preloaded projects can exceed this)
-# Lazy-loaded wells are evicted when cache exceeds this limit
-MAX_CACHE_SIZE = 200
-LAZY_CACHE_SIZE = 50  # Max lazy-loaded wells before eviction
+# Values derived from a well revision (merged frames, trajectory tables)
+# Structure: {(cache_key, kind, params): (well_dict, value)}
+# Every save/reload replaces the cached well dict, so the dict itself identifies the revision
+DERIVED_CACHE: OrderedDict[Tuple[str, str, Any], Tuple[Dict[str, Any], Any]] = OrderedDict()
+MAX_DERIVED_ENTRIES = 32
 
 # Thread lock for cache operations to prevent race conditions
 CACHE_LOCK = threading.Lock()
 
+# Preload mode (PRELOAD_THREAD or PRELOAD_PROCESS, see well_preloader)
+PRELOAD_MODE = os.environ.get("WELL_PRELOAD_MODE", PRELOAD_THREAD)
+
+# Loads in progress by cache key: concurrent misses for a well wait on one load (single-flight)
+INFLIGHT_LOADS: Dict[str, Future] = {}
+
+# Result of checking a cache entry against its file
+FRESH = "fresh"
+CHANGED = "changed"
+MISSING = "missing"
+
 
 class FileWellStorageService:
     """
     File-based storage service for well data using .ptrc files.
     Features:
-    - File indexing at startup
-    - In-memory LRU cache for performance
+    - Persistent, incremental file index (only changed 10-WELLS folders are listed at startup)
+    - In-memory cache for performance, bounded by an estimated byte budget
     - Lazy loading of files
-    - Automatic cache eviction
+    - Automatic cache eviction (segmented LRU, active project gets protected capacity)
+    - Stale-safe: entries carry a file fingerprint (size, mtime, hash) checked on access
+    - Two tiers: wells idle for cold_after_seconds are compressed in memory and
+      decompressed on their next hit
+    - Revisions: every well, dataset and log carries a monotonically increasing
+      revision and content fingerprint (see well_revisions), bumped by every write
     """
     
-    def __init__(self, workspace_root: str):
+    def __init__(self, workspace_root: str, index_db_path: Optional[str] = None):
         self.workspace_root = Path(workspace_root)
         self.file_index = GLOBAL_FILE_INDEX
         self.cache = IN_MEMORY_CACHE
+        self.index = WellFileIndex(index_db_path or str(INDEX_DB_FILE))
+        self.catalog = WellCatalog(self.index)
+        self.revisions = WellRevisionStore(index_db_path or str(INDEX_DB_FILE))
+        self.stale_reloads = 0
+        self.invalidations = 0
+        self.saved_loads = 0
+        self.metrics = CacheMetrics()
+        self.change_detector = WellChangeDetector(self)
+        self.preload_mode = PRELOAD_MODE
+        self.preloader = WellPreloader(self)
+        self.cold_after_seconds = DEFAULT_COLD_AFTER_SECONDS
+        self.cold_codec = DEFAULT_COLD_CODEC
+        self.snapshot_path = DEFAULT_SNAPSHOT_FILE
+        self.snapshotter = CacheSnapshotter(self)
+        self._snapshot_signature: Optional[frozenset] = None
         
-    def index_well_files(self):
+    def index_well_files(self, force: bool = False) -> Dict[str, Any]:
         """
-        Index all .ptrc files in the workspace at startup.
-        Stores file paths in GLOBAL_FILE_INDEX without loading content.
+        Bring the persistent well file index up to date and load it into GLOBAL_FILE_INDEX.
+        Only 10-WELLS folders that changed since the last run are listed again.
+        
+        Args:
+            force: List every 10-WELLS folder again
+            
+        Returns:
+            Dictionary with indexing statistics
         """
-        print(f"[FileWellStorage] Indexing .ptrc files in {self.workspace_root}...")
+        logger.info(f"[FileWellStorage] Indexing .ptrc files in {self.workspace_root}...")
+        start = time.perf_counter()
         
-        # Find all .ptrc files in the workspace
-        pattern = str(self.workspace_root / "**" / "*.ptrc")
-        file_paths = glob.glob(pattern, recursive=True)
+        stats = self.index.scan_workspace(str(self.workspace_root), force=force)
         
-        for path in file_paths:
-            # Create a unique key from project and well name
-            # Example: "project/10-WELLS/well1.ptrc" -> "project::well1"
-            rel_path = Path(path).relative_to(self.workspace_root)
-            parts = rel_path.parts
-            
-            # Find the project folder (parent of 10-WELLS)
-            if "10-WELLS" in parts:
-                wells_index = parts.index("10-WELLS")
-                project_name = parts[wells_index - 1] if wells_index > 0 else "unknown"
-                well_filename = parts[-1].replace('.ptrc', '')
-                
-                # Key format: "project_name::well_name"
-                file_key = f"{project_name}::{well_filename}"
-                self.file_index[file_key] = path
+        self.file_index.clear()
+        for path, project_path, well_name in self.index.files():
+            self.file_index[f"{project_path}::{well_name}"] = path
+        
+        stats["seconds"] = round(time.perf_counter() - start, 3)
+        logger.info(f"[FileWellStorage] Indexed {len(self.file_index)} well files in {stats['seconds']}s "
+                  f"({stats['rescanned']}/{stats['wells_dirs']} wells folders rescanned)")
+        return stats
+    
+    def index_project(self, project_path: str, force: bool = False) -> bool:
+        """
+        Refresh the index of one project (cheap when its 10-WELLS folder is unchanged).
+        Also indexes projects outside the workspace root.
         
-        print(f"[FileWellStorage] Indexed {len(self.file_index)} well files.")
+        Returns:
+            True if the project's wells folder was listed again
+        """
+        if not self.index.refresh_project(project_path, force=force):
+            return False
         
-        # Print first few entries for debugging
-        if self.file_index:
-            sample_keys = list(self.file_index.keys())[:3]
-            for key in sample_keys:
-                print(f"  - {key} -> {self.file_index[key]}")
+        prefix = f"{project_id(project_path)}::"
+        with CACHE_LOCK:
+            for key in [key for key in self.file_index if key.startswith(prefix)]:
+                del self.file_index[key]
+            for path, indexed_project, well_name in self.index.files(project_path):
+                self.file_index[f"{indexed_project}::{well_name}"] = path
+        return True
     
     def get_file_key(self, project_path: str, well_id: str) -> str:
         """Generate file key from project path and well ID"""
-        project_name = os.path.basename(os.path.normpath(project_path))
-        return f"{project_name}::{well_id}"
+        return f"{project_id(project_path)}::{well_id}"
     
     def get_cached_well_data(self, project_path: str, well_id: str) -> Optional[Dict[str, Any]]:
         """
-        Get well data from cache only (NO disk access).
+        Get well data from cache only (no loading of wells that are not cached).
+        Cached wells are revalidated against their file fingerprint (one stat call)
+        and reloaded if the file changed on disk.
         Thread-safe implementation for concurrent access.
         
         Args:
@@ -106,17 +172,23 @@ class FileWellStorageService:
         file_key = self.get_file_key(project_path, well_id)
         
         with CACHE_LOCK:
-            if file_key in self.cache:
-                cache_entry = self.cache[file_key]
-                source = cache_entry.get("source", "unknown")
-                print(f"[FileWellStorage] Cache HIT for {file_key} (served from memory, {source})")
-                # Move to end to mark as most recently used (LRU logic)
-                self.cache.move_to_end(file_key)
-                return cache_entry["data"]
-        
-        print(f"[FileWellStorage] Cache MISS for {file_key} (cache-only mode)")
+            cache_entry = self.cache.lookup(file_key)
+        if cache_entry is not None:
+            data = self._revalidate(file_key, cache_entry)
+            if data is not None:
+                self._record_hit(file_key, cache_entry)
+                return data
+        
+        self.metrics.miss("cache_only")
+        _sampled_log.log(logging.DEBUG, "miss", "[FileWellStorage] Cache MISS for %s (cache-only mode)", file_key)
         return None
     
+    def _record_hit(self, file_key: str, entry: Dict[str, Any]):
+        source = entry.get("source", "unknown")
+        self.metrics.hit(source)
+        _sampled_log.log(logging.DEBUG, "hit", "[FileWellStorage] Cache HIT for %s (served from memory, %s)",
+                         file_key, source)
+    
     def load_well_data(self, project_path: str, well_id: str) -> Optional[Dict[str, Any]]:
         """
         Load well data with project-aware caching (eager or lazy).
@@ -130,65 +202,452 @@ class FileWellStorageService:
             Well data dictionary or None if not found
         """
         file_key = self.get_file_key(project_path, well_id)
-        project_name = os.path.basename(os.path.normpath(project_path))
         
-        # --- 1. Check Cache (Hit) - Thread-safe ---
+        # --- 1. Check Cache (Hit) - Thread-safe, revalidated against the file ---
+        with CACHE_LOCK:
+            cache_entry = self.cache.lookup(file_key)
+        if cache_entry is not None:
+            data = self._revalidate(file_key, cache_entry)
+            if data is not None:
+                self._record_hit(file_key, cache_entry)
+                return data
+        
+        # --- 2. Load Lazily (Miss), one load per key at a time ---
+        return self._load_single_flight(project_path, well_id, "lazy")
+    
+    def preload_well(self, project_path: str, well_id: str) -> bool:
+        """
+        Load a well into the cache unless it is cached already (no hit/miss accounting).
+        Used by the background preloader; shares in-flight loads with load_well_data.
+        
+        Returns:
+            True if the well is cached afterwards
+        """
+        with CACHE_LOCK:
+            if self.get_file_key(project_path, well_id) in self.cache:
+                return True
+        return self._load_single_flight(project_path, well_id, "preload") is not None
+    
+    def claim_load(self, file_key: str) -> Tuple[Optional[Future], bool]:
+        """
+        Single-flight registration of a load.
+        
+        Returns:
+            (future, True) if the caller must load the well and call finish_load,
+            (future, False) if a load is already in flight (wait on the future),
+            (None, False) if the well is cached
+        """
         with CACHE_LOCK:
+            future = INFLIGHT_LOADS.get(file_key)
+            if future is not None:
+                self.saved_loads += 1
+                return future, False
             if file_key in self.cache:
-                cache_entry = self.cache[file_key]
-                source = cache_entry.get("source", "unknown")
-                print(f"[FileWellStorage] Cache HIT for {file_key} (served from memory, {source})")
-                # Move to end to mark as most recently used (LRU logic)
-                self.cache.move_to_end(file_key)
-                return cache_entry["data"]
+                return None, False
+            future = Future()
+            INFLIGHT_LOADS[file_key] = future
+            return future, True
+    
+    def finish_load(self, file_key: str, future: Future, data: Optional[Dict[str, Any]]):
+        """Publish the result of a claimed load to the requests waiting on it."""
+        with CACHE_LOCK:
+            INFLIGHT_LOADS.pop(file_key, None)
+        future.set_result(data)
+    
+    def _load_single_flight(self, project_path: str, well_id: str, source: str) -> Optional[Dict[str, Any]]:
+        file_key = self.get_file_key(project_path, well_id)
+        future, leader = self.claim_load(file_key)
+        if future is None:
+            # A load finished between the lookup and now
+            with CACHE_LOCK:
+                entry = self.cache.get(file_key)
+            if entry is not None:
+                self.saved_loads += 1
+                return self._entry_data(file_key, entry)
+            return self._load_single_flight(project_path, well_id, source)
         
-        # --- 2. Load Lazily (Miss) ---
-        print(f"[FileWellStorage] Cache MISS for {file_key}, loading from disk...")
+        self.metrics.miss(source)
+        if not leader:
+            # Another request is already reading this well: wait for its result
+            _sampled_log.log(logging.DEBUG, "wait", "[FileWellStorage] Cache MISS for %s, waiting for in-flight load...", file_key)
+            self.metrics.wait_started(file_key)
+            start = time.perf_counter()
+            try:
+                return future.result()
+            finally:
+                self.metrics.wait_finished(file_key, time.perf_counter() - start)
         
-        # Check if file exists in index (read-only, no lock needed)
+        data = None
+        try:
+            data = self._load_missing_well(file_key, project_path, source)
+        finally:
+            self.finish_load(file_key, future, data)
+        return data
+    
+    def _load_missing_well(self, file_key: str, project_path: str, source: str) -> Optional[Dict[str, Any]]:
+        """Read an uncached well and put it into the cache (the single-flight leader of a load)."""
+        _sampled_log.log(logging.INFO, "miss", "[FileWellStorage] Cache MISS for %s, loading from disk...", file_key)
+        
+        # Check if file exists in index (read-only, no lock needed); the project may have new wells
+        if file_key not in self.file_index:
+            self.index_project(project_path)
         if file_key not in self.file_index:
-            print(f"[FileWellStorage] File not found in index: {file_key}")
+            logger.warning(f"[FileWellStorage] File not found in index: {file_key}")
             return None
         
         file_path = self.file_index[file_key]
         
         # Load the file (I/O outside lock to avoid blocking other requests)
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data, fingerprint = self._load_well_file_sync(file_path)
         except Exception as e:
-            print(f"[FileWellStorage] Error loading {file_path}: {e}")
+            logger.error(f"[FileWellStorage] Error loading {file_path}: {e}")
             return None
         
-        # --- 3. Update Cache & Smart Eviction (Thread-safe) ---
+        return self.store_loaded_well(file_key, data, source, project_id(project_path), file_path, fingerprint)
+    
+    def store_loaded_well(self, file_key: str, data: Dict[str, Any], source: str, project_key: str,
+                      file_path: str, fingerprint: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Put freshly read well data into the cache and return the cached data."""
         with CACHE_LOCK:
-            # Double-check cache after acquiring lock (another thread might have loaded it)
-            if file_key in self.cache:
-                print(f"[FileWellStorage] Another thread already cached {file_key}")
-                return self.cache[file_key]["data"]
+            # Double-check cache after acquiring lock (a save might have cached it meanwhile)
+            existing = self.cache.get(file_key)
+            if existing is None:
+                # Add newly loaded data to cache with metadata (evicts down to the byte budget)
+                self._put_entry(file_key, data, source, project_key, file_path, fingerprint)
+                return data
+        _sampled_log.log(logging.DEBUG, "race", "[FileWellStorage] Another thread already cached %s", file_key)
+        return self._entry_data(file_key, existing)
+    
+    def load_well_from_disk(self, project_path: str, well_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a well from disk and replace its cache entry, e.g. after a command rewrote the file.
+        
+        Args:
+            project_path: Path to the project directory
+            well_id: Well identifier (filename without extension)
             
-            # Count lazy-loaded entries
-            lazy_count = sum(1 for entry in self.cache.values() if entry.get("source") == "lazy")
+        Returns:
+            Well data dictionary or None if not found
+        """
+        file_key = self.get_file_key(project_path, well_id)
+        if file_key not in self.file_index:
+            self.index_project(project_path)
+        file_path = self.file_index.get(file_key) or os.path.join(project_path, WELLS_DIR_NAME, f"{well_id}.ptrc")
+        
+        try:
+            data, fingerprint = self._load_well_file_sync(file_path)
+        except Exception as e:
+            logger.error(f"[FileWellStorage] Error loading {file_path}: {e}")
+            return None
+        
+        self.file_index[file_key] = file_path
+        with CACHE_LOCK:
+            previous = self.cache.get(file_key)
+            self._put_entry(file_key, data, previous["source"] if previous else "lazy",
+                            project_id(project_path), file_path, fingerprint)
+            self._drop_derived_locked([file_key])
+        return data
+    
+    def invalidate_cached_well(self, project_path: str, well_id: str) -> bool:
+        """
+        Drop a well (and the values derived from it) from the cache.
+        
+        Returns:
+            True if the well was cached
+        """
+        file_key = self.get_file_key(project_path, well_id)
+        with CACHE_LOCK:
+            return self._invalidate_locked(file_key)
+    
+    def _invalidate_locked(self, file_key: str) -> bool:
+        """Drop a cache entry and its derived values (caller holds CACHE_LOCK)."""
+        self._drop_derived_locked([file_key])
+        if self.cache.pop(file_key) is None:
+            return False
+        self.invalidations += 1
+        logger.info(f"[FileWellStorage] Invalidated {file_key}")
+        return True
+    
+    def _put_entry(self, file_key: str, data: Dict[str, Any], source: str, project_key: str,
+                   file_path: Optional[str], fingerprint: Optional[Dict[str, Any]]):
+        """Insert a cache entry with its file fingerprint (caller holds CACHE_LOCK)."""
+        evicted = self.cache.put(file_key, {
+            "data": data,
+            "source": source,
+            "project": project_key,
+            "path": file_path,
+            "fingerprint": fingerprint
+        })
+        self._on_evicted(evicted)
+        _sampled_log.log(logging.DEBUG, "cached", "[FileWellStorage] Cached: %s (cache size: %d, %.1f/%.0f MB)",
+                         file_key, len(self.cache), self.cache.total_bytes / MB, self.cache.max_bytes / MB)
+    
+    def _entry_state(self, entry: Dict[str, Any]) -> str:
+        """
+        Compare a cache entry with its file: FRESH, CHANGED or MISSING.
+        A file with a new mtime but the same size and content hash is FRESH (its
+        fingerprint is updated); entries without a fingerprint are always FRESH.
+        """
+        fingerprint = entry.get("fingerprint")
+        file_path = entry.get("path")
+        if fingerprint is None or file_path is None:
+            return FRESH
+        
+        try:
+            current = file_fingerprint(file_path)
+        except OSError:
+            return MISSING
+        
+        if current["size"] == fingerprint["size"] and current["mtime_ns"] == fingerprint["mtime_ns"]:
+            return FRESH
+        
+        if fingerprint.get("content_hash") and current["size"] == fingerprint["size"]:
+            # Touched or rewritten with the same size: compare content before reloading
+            try:
+                content_hash = file_hash(file_path)
+            except OSError:
+                return MISSING
+            if content_hash == fingerprint["content_hash"]:
+                entry["fingerprint"] = {**current, "content_hash": content_hash}
+                return FRESH
+        
+        return CHANGED
+    
+    def _revalidate(self, file_key: str, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Serve a cache entry only if it still matches its file: stale entries are reloaded,
+        entries of deleted files are dropped.
+        
+        Returns:
+            Current well data, or None if the file is gone
+        """
+        state = self._entry_state(entry)
+        if state == FRESH:
+            return self._entry_data(file_key, entry)
+        
+        if state == MISSING:
+            with CACHE_LOCK:
+                self._invalidate_locked(file_key)
+            self.file_index.pop(file_key, None)
+            return None
+        
+        logger.info(f"[FileWellStorage] {file_key} changed on disk, reloading...")
+        return self._reload_entry(file_key, entry)
+    
+    def _reload_entry(self, file_key: str, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Reload a stale entry from its file, keeping its source and project."""
+        try:
+            data, fingerprint = self._load_well_file_sync(entry["path"])
+        except Exception as e:
+            logger.error(f"[FileWellStorage] Error reloading {entry['path']}: {e}")
+            with CACHE_LOCK:
+                self._invalidate_locked(file_key)
+            return None
+        
+        with CACHE_LOCK:
+            current = self.cache.get(file_key)
+            if current is None or current is entry:
+                self._drop_derived_locked([file_key])
+                self._put_entry(file_key, data, entry.get("source", "lazy"), entry["project"], entry["path"], fingerprint)
+                self.stale_reloads += 1
+                return data
+        # Replaced meanwhile (saved or reloaded by another request)
+        return self._entry_data(file_key, current)
+    
+    def _entry_data(self, file_key: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decoded well data of a cache entry; cold entries are decompressed and moved
+        back to the hot tier (caller must not hold CACHE_LOCK).
+        """
+        data = entry["data"]
+        if data is not None:
+            return data
+        frozen = entry.get("frozen")
+        if frozen is None:
+            # Thawed by another request between the two reads
+            return entry["data"]
+        
+        start = time.perf_counter()
+        data = thaw_well(frozen)
+        seconds = time.perf_counter() - start
+        with CACHE_LOCK:
+            if self.cache.get(file_key) is entry and entry.get("frozen") is frozen:
+                self._on_evicted(self.cache.thaw(file_key, data, seconds))
+            elif entry["data"] is not None:
+                # Another request thawed it first: serve the same dictionary
+                data = entry["data"]
+        _sampled_log.log(logging.DEBUG, "thaw", "[FileWellStorage] Thawed %s from the cold tier in %.1f ms",
+                         file_key, seconds * 1000)
+        return data
+    
+    def compress_idle_wells(self, idle_seconds: Optional[float] = None, codec: Optional[str] = None) -> List[str]:
+        """
+        Move wells that were not used for idle_seconds to the compressed cold tier.
+        Compression runs outside the lock; a well used or replaced meanwhile stays hot.
+        Wells without a block encoding, or that do not get smaller, stay hot as well.
+        
+        Args:
+            idle_seconds: Idle time before compression (defaults to cold_after_seconds, 0 disables)
+            codec: "zlib" (fast) or "lzma" (smaller, slower; defaults to cold_codec)
             
-            # Evict if too many lazy entries (protect preloaded/active project entries)
-            if lazy_count >= LAZY_CACHE_SIZE:
-                # Find and evict oldest lazy entry
-                for key in list(self.cache.keys()):
-                    entry = self.cache[key]
-                    if entry.get("source") == "lazy" and entry.get("project") != ACTIVE_PROJECT:
-                        del self.cache[key]
-                        print(f"[FileWellStorage] Evicting lazy entry: {key}")
-                        break
+        Returns:
+            Cache keys of the compressed wells
+        """
+        idle_seconds = self.cold_after_seconds if idle_seconds is None else idle_seconds
+        if idle_seconds <= 0:
+            return []
+        with CACHE_LOCK:
+            candidates = [(key, self.cache.get(key)) for key in self.cache.idle_keys(idle_seconds)]
+            candidates = [(key, entry, entry["data"], entry["last_access"]) for key, entry in candidates]
+        
+        compressed = []
+        for file_key, entry, data, last_access in candidates:
+            start = time.perf_counter()
+            frozen = freeze_well(data, codec or self.cold_codec)
+            seconds = time.perf_counter() - start
+            if frozen is None or frozen_size(frozen) >= entry["bytes"]:
+                continue
+            with CACHE_LOCK:
+                if (self.cache.get(file_key) is not entry or entry["data"] is not data
+                        or entry["last_access"] != last_access):
+                    continue
+                self.cache.freeze(file_key, frozen, seconds)
+                # Derived values hold a reference to the decoded data
+                self._drop_derived_locked([file_key])
+            compressed.append(file_key)
+        
+        if compressed:
+            logger.info(f"[FileWellStorage] Compressed {len(compressed)} idle well(s) into the cold tier")
+        return compressed
+    
+    def revalidate_cached_wells(self, reload_projects: Optional[set] = None) -> Dict[str, List[str]]:
+        """
+        Check every cached well against its file (used by the background change detector).
+        Changed wells of reload_projects (default: the active project) are reloaded,
+        other changed wells and wells whose file is gone are invalidated.
+        
+        Returns:
+            Dictionary with reloaded and invalidated cache keys
+        """
+        if reload_projects is None:
+            reload_projects = {ACTIVE_PROJECT} if ACTIVE_PROJECT else set()
+        
+        with CACHE_LOCK:
+            entries = self.cache.items()
+        
+        reloaded, invalidated = [], []
+        for file_key, entry in entries:
+            state = self._entry_state(entry)
+            if state == FRESH:
+                continue
+            if state == CHANGED and entry.get("project") in reload_projects:
+                if self._reload_entry(file_key, entry) is not None:
+                    reloaded.append(file_key)
+                    continue
+            with CACHE_LOCK:
+                if self.cache.get(file_key) is entry:
+                    self._invalidate_locked(file_key)
+                    invalidated.append(file_key)
+        
+        return {"reloaded": reloaded, "invalidated": invalidated}
+    
+    def get_merged_dataframe(self, project_path: str, well_id: str,
+                             dataset_names: Optional[List[str]] = None,
+                             well_data: Optional[Dict[str, Any]] = None) -> Optional[pd.DataFrame]:
+        """
+        Get the depth-aligned merge of a well's datasets (Well.to_dataframe), cached per well revision.
+        Cache-only like get_cached_well_data. The returned frame is shared and must be treated as read-only.
+        
+        Args:
+            project_path: Path to the project directory
+            well_id: Well identifier (filename without extension)
+            dataset_names: Datasets to merge (None for all datasets)
+            well_data: Cached well dictionary if the caller already fetched it
             
-            # Add newly loaded data to cache with metadata
-            self.cache[file_key] = {
-                "data": data,
-                "source": "lazy",
-                "project": project_name
-            }
-            print(f"[FileWellStorage] Cached: {file_key} (cache size: {len(self.cache)}, lazy: {lazy_count + 1})")
+        Returns:
+            Merged DataFrame indexed by depth, or None if the well is not cached
+        """
+        params = tuple(dataset_names) if dataset_names is not None else None
         
-        return data
+        def build(well_data: Dict[str, Any]) -> pd.DataFrame:
+            frame = LazyWell(well_data).to_dataframe(dataset_names)
+            logger.debug(f"[FileWellStorage] Merged {len(frame.columns)} logs on {len(frame)} depths for {well_id}")
+            return frame
+        
+        return self._get_derived(project_path, well_id, "merged_frame", params, build, well_data)
+    
+    def get_trajectory(self, project_path: str, well_id: str,
+                       well_data: Optional[Dict[str, Any]] = None) -> Optional[TrajectoryTable]:
+        """
+        Get the MD->TVD/TVDSS table of a well, cached per well revision.
+        Cache-only like get_cached_well_data.
+        
+        Args:
+            project_path: Path to the project directory
+            well_id: Well identifier (filename without extension)
+            well_data: Cached well dictionary if the caller already fetched it
+            
+        Returns:
+            TrajectoryTable, or None if the well is not cached or has no survey
+        """
+        return self._get_derived(project_path, well_id, "trajectory", None,
+                                 lambda data: TrajectoryTable.from_well(LazyWell(data)), well_data)
+    
+    def _get_derived(self, project_path: str, well_id: str, kind: str, params: Any,
+                     build: Callable[[Dict[str, Any]], Any], well_data: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Get a value derived from the cached well data, building it on first use per well revision.
+        
+        Returns:
+            The derived value, or None if the well is not cached
+        """
+        if well_data is None:
+            well_data = self.get_cached_well_data(project_path, well_id)
+            if well_data is None:
+                return None
+        
+        file_key = self.get_file_key(project_path, well_id)
+        derived_key = (file_key, kind, params)
+        
+        with CACHE_LOCK:
+            entry = DERIVED_CACHE.get(derived_key)
+            if entry is not None and entry[0] is well_data:
+                DERIVED_CACHE.move_to_end(derived_key)
+                return entry[1]
+        
+        value = build(well_data)
+        
+        with CACHE_LOCK:
+            # Values built from an older revision of this well are stale
+            for key in [key for key, (data, _) in DERIVED_CACHE.items()
+                        if key[0] == file_key and data is not well_data]:
+                del DERIVED_CACHE[key]
+            DERIVED_CACHE[derived_key] = (well_data, value)
+            while len(DERIVED_CACHE) > MAX_DERIVED_ENTRIES:
+                DERIVED_CACHE.popitem(last=False)
+        
+        return value
+    
+    def _drop_derived(self, file_keys: List[str]):
+        """Remove derived values of the given wells."""
+        with CACHE_LOCK:
+            self._drop_derived_locked(file_keys)
+    
+    def _drop_derived_locked(self, file_keys: List[str]):
+        """Remove derived values of the given wells (caller holds CACHE_LOCK)."""
+        if not file_keys or not DERIVED_CACHE:
+            return
+        file_keys = set(file_keys)
+        for key in [key for key in DERIVED_CACHE if key[0] in file_keys]:
+            del DERIVED_CACHE[key]
+    
+    def _on_evicted(self, evicted: List[str]):
+        """Log evictions and drop values derived from evicted wells (caller holds CACHE_LOCK)."""
+        for key in evicted:
+            _sampled_log.log(logging.INFO, "evict", "[FileWellStorage] Evicting: %s", key)
+        # Derived values hold a reference to the well data and would keep it alive
+        self._drop_derived_locked(evicted)
     
     def save_well_data(self, well_data: Dict[str, Any], project_path: str) -> bool:
         """
@@ -204,7 +663,7 @@ class FileWellStorageService:
         try:
             well_name = well_data.get("name")
             if not well_name:
-                print("[FileWellStorage] Error: well data missing 'name' field")
+                logger.error("[FileWellStorage] Error: well data missing 'name' field")
                 return False
             
             # Ensure 10-WELLS directory exists
@@ -213,47 +672,41 @@ class FileWellStorageService:
             
             # Write to .ptrc file
             file_path = os.path.join(wells_dir, f"{well_name}.ptrc")
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(well_data, f, indent=2)
-            
-            print(f"[FileWellStorage] Saved well to {file_path}")
+            write_well_file(file_path, well_data, indent=2)
             
-            # Update cache
-            file_key = self.get_file_key(project_path, well_name)
-            
-            # Update index if this is a new file
-            if file_key not in self.file_index:
-                self.file_index[file_key] = file_path
-            
-            # Update cache (or add if not present)
-            project_name = os.path.basename(os.path.normpath(project_path))
-            
-            if file_key in self.cache:
-                # Move to end since it was just modified
-                self.cache.move_to_end(file_key)
-                # Update the data but keep existing source metadata
-                self.cache[file_key]["data"] = well_data
-            else:
-                # Need to add to cache
-                if len(self.cache) >= MAX_CACHE_SIZE:
-                    # Need to evict oldest
-                    oldest_key, _ = self.cache.popitem(last=False)
-                    print(f"[FileWellStorage] Cache full. Evicting: {oldest_key}")
-                
-                self.cache[file_key] = {
-                    "data": well_data,
-                    "source": "saved",
-                    "project": project_name
-                }
+            logger.info(f"[FileWellStorage] Saved well to {file_path}")
             
+            self.update_cached_well(project_path, well_name, well_data, file_path)
             return True
             
         except Exception as e:
-            print(f"[FileWellStorage] Error saving well data: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"[FileWellStorage] Error saving well data: {e}")
             return False
     
+    def update_cached_well(self, project_path: str, well_id: str, well_data: Dict[str, Any],
+                           file_path: Optional[str] = None):
+        """
+        Put freshly written well data into the cache and the file index.
+        
+        Args:
+            project_path: Path to the project directory
+            well_id: Well identifier (filename without extension)
+            well_data: Well data dictionary that was just written
+            file_path: Path of the written .ptrc file (defaults to the project's 10-WELLS folder)
+        """
+        file_key = self.get_file_key(project_path, well_id)
+        file_path = file_path or os.path.join(project_path, WELLS_DIR_NAME, f"{well_id}.ptrc")
+        
+        # Update index (new file, or new size/mtime/hash/summary)
+        self.file_index[file_key] = file_path
+        fingerprint = self.index.record_file(file_path, well_data)
+        
+        with CACHE_LOCK:
+            # Replace the data but keep existing source metadata; the size is estimated again
+            previous = self.cache.get(file_key)
+            self._put_entry(file_key, well_data, previous["source"] if previous else "saved",
+                            project_id(project_path), file_path, fingerprint)
+    
     def list_wells_in_project(self, project_path: str) -> List[str]:
         """
         List all well files in a project.
@@ -264,25 +717,9 @@ class FileWellStorageService:
         Returns:
             List of well IDs (filenames without extension)
         """
-        project_name = os.path.basename(os.path.normpath(project_path))
-        wells = []
-        
-        # Search index for wells in this project
-        for key in self.file_index.keys():
-            if key.startswith(f"{project_name}::"):
-                well_id = key.split("::", 1)[1]
-                wells.append(well_id)
-        
-        # Also check filesystem directly (in case index is stale)
-        wells_dir = os.path.join(project_path, "10-WELLS")
-        if os.path.exists(wells_dir):
-            for filename in os.listdir(wells_dir):
-                if filename.endswith('.ptrc'):
-                    well_id = filename.replace('.ptrc', '')
-                    if well_id not in wells:
-                        wells.append(well_id)
-        
-        return sorted(wells)
+        # The 10-WELLS folder is only listed again if it changed since the last refresh
+        self.index_project(project_path)
+        return sorted(well_name for _, _, well_name in self.index.files(project_path))
     
     def delete_well(self, project_path: str, well_id: str) -> bool:
         """
@@ -299,9 +736,10 @@ class FileWellStorageService:
             file_key = self.get_file_key(project_path, well_id)
             
             # Remove from cache
-            if file_key in self.cache:
-                del self.cache[file_key]
-                print(f"[FileWellStorage] Removed {file_key} from cache")
+            with CACHE_LOCK:
+                if self.cache.pop(file_key) is not None:
+                    logger.info(f"[FileWellStorage] Removed {file_key} from cache")
+            self._drop_derived([file_key])
             
             # Get file path and delete file
             if file_key in self.file_index:
@@ -310,27 +748,102 @@ class FileWellStorageService:
             else:
                 file_path = os.path.join(project_path, "10-WELLS", f"{well_id}.ptrc")
             
+            self.index.remove_file(file_path)
+            self.revisions.mark_deleted(file_path)
+            
             if os.path.exists(file_path):
                 os.remove(file_path)
-                print(f"[FileWellStorage] Deleted well file: {file_path}")
+                logger.info(f"[FileWellStorage] Deleted well file: {file_path}")
                 return True
             else:
-                print(f"[FileWellStorage] Well file not found: {file_path}")
+                logger.warning(f"[FileWellStorage] Well file not found: {file_path}")
                 return False
                 
         except Exception as e:
-            print(f"[FileWellStorage] Error deleting well: {e}")
+            logger.error(f"[FileWellStorage] Error deleting well: {e}")
             return False
     
-    async def preload_project(self, project_path: str, max_concurrent: int = 10) -> Dict[str, Any]:
+    def well_revision(self, project_path: str, well_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Current revision of a well (see WellRevisionStore.get()).
+        Answered with one stat call while the file is unchanged; files changed
+        behind the server's back are loaded (through the cache) and recorded again.
+        
+        Returns:
+            The revision row, or None if the well file does not exist
+        """
+        file_key = self.get_file_key(project_path, well_id)
+        file_path = self.file_index.get(file_key) or os.path.join(project_path, WELLS_DIR_NAME, f"{well_id}.ptrc")
+        
+        row = self.revisions.current(file_path)
+        if row is not None:
+            return row
+        try:
+            # Taken before the load: a change during the load leaves the row stale, not wrong
+            fingerprint = file_fingerprint(file_path)
+        except OSError:
+            self.revisions.mark_deleted(file_path)
+            return None
+        well_data = self.load_well_data(project_path, well_id)
+        if well_data is None:
+            return None
+        return self.revisions.record(file_path, well_data, fingerprint)
+    
+    def project_revisions(self, project_path: str) -> List[Dict[str, Any]]:
+        """
+        Revisions of all wells of a project, sorted by well name. Wells deleted
+        since they were recorded are included with deleted set.
         """
-        EAGER LOADING: Preload all wells from a project into memory at startup.
+        self.index_project(project_path)
+        wells = {well_name for _, _, well_name in self.index.files(project_path)}
+        for row in self.revisions.project_rows(project_path):
+            if row["well_name"] not in wells:
+                self.revisions.mark_deleted(row["path"])
+        for well_name in wells:
+            self.well_revision(project_path, well_name)
+        return self.revisions.project_rows(project_path)
+    
+    def project_revision_tag(self, project_path: str) -> Dict[str, Any]:
+        """
+        Validator of a project's well list without loading any well: a fingerprint
+        over the revision of every well (file size and mtime for wells without a
+        current revision yet).
         
-        Uses asyncio.to_thread to prevent blocking the event loop during file I/O.
+        Returns:
+            {"revision": latest well revision, "fingerprint": ..., "modified": latest change (unix time)}
+        """
+        self.index_project(project_path)
+        digest = hashlib.blake2b(digest_size=16)
+        revision, modified = 0, 0.0
+        for path, _, well_name in sorted(self.index.files(project_path), key=lambda item: item[2]):
+            row = self.revisions.current(path)
+            if row is not None:
+                token = f"{well_name}:r{row['revision']}"
+                revision = max(revision, row["revision"])
+                modified = max(modified, row["modified"])
+            else:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                token = f"{well_name}:{stat.st_size}:{stat.st_mtime_ns}"
+                modified = max(modified, stat.st_mtime)
+            digest.update(f"{token};".encode("utf-8"))
+        return {"revision": revision, "fingerprint": digest.hexdigest(), "modified": modified}
+    
+    async def preload_project(self, project_path: str, max_concurrent: int = 10,
+                              mode: Optional[str] = None) -> Dict[str, Any]:
+        """
+        EAGER LOADING: Preload all wells from a project into memory and wait until done.
+        
+        Runs a WellPreloader job (active and selected wells first); use
+        self.preloader.start() to preload in the background without waiting.
         
         Args:
             project_path: Path to the project directory
             max_concurrent: Maximum concurrent file loads (default: 10)
+            mode: PRELOAD_THREAD or PRELOAD_PROCESS (parse in worker processes, capped
+                  at the CPU count); defaults to PRELOAD_MODE
             
         Returns:
             Dictionary with preload statistics
@@ -338,8 +851,9 @@ class FileWellStorageService:
         project_name = os.path.basename(os.path.normpath(project_path))
         
         # Check if already preloaded
-        if project_name in PRELOADED_PROJECTS:
-            print(f"[FileWellStorage] Project '{project_name}' already preloaded, skipping...")
+        if project_id(project_path) in PRELOADED_PROJECTS:
+            logger.info(f"[FileWellStorage] Project '{project_name}' already preloaded, skipping...")
+            self.set_active_project(project_path)
             return {
                 "project": project_name,
                 "already_loaded": True,
@@ -348,79 +862,72 @@ class FileWellStorageService:
                 "failed_wells": []
             }
         
-        print(f"[FileWellStorage] EAGER LOADING: Preloading all wells for project '{project_name}'...")
-        
-        # Find all wells for this project
-        wells_to_load = []
-        for key, file_path in self.file_index.items():
-            if key.startswith(f"{project_name}::"):
-                wells_to_load.append((key, file_path))
-        
-        if not wells_to_load:
-            print(f"[FileWellStorage] No wells found for project '{project_name}'")
-            PRELOADED_PROJECTS.add(project_name)
-            return {
-                "project": project_name,
-                "total_wells": 0,
-                "loaded_wells": 0,
-                "failed_wells": []
-            }
+        logger.info(f"[FileWellStorage] EAGER LOADING: Preloading all wells for project '{project_name}'...")
+        job = self.preloader.start(project_path, mode=mode, workers=max_concurrent)
+        await asyncio.to_thread(job.wait)
+        status = job.status()
         
-        # Use semaphore to limit concurrent I/O operations
-        semaphore = asyncio.Semaphore(max_concurrent)
-        loaded_count = 0
-        failed_wells = []
-        
-        async def load_well_async(file_key: str, file_path: str) -> Tuple[str, bool, Optional[Dict]]:
-            """Load a single well file asynchronously"""
-            async with semaphore:
-                try:
-                    # Use asyncio.to_thread to run blocking I/O in thread pool
-                    data = await asyncio.to_thread(self._load_well_file_sync, file_path)
-                    return (file_key, True, data)
-                except Exception as e:
-                    print(f"[FileWellStorage] Failed to preload {file_key}: {e}")
-                    return (file_key, False, None)
-        
-        # Load all wells concurrently
-        tasks = [load_well_async(key, path) for key, path in wells_to_load]
-        results = await asyncio.gather(*tasks)
-        
-        # Process results and update cache
-        # NO EVICTION during preload - allow cache to grow for active project
-        for file_key, success, data in results:
-            if success and data:
-                self.cache[file_key] = {
-                    "data": data,
-                    "source": "preload",
-                    "project": project_name
-                }
-                loaded_count += 1
-            else:
-                failed_wells.append(file_key)
-        
-        # Mark project as preloaded and active
-        PRELOADED_PROJECTS.add(project_name)
-        global ACTIVE_PROJECT
-        ACTIVE_PROJECT = project_name
-        
-        print(f"[FileWellStorage] Preloaded {loaded_count}/{len(wells_to_load)} wells for project '{project_name}'")
-        print(f"[FileWellStorage] Cache now contains {len(self.cache)} wells (active project protected)")
+        logger.info(f"[FileWellStorage] Preloaded {status['loaded_wells']}/{status['total_wells']} wells for project '{project_name}'")
+        logger.info(f"[FileWellStorage] Cache now contains {len(self.cache)} wells, "
+                  f"{self.cache.total_bytes / MB:.1f} MB (active project protected)")
         
         return {
             "project": project_name,
-            "total_wells": len(wells_to_load),
-            "loaded_wells": loaded_count,
-            "failed_wells": failed_wells
+            "total_wells": status["total_wells"],
+            "loaded_wells": status["loaded_wells"],
+            "failed_wells": status["failed_wells"]
         }
     
-    def _load_well_file_sync(self, file_path: str) -> Dict[str, Any]:
+    def set_active_project(self, project_path: str):
+        """Make a project the active one: its cached wells get the protected active capacity."""
+        global ACTIVE_PROJECT
+        project_key = project_id(project_path)
+        with CACHE_LOCK:
+            ACTIVE_PROJECT = project_key
+            self._on_evicted(self.cache.set_active_project(project_key))
+    
+    def mark_preloaded(self, project_path: str):
+        """Record that every well of a project was preloaded."""
+        PRELOADED_PROJECTS.add(project_id(project_path))
+    
+    def _load_well_file_sync(self, file_path: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Synchronous file loading helper for asyncio.to_thread.
-        Reads and parses JSON from disk.
+        Reads and decodes a .ptrc file (JSON or binary v2) from disk and records
+        its current fingerprint and summary in the file index.
+        
+        Returns:
+            Tuple of (well data, file fingerprint taken before the read; with the
+            content hash of the bytes read unless the file changed during the read)
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        fingerprint = file_fingerprint(file_path)
+        start = time.perf_counter()
+        raw = read_well_bytes(file_path)
+        read_done = time.perf_counter()
+        # Numeric columns are cached as float64 arrays, not lists of Python floats
+        data = parse_well_bytes(raw, arrays=True)
+        self.metrics.observe_load(read_done - start, time.perf_counter() - read_done)
+        # Hashed from the bytes already in memory: the file is read once per load
+        fingerprint = read_fingerprint(file_path, fingerprint, raw)
+        self.index.record_file(file_path, data, fingerprint=fingerprint)
+        return data, fingerprint
+    
+    def convert_project_format(self, project_path: str, fmt: str = FORMAT_V2) -> Dict[str, Any]:
+        """
+        Rewrite all .ptrc files of a project in place using the given format.
+        Cached well data stays valid since the content does not change.
+        
+        Args:
+            project_path: Path to the project directory
+            fmt: Target format ("v2" binary or "json")
+            
+        Returns:
+            Dictionary with converted, skipped and failed wells
+        """
+        stats = convert_project_wells(project_path, fmt)
+        logger.info(f"[FileWellStorage] Converted {len(stats['converted'])} wells to '{fmt}' "
+                  f"({len(stats['skipped'])} skipped, {len(stats['failed'])} failed)")
+        return stats
     
     def clear_project_cache(self, project_path: str) -> int:
         """
@@ -431,29 +938,135 @@ class FileWellStorageService:
             Number of cache entries cleared
         """
         project_name = os.path.basename(os.path.normpath(project_path))
-        keys_to_remove = [
-            key for key in self.cache.keys()
-            if self.cache[key].get("project") == project_name
-        ]
-        
-        for key in keys_to_remove:
-            del self.cache[key]
+        project_key = project_id(project_path)
+        with CACHE_LOCK:
+            keys_to_remove = [key for key, entry in self.cache.items() if entry.get("project") == project_key]
+            for key in keys_to_remove:
+                self.cache.pop(key)
+            self._drop_derived_locked(keys_to_remove)
         
         # Remove from preloaded set
-        PRELOADED_PROJECTS.discard(project_name)
+        PRELOADED_PROJECTS.discard(project_key)
         
-        print(f"[FileWellStorage] Cleared {len(keys_to_remove)} wells from cache for project '{project_name}'")
+        logger.info(f"[FileWellStorage] Cleared {len(keys_to_remove)} wells from cache for project '{project_name}'")
         return len(keys_to_remove)
     
+    def save_cache_snapshot(self, path: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
+        """
+        Write the cached wells to the warm-start snapshot (see well_cache_snapshot).
+        Only wells with a file fingerprint are written, since restoring validates against it.
+        
+        Args:
+            path: Snapshot file (defaults to snapshot_path)
+            force: Write even if the cached wells did not change since the last snapshot
+            
+        Returns:
+            Dictionary with written (False if skipped), wells, skipped, bytes and seconds
+        """
+        entries = self._snapshot_entries()
+        signature = _snapshot_signature(entries)
+        if not force and signature == self._snapshot_signature:
+            return {"written": False, "wells": len(entries)}
+        
+        start = time.perf_counter()
+        result = write_snapshot(path or self.snapshot_path, entries)
+        self._snapshot_signature = signature
+        result.update(written=True, seconds=round(time.perf_counter() - start, 3))
+        logger.info(f"[FileWellStorage] Cache snapshot: {result['wells']} wells, "
+                  f"{result['bytes'] / MB:.1f} MB in {result['seconds']:.2f}s")
+        return result
+    
+    def restore_cache_snapshot(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Warm the cache from the snapshot written by save_cache_snapshot. Wells whose
+        file no longer matches the snapshot fingerprint (or that are not indexed any
+        more) are skipped and loaded again from their files by the preloader.
+        
+        Args:
+            path: Snapshot file (defaults to snapshot_path)
+            
+        Returns:
+            Dictionary with restored and stale cache keys and seconds
+        """
+        path = path or self.snapshot_path
+        restored, stale = [], []
+        if not os.path.exists(path):
+            return {"restored": restored, "stale": stale, "seconds": 0.0}
+        
+        start = time.perf_counter()
+        try:
+            snapshot = CacheSnapshot(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"[FileWellStorage] Ignoring unreadable cache snapshot {path}: {e}")
+            return {"restored": restored, "stale": stale, "seconds": 0.0}
+        
+        with snapshot:
+            for record in snapshot.entries:
+                file_key = record["key"]
+                if self.file_index.get(file_key) != record["path"] or self._entry_state(record) != FRESH:
+                    stale.append(file_key)
+                    continue
+                data, frozen = snapshot.load(record)
+                entry = {field: record[field] for field in ("source", "project", "path", "fingerprint")}
+                with CACHE_LOCK:
+                    if file_key in self.cache:
+                        continue
+                    if frozen is None:
+                        evicted = self.cache.put(file_key, {**entry, "data": data})
+                    else:
+                        evicted = self.cache.put(file_key, {**entry, "data": None, "frozen": frozen},
+                                                 size=frozen_size(frozen))
+                    self._on_evicted(evicted)
+                restored.append(file_key)
+        
+        # Restored wells match the files, so the next snapshot is only written once something changes
+        self._snapshot_signature = _snapshot_signature(self._snapshot_entries())
+        seconds = time.perf_counter() - start
+        logger.info(f"[FileWellStorage] Restored {len(restored)} wells from the cache snapshot in {seconds:.2f}s "
+                  f"({len(stale)} stale)")
+        return {"restored": restored, "stale": stale, "seconds": round(seconds, 3)}
+    
+    def _snapshot_entries(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Copies of the cache entries that can be snapshotted (they have a file fingerprint)."""
+        with CACHE_LOCK:
+            return [(key, dict(entry)) for key, entry in self.cache.items()
+                    if entry.get("fingerprint") is not None and entry.get("path")]
+    
+    def resident_bytes_by_project(self) -> Dict[str, Dict[str, int]]:
+        """Estimated bytes of cached wells per project id, split into hot and cold tier."""
+        resident: Dict[str, Dict[str, int]] = {}
+        with CACHE_LOCK:
+            for entry in self.cache.values():
+                tiers = resident.setdefault(entry.get("project") or "unknown", {"hot": 0, "cold": 0})
+                tiers["cold" if entry.get("frozen") is not None else "hot"] += entry["bytes"]
+        return resident
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics for monitoring"""
-        return {
-            "cache_size": len(self.cache),
-            "max_cache_size": MAX_CACHE_SIZE,
-            "indexed_files": len(self.file_index),
-            "cached_wells": list(self.cache.keys()),
-            "preloaded_projects": list(PRELOADED_PROJECTS)
-        }
+        with CACHE_LOCK:
+            return {
+                "cache_size": len(self.cache),
+                "indexed_files": len(self.file_index),
+                "cached_wells": self.cache.keys(),
+                "derived_entries": len(DERIVED_CACHE),
+                "preloaded_projects": list(PRELOADED_PROJECTS),
+                "active_project": ACTIVE_PROJECT,
+                "stale_reloads": self.stale_reloads,
+                "invalidations": self.invalidations,
+                "saved_loads": self.saved_loads,
+                "inflight_loads": len(INFLIGHT_LOADS),
+                "change_detector": self.change_detector.stats(),
+                "catalog": self.catalog.stats(),
+                "preload": self.preloader.status(),
+                "snapshot": self.snapshotter.stats(),
+                "metrics": self.metrics.stats(),
+                **self.cache.stats()
+            }
+
+
+def _snapshot_signature(entries: List[Tuple[str, Dict[str, Any]]]) -> frozenset:
+    """Cache keys with their file size and mtime: unchanged signature, unchanged snapshot."""
+    return frozenset((key, entry["fingerprint"]["size"], entry["fingerprint"]["mtime_ns"]) for key, entry in entries)
 
 
 # Global instance (will be initialized at startup)
@@ -467,6 +1080,20 @@ def get_file_well_storage() -> FileWellStorageService:
     return file_well_storage
 
 
+def _record_written_well(file_path: str, well_data: Dict[str, Any]):
+    """
+    Write listener: bump the revision of every well file written in this process.
+    A no-op in child processes, which inherit the store but not a usable connection.
+    """
+    if file_well_storage is None or file_well_storage.revisions.owner_pid != os.getpid():
+        return
+    if file_path.endswith(".ptrc"):
+        file_well_storage.revisions.record(file_path, well_data)
+
+
+add_write_listener(_record_written_well)
+
+
 def initialize_file_well_storage(workspace_root: str):
     """Initialize the global file well storage service"""
     global file_well_storage
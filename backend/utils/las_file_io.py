@@ -92,15 +92,13 @@ def read_las_file(filename: str) -> List[Dataset]:
         raise ValueError(f"LAS file must contain a depth column (DEPT or DEPTH)")
     
     index_name = found_index[0]
-    index_log = df[index_name].tolist()
-    index_log = [None if (isinstance(v, float) and math.isnan(v)) else v for v in index_log]
+    index_log = df[index_name].to_numpy()
     
     interp = "CONTINUOUS"
     logs = []
     
     for col_index, column in enumerate(df.columns):
-        log_values = df.iloc[:, col_index].tolist()
-        log_values = [None if (isinstance(v, float) and math.isnan(v)) else v for v in log_values]
+        log_values = df.iloc[:, col_index].to_numpy()
         log_type = 'float'
         
         well_log = WellLog(
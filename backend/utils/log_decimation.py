@@ -0,0 +1,163 @@
+"""
+Shape-preserving decimation of log curves for display.
+
+A log plot only has a few hundred to a few thousand pixels along the depth
+axis, so sending every sample of a depth window is wasted bandwidth. The
+functions here pick the sample positions to keep:
+
+- minmax: the window is cut into equal-depth buckets (one per pixel pair) and
+  the minimum and maximum of every bucket are kept, so spikes and the envelope
+  of the curve survive exactly. Buckets without any valid sample keep one
+  missing sample, so gaps in the curve still break the plotted line.
+- lttb: Largest-Triangle-Three-Buckets keeps the sample that spans the largest
+  triangle with its neighbours in every bucket, which follows the visual shape
+  of smooth curves with fewer points. Missing-value gaps wider than a bucket
+  are kept as one missing sample each.
+- String logs keep the first sample of every run of equal values (zone tops),
+  falling back to the first sample per bucket when there are more runs than points.
+
+All functions expect depths sorted ascending and return sorted positions.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from utils.fe_data_objects import run_length_segments
+
+
+DECIMATE_MINMAX = "minmax"
+DECIMATE_LTTB = "lttb"
+DECIMATION_METHODS = (DECIMATE_MINMAX, DECIMATE_LTTB)
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+def _bucket_starts(depths: np.ndarray, n_buckets: int) -> np.ndarray:
+    """Start positions of the non-empty equal-depth buckets between the first and last depth."""
+    edges = np.linspace(depths[0], depths[-1], n_buckets + 1)[:-1]
+    return np.unique(np.searchsorted(depths, edges, side="left"))
+
+
+def minmax_indices(depths: np.ndarray, values: np.ndarray, n_buckets: int) -> np.ndarray:
+    """
+    Positions of the minimum and maximum sample of every equal-depth bucket.
+
+    Returns:
+        At most 2 * n_buckets sorted positions
+    """
+    n = len(values)
+    if n == 0:
+        return _EMPTY
+    starts = _bucket_starts(depths, max(1, n_buckets))
+    sizes = np.diff(np.append(starts, n))
+    bucket = np.repeat(np.arange(len(starts)), sizes)
+
+    # Sorted by bucket, then value; NaN sorts last within its bucket
+    order = np.lexsort((values, bucket))
+    n_valid = np.add.reduceat(np.isfinite(values).astype(np.intp), starts)
+    has_valid = n_valid > 0
+    lows = order[starts[has_valid]]
+    highs = order[starts[has_valid] + n_valid[has_valid] - 1]
+
+    # One missing sample per run of empty buckets keeps the gap visible
+    after_valid = np.concatenate(([True], has_valid[:-1]))
+    gaps = starts[~has_valid & after_valid]
+    return np.unique(np.concatenate((lows, highs, gaps)))
+
+
+def _gap_markers(depths: np.ndarray, values: np.ndarray, min_width: float, limit: int) -> np.ndarray:
+    """First positions of the widest missing-value runs that are at least min_width deep."""
+    missing = ~np.isfinite(values)
+    if limit <= 0 or not missing.any():
+        return _EMPTY
+    starts, stops, codes = run_length_segments(missing.astype(np.int8))
+    starts, stops = starts[codes == 1], stops[codes == 1]
+    # A run is as deep as the distance between the valid samples around it
+    widths = depths[np.minimum(stops, len(depths) - 1)] - depths[np.maximum(starts - 1, 0)]
+    wide = np.flatnonzero(widths >= min_width)
+    if len(wide) > limit:
+        wide = wide[np.argsort(widths[wide], kind="stable")[::-1][:limit]]
+    return np.sort(starts[wide])
+
+
+def lttb_indices(depths: np.ndarray, values: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets positions over the valid samples, plus one
+    missing sample per gap wider than a bucket (at most a quarter of n_out).
+
+    Returns:
+        At most n_out sorted positions
+    """
+    n_out = max(2, n_out)
+    gaps = _EMPTY
+    if len(depths) > 1:
+        gaps = _gap_markers(depths, values, (depths[-1] - depths[0]) / n_out, n_out // 4)
+    n_points = n_out - len(gaps)
+
+    valid = np.flatnonzero(np.isfinite(values))
+    n = len(valid)
+    if n <= n_points:
+        return np.unique(np.concatenate((valid, gaps)))
+    x = depths[valid]
+    y = values[valid]
+    if n_points < 3:
+        selected = np.array([0, n - 1])[:n_points]
+        return np.unique(np.concatenate((valid[selected], gaps)))
+
+    # The first and last samples are always kept; n_points - 2 buckets cover the rest
+    edges = np.linspace(1, n - 1, n_points - 1).astype(np.intp)
+    selected = np.empty(n_points, dtype=np.intp)
+    selected[0] = 0
+    a = 0
+    for i in range(n_points - 2):
+        start, stop = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[stop:edges[i + 2]].mean()
+            next_y = y[stop:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        area = np.abs((x[a] - next_x) * (y[start:stop] - y[a]) - (x[a] - x[start:stop]) * (next_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    selected[-1] = n - 1
+    return np.unique(np.concatenate((valid[selected], gaps)))
+
+
+def change_point_indices(depths: np.ndarray, codes: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Positions where a string log (int codes) changes value; the first sample
+    per equal-depth bucket if there are more changes than max_points.
+    """
+    if len(codes) == 0:
+        return _EMPTY
+    starts, _, _ = run_length_segments(codes)
+    if len(starts) <= max_points:
+        return starts
+    return _bucket_starts(depths, max(1, max_points))
+
+
+def decimate(depths: np.ndarray, values: np.ndarray, max_points: int, method: str = DECIMATE_MINMAX,
+             categorical: bool = False) -> Optional[np.ndarray]:
+    """
+    Positions to keep when drawing a curve with at most max_points points.
+
+    Args:
+        depths: Depths sorted ascending
+        values: float64 samples (NaN for missing) or int codes for string logs
+        max_points: Point budget (e.g. the plot height in pixels)
+        method: DECIMATE_MINMAX or DECIMATE_LTTB (numeric logs)
+        categorical: True if values are string log codes
+
+    Returns:
+        Sorted positions, or None if the curve fits the budget as it is
+    """
+    if method not in DECIMATION_METHODS:
+        raise ValueError(f"Unknown decimation method: {method}")
+    if len(values) <= max_points:
+        return None
+    if categorical:
+        return change_point_indices(depths, values, max_points)
+    if method == DECIMATE_LTTB:
+        return lttb_indices(depths, values, max_points)
+    return minmax_indices(depths, values, max_points // 2)
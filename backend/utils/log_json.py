@@ -0,0 +1,269 @@
+"""
+Streaming JSON encoding of log-heavy responses.
+
+JSON responses of the data browser endpoints used to go through sanitize_list
+(NaN to None), response model validation and json.dumps, where formatting
+every sample with repr() dominated. iter_model_json() walks a response
+dictionary in the field order of its response model and yields the JSON text
+in chunks; sample arrays are formatted straight from their NumPy buffers by
+iter_number_array() (NaN and infinities as null). The output is byte-identical
+to the JSON of the validated response model, without validating or converting
+the samples.
+
+Floats print like Python's repr(): values with at most MAX_DECIMALS decimals in
+positional notation are formatted vectorized from lookup tables of four-digit groups;
+the others (e.g. 1e-05 or 0.123456789012) fall back to repr().
+"""
+
+import json
+import math
+import types
+from datetime import date, datetime
+from typing import Dict, Any, Iterator, Optional, Tuple, Type, Union, get_args, get_origin
+
+import numpy as np
+from pydantic import BaseModel
+
+
+# Samples formatted per chunk (bounds the size of the byte matrix)
+CHUNK_SAMPLES = 65536
+
+# Decimals formatted vectorized (two groups of four digits)
+MAX_DECIMALS = 8
+
+_POW10 = 10.0 ** np.arange(MAX_DECIMALS + 1)
+_INT_POW10 = 10 ** np.arange(MAX_DECIMALS + 1, dtype=np.int64)
+# Scaled values below 2**50 are exact and np.round() hits the decimal string that round-trips
+_EXACT_LIMIT = float(2 ** 50)
+
+
+def _digit_table(formatter) -> np.ndarray:
+    """Four ASCII bytes per group value 0..9999 as one uint32 (zero bytes are dropped later)."""
+    text = b"".join(formatter(i).encode("ascii").replace(b" ", b"\0") for i in range(10000))
+    return np.frombuffer(text, dtype=np.uint32)
+
+
+def _word(text: bytes) -> np.uint32:
+    return np.frombuffer(text.ljust(4, b"\0"), dtype=np.uint32)[0]
+
+
+# "0042", " 42" (leading group), "0042" with trailing zeros dropped ("0042" -> "0042", "4200" -> "42")
+_FULL = _digit_table(lambda i: f"{i:04d}")
+_LEADING = _digit_table(lambda i: f"{i:4d}" if i else "    ")
+_TRAILING = _digit_table(lambda i: f"{i:04d}".rstrip("0").ljust(4) if i else "    ")
+# Significant decimals of a group ("4200" -> 2)
+_SIGNIFICANT = np.array([len(f"{i:04d}".rstrip("0")) for i in range(10000)], dtype=np.intp)
+
+_SEPARATOR = _word(b",")
+_MINUS = _word(b"\0-")
+_POINT = _word(b".")
+_UNITS_ZERO = _word(b"\0\0\0" b"0")
+_DECIMAL_ZERO = _word(b"0")
+
+# Row layout in words: separator and sign, integer digits (4 groups), point, decimals (2 groups)
+_INT_WORDS = 4
+_ROW_WORDS = 1 + _INT_WORDS + 1 + 2
+# Widest repr() of a float ("-2.2250738585072014e-308")
+_REPR_WIDTH = 24
+
+
+def _decimal_parts(magnitude: np.ndarray, positional: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Shortest round-trip decimal strings of positional magnitudes with at most
+    MAX_DECIMALS decimals (what repr() prints).
+
+    Returns:
+        (integer part, decimals as MAX_DECIMALS digits, round-trip mask)
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        scaled = np.round(np.where(positional, magnitude, 0.0) * _POW10[MAX_DECIMALS])
+    small = positional & (scaled < _EXACT_LIMIT)
+    integer, fraction = np.divmod(np.where(small, scaled, 0.0).astype(np.int64), _INT_POW10[MAX_DECIMALS])
+    # The decimals without trailing zeros round-trip if they parse back to the value
+    high, low = np.divmod(fraction, 10000)
+    decimals = np.where(low > 0, 4 + _SIGNIFICANT[low], _SIGNIFICANT[high])
+    found = small & (scaled / _POW10[MAX_DECIMALS - decimals] / _POW10[decimals] == magnitude)
+
+    # Large magnitudes: fewest decimals below the exact limit
+    pending = positional & ~small
+    with np.errstate(over="ignore"):
+        for k in range(MAX_DECIMALS + 1):
+            candidates = np.flatnonzero(pending)
+            if not len(candidates):
+                break
+            s = np.round(magnitude[candidates] * _POW10[k])
+            exact = (s < _EXACT_LIMIT) & (s / _POW10[k] == magnitude[candidates])
+            rows = candidates[exact]
+            integer[rows], remainder = np.divmod(s[exact].astype(np.int64), _INT_POW10[k])
+            fraction[rows] = remainder * _INT_POW10[MAX_DECIMALS - k]
+            found[rows] = True
+            pending[rows] = False
+    return integer, fraction, found
+
+
+def _float_rows(values: np.ndarray) -> np.ndarray:
+    """
+    Byte matrix with one JSON number (or null) per row; the non-zero bytes in
+    row order are the comma separated numbers.
+    """
+    n = len(values)
+    magnitude = np.abs(values)
+    finite = np.isfinite(values)
+    positional = finite & ((magnitude >= 1e-4) | (magnitude == 0))
+    integer, fraction, fast = _decimal_parts(magnitude, positional)
+
+    words = np.zeros((n, _ROW_WORDS), dtype=np.uint32)
+    words[:, 0] = np.where(np.signbit(values), _SEPARATOR | _MINUS, _SEPARATOR)
+    # Integer digits right-aligned without leading zeros ("0.5")
+    rest = integer
+    for col in range(_INT_WORDS, 0, -1):
+        rest, group = np.divmod(rest, 10000)
+        if col == _INT_WORDS:
+            words[:, col] = np.where(rest > 0, _FULL[group], np.where(group > 0, _LEADING[group], _UNITS_ZERO))
+        else:
+            words[:, col] = np.where(rest > 0, _FULL[group], _LEADING[group])
+        if not rest.any():
+            break
+    words[:, _INT_WORDS + 1] = _POINT
+    # Decimals without trailing zeros, at least one ("1.0")
+    high, low = np.divmod(fraction, 10000)
+    words[:, _INT_WORDS + 2] = np.where(low > 0, _FULL[high], np.where(high > 0, _TRAILING[high], _DECIMAL_ZERO))
+    words[:, _INT_WORDS + 3] = _TRAILING[low]
+
+    rows = words.view(np.uint8)
+    rows[0, 0] = 0
+    # null for NaN and infinities, repr() for the rest
+    special = np.flatnonzero(~fast)
+    if len(special):
+        text = [repr(value) if math.isfinite(value) else "null" for value in values[special].tolist()]
+        rows[special, 1:] = 0
+        rows[special, 1:1 + _REPR_WIDTH] = np.array(text, dtype=f"S{_REPR_WIDTH}").view(np.uint8).reshape(len(special), -1)
+    return rows
+
+
+def iter_number_array(values: np.ndarray, chunk: int = CHUNK_SAMPLES) -> Iterator[bytes]:
+    """JSON array of a float or integer array in chunks (NaN and infinities as null)."""
+    yield b"["
+    for start in range(0, len(values), chunk):
+        part = values[start:start + chunk]
+        separator = b"," if start else b""
+        if part.dtype.kind == "f":
+            rows = _float_rows(part.astype(np.float64, copy=False)).reshape(-1)
+            yield separator + rows[rows != 0].tobytes()
+        else:
+            yield separator + ",".join(map(str, part.tolist())).encode("ascii")
+    yield b"]"
+
+
+def encode_number_array(values: np.ndarray) -> bytes:
+    return b"".join(iter_number_array(values))
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _without_nan(value: Any) -> Any:
+    """Non-finite floats to None (how the response model serializes them)."""
+    if isinstance(value, float):
+        return value if np.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _without_nan(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_without_nan(item) for item in value]
+    return value
+
+
+def _dumps(value: Any) -> bytes:
+    """json.dumps as the JSON response renders it."""
+    try:
+        text = json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default)
+    except ValueError:
+        text = json.dumps(_without_nan(value), ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+                          default=_default)
+    return text.encode("utf-8")
+
+
+def _unwrap(annotation: Any) -> Any:
+    """Optional[X] -> X."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _unwrap(args[0])
+    return annotation
+
+
+def _item_annotation(annotation: Any) -> Any:
+    """List[X] -> X, other annotations unchanged."""
+    annotation = _unwrap(annotation)
+    if get_origin(annotation) in (list, tuple):
+        args = get_args(annotation)
+        return _unwrap(args[0]) if args else Any
+    return annotation
+
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    annotation = _item_annotation(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def _iter_value(value: Any, annotation: Any, strip: bool) -> Iterator[bytes]:
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind in "iub" and _item_annotation(annotation) is float:
+            value = value.astype(np.float64)
+        if value.dtype.kind in "fiub":
+            yield from iter_number_array(value)
+        else:
+            yield _dumps(value.tolist())
+        return
+    model = _nested_model(annotation)
+    if model is not None and isinstance(value, dict):
+        yield from iter_model_json(model, value)
+    elif model is not None and isinstance(value, (list, tuple)):
+        yield b"["
+        for i, item in enumerate(value):
+            if i:
+                yield b","
+            yield from _iter_value(item, model, strip)
+        yield b"]"
+    elif strip and isinstance(value, str) and _unwrap(annotation) is str:
+        yield _dumps(value.strip())
+    elif strip and isinstance(value, list) and _item_annotation(annotation) is str:
+        yield _dumps([item.strip() if isinstance(item, str) else item for item in value])
+    else:
+        yield _dumps(value)
+
+
+def iter_model_json(model: Type[BaseModel], data: Dict[str, Any]) -> Iterator[bytes]:
+    """
+    JSON of a response dictionary as the response model would render it, in chunks.
+
+    Fields are written in model order, missing fields get their defaults and
+    extra keys are dropped; fields the model lists in omit_when_none are left
+    out when they are None (as its serializer does). Values are not validated or
+    converted: data must already hold the field types, with NumPy arrays allowed
+    for sample lists.
+    """
+    strip = model.model_config.get("str_strip_whitespace", False)
+    omit = getattr(model, "omit_when_none", ())
+    separator = b""
+    yield b"{"
+    for name, field in model.model_fields.items():
+        if name in data:
+            value = data[name]
+        elif field.is_required():
+            raise ValueError(f"{model.__name__}: missing field '{name}'")
+        else:
+            value = field.get_default(call_default_factory=True)
+        if value is None and name in omit:
+            continue
+        yield separator + _dumps(field.serialization_alias or name) + b":"
+        separator = b","
+        yield from _iter_value(value, field.annotation, strip)
+    yield b"}"
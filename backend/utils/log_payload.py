@@ -0,0 +1,125 @@
+"""
+Binary payloads for the well data endpoints.
+
+JSON responses turn every sample into a Python float (NaN into None) and are
+validated again by the response model. Clients sending
+`Accept: application/x-ptrc-logs` get the same response structure as JSON with
+every sample array replaced by a reference to a raw column buffer instead:
+
+    preamble   magic "PTRCLOGS", version, flags, header length (<8sIIQ)
+    header     UTF-8 JSON of the response; arrays are {"$block": {"offset", "count", "dtype"}}
+    data       8-byte aligned little-endian column buffers, offsets relative to the data start
+
+Numeric samples are float64 (or float32 with `Accept: application/x-ptrc-logs;
+dtype=float32`) with NaN kept as NaN; string logs are always sent as int32 codes
+(-1 for missing) plus their categories.
+"""
+
+import json
+import struct
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+
+BINARY_MEDIA_TYPE = "application/x-ptrc-logs"
+
+PAYLOAD_MAGIC = b"PTRCLOGS"
+PAYLOAD_VERSION = 1
+
+FLOAT64 = "<f8"
+FLOAT32 = "<f4"
+_FLOAT_DTYPES = {"float64": FLOAT64, "float32": FLOAT32}
+_CODE_DTYPE = "<i4"
+
+# magic, version, flags, header length
+_PREAMBLE = struct.Struct("<8sIIQ")
+_ALIGNMENT = 8
+_BLOCK_KEY = "$block"
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def negotiate_float_dtype(accept: Optional[str]) -> Optional[str]:
+    """
+    Float dtype of the binary payload if the Accept header asks for it.
+
+    Returns:
+        FLOAT64 or FLOAT32, or None to answer with JSON
+    """
+    for media_range in (accept or "").split(","):
+        media_type, *params = [part.strip() for part in media_range.split(";")]
+        if media_type.lower() != BINARY_MEDIA_TYPE:
+            continue
+        options = dict(param.split("=", 1) for param in params if "=" in param)
+        if options.get("q", "1").strip() in ("0", "0.0", "0.00", "0.000"):
+            continue
+        return _FLOAT_DTYPES.get(options.get("dtype", "float64").strip().lower(), FLOAT64)
+    return None
+
+
+def encode_binary_payload(payload: Dict[str, Any], float_dtype: str = FLOAT64) -> bytes:
+    """
+    Encode a response dictionary whose samples are NumPy arrays.
+
+    Float arrays become float_dtype buffers, integer arrays int32 buffers;
+    other values (including object arrays) stay in the JSON header.
+    """
+    blocks: List[Tuple[int, np.ndarray]] = []
+    size = 0
+
+    def convert(value: Any) -> Any:
+        nonlocal size
+        if isinstance(value, np.ndarray):
+            if value.dtype.kind == 'f':
+                array = value.astype(float_dtype, copy=False)
+            elif value.dtype.kind in 'iub':
+                array = value.astype(_CODE_DTYPE, copy=False)
+            else:
+                return value.tolist()
+            blocks.append((size, np.ascontiguousarray(array)))
+            descriptor = {"offset": size, "count": len(array), "dtype": array.dtype.str}
+            size = _align(size + array.nbytes)
+            return {_BLOCK_KEY: descriptor}
+        if isinstance(value, dict):
+            return {key: convert(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [convert(item) for item in value]
+        return value
+
+    header_bytes = json.dumps(convert(payload), default=str).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(header_bytes))
+
+    buffer = bytearray(data_start + size)
+    _PREAMBLE.pack_into(buffer, 0, PAYLOAD_MAGIC, PAYLOAD_VERSION, 0, len(header_bytes))
+    buffer[_PREAMBLE.size:_PREAMBLE.size + len(header_bytes)] = header_bytes
+    for offset, block in blocks:
+        start = data_start + offset
+        buffer[start:start + block.nbytes] = memoryview(block).cast("B")
+    return bytes(buffer)
+
+
+def decode_binary_payload(buffer: bytes) -> Dict[str, Any]:
+    """Decode a binary payload; column buffers become read-only NumPy views of buffer."""
+    magic, version, _flags, header_len = _PREAMBLE.unpack_from(buffer)
+    if magic != PAYLOAD_MAGIC:
+        raise ValueError("Not a binary log payload")
+    if version != PAYLOAD_VERSION:
+        raise ValueError(f"Unsupported payload version: {version}")
+    header = json.loads(bytes(buffer[_PREAMBLE.size:_PREAMBLE.size + header_len]).decode("utf-8"))
+    data_start = _align(_PREAMBLE.size + header_len)
+
+    def restore(value: Any) -> Any:
+        if isinstance(value, dict):
+            block = value.get(_BLOCK_KEY)
+            if block is not None and len(value) == 1:
+                return np.frombuffer(buffer, dtype=block["dtype"], count=block["count"],
+                                     offset=data_start + block["offset"])
+            return {key: restore(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [restore(item) for item in value]
+        return value
+
+    return restore(header)
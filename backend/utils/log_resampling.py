@@ -0,0 +1,289 @@
+"""
+Interpolation-aware resampling of well logs.
+
+All logs of a dataset are moved onto a new depth index in one batched pass,
+following each log's interpolation type:
+- CONTINUOUS: linear interpolation between neighbouring samples (NaN neighbours give NaN)
+- TOP:        step/hold, the last sample at or above the new depth is carried down
+- POINT:      nearest sample, only if it lies within a depth tolerance
+
+String (categorical) logs cannot be interpolated linearly, so CONTINUOUS string
+logs are resampled like POINT logs. Positions and weights are computed once per
+dataset and applied to all logs of the same type together.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from utils.depth_merge import DEPTH_DECIMALS
+from utils.fe_data_objects import Dataset, WellLog, Well
+from utils.ptrc_file_io import write_well_file
+
+
+CONTINUOUS = "CONTINUOUS"
+TOP = "TOP"
+POINT = "POINT"
+
+
+def interpolation_kind(well_log: WellLog) -> str:
+    """Resampling method for a log (TOP also accepts the 'TOPS' spelling)."""
+    kind = (well_log.interpolation or "").upper()
+    if kind in (TOP, "TOPS"):
+        return TOP
+    if kind == POINT or well_log.is_categorical:
+        return POINT
+    return CONTINUOUS
+
+
+def regular_index(top: float, bottom: float, step: float) -> np.ndarray:
+    """Regularly sampled depth index from top to bottom (inclusive) with the given step."""
+    if step <= 0:
+        raise ValueError("Resampling step must be positive")
+    count = int(np.floor((bottom - top) / step + 1e-9)) + 1
+    return np.round(top + np.arange(max(count, 0)) * step, DEPTH_DECIMALS)
+
+
+def default_tolerance(new_index: np.ndarray) -> float:
+    """Half the median step of the new index, so a point sample lands on at most one depth."""
+    if len(new_index) < 2:
+        return 0.0
+    return float(np.median(np.diff(new_index))) / 2
+
+
+def _linear_weights(source: np.ndarray, new_index: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Left/right source positions, right weight and in-range mask for linear interpolation."""
+    right = np.searchsorted(source, new_index, side='right')
+    left = np.clip(right - 1, 0, len(source) - 1)
+    right = np.clip(right, 0, len(source) - 1)
+    inside = (new_index >= source[0]) & (new_index <= source[-1])
+    span = source[right] - source[left]
+    weight = np.divide(new_index - source[left], span, out=np.zeros(len(new_index)), where=span > 0)
+    return left, right, weight, inside
+
+
+def _hold_positions(source: np.ndarray, new_index: np.ndarray) -> np.ndarray:
+    """Position of the last source depth at or above each new depth (-1 if none)."""
+    return np.searchsorted(source, new_index, side='right') - 1
+
+
+def _nearest_positions(source: np.ndarray, new_index: np.ndarray, tolerance: float) -> np.ndarray:
+    """Position of the nearest source depth within tolerance (-1 if none)."""
+    right = np.clip(np.searchsorted(source, new_index), 0, len(source) - 1)
+    left = np.clip(right - 1, 0, len(source) - 1)
+    use_left = np.abs(new_index - source[left]) <= np.abs(source[right] - new_index)
+    positions = np.where(use_left, left, right)
+    positions[np.abs(source[positions] - new_index) > tolerance] = -1
+    return positions
+
+
+def _take(values: np.ndarray, positions: np.ndarray, missing) -> np.ndarray:
+    """values[..., positions] with `missing` where positions is -1."""
+    taken = values[..., np.maximum(positions, 0)]
+    taken[..., positions < 0] = missing
+    return taken
+
+
+def resample_dataset(dataset: Dataset, new_index: Optional[np.ndarray] = None, step: Optional[float] = None,
+                     tolerance: Optional[float] = None, name: Optional[str] = None) -> Dataset:
+    """
+    Resample all logs of a dataset onto a new depth index.
+
+    Args:
+        dataset: Source dataset
+        new_index: Target depth index (e.g. a wireline reference index)
+        step: Regular depth step covering the source depth range (used when new_index is None)
+        tolerance: Depth tolerance for POINT logs (defaults to half the target step)
+        name: Name of the resampled dataset (defaults to the source name)
+
+    Returns:
+        New Dataset on the target index
+    """
+    depth_index = dataset.depth_index
+    source = depth_index.depths[:depth_index.count]
+
+    if new_index is None:
+        if step is None:
+            raise ValueError("Either new_index or step is required")
+        new_index = regular_index(depth_index.top, depth_index.bottom, step) if len(source) else np.empty(0)
+    new_index = np.asarray(new_index, dtype=np.float64)
+    if tolerance is None:
+        tolerance = default_tolerance(new_index)
+
+    # Source positions of the valid depths in sorted order
+    order = depth_index.order[:depth_index.count] if depth_index.order is not None else np.arange(depth_index.count)
+
+    def sorted_samples(well_log: WellLog) -> np.ndarray:
+        values = well_log.values
+        missing = np.nan if well_log.categories is None else -1
+        padded = np.full(len(dataset.index_log), missing, dtype=values.dtype)
+        padded[:min(len(values), len(padded))] = values[:len(padded)]
+        return padded[order]
+
+    groups: Dict[str, List[WellLog]] = {CONTINUOUS: [], TOP: [], POINT: []}
+    for well_log in dataset.well_logs:
+        groups[interpolation_kind(well_log)].append(well_log)
+
+    resampled: Dict[int, np.ndarray] = {}
+    if len(source) and len(new_index):
+        if groups[CONTINUOUS]:
+            left, right, weight, inside = _linear_weights(source, new_index)
+            stacked = np.vstack([sorted_samples(log) for log in groups[CONTINUOUS]])
+            lower, upper = stacked[:, left], stacked[:, right]
+            # Exact hits keep their sample even when the next one is missing
+            block = np.where(weight > 0, lower + weight * (upper - lower), lower)
+            block[:, ~inside] = np.nan
+            for well_log, row in zip(groups[CONTINUOUS], block):
+                resampled[id(well_log)] = row
+
+        for kind, positions in ((TOP, lambda: _hold_positions(source, new_index)),
+                                (POINT, lambda: _nearest_positions(source, new_index, tolerance))):
+            if not groups[kind]:
+                continue
+            positions = positions()
+            float_logs = [log for log in groups[kind] if log.categories is None]
+            if float_logs:
+                block = _take(np.vstack([sorted_samples(log) for log in float_logs]), positions, np.nan)
+                for well_log, row in zip(float_logs, block):
+                    resampled[id(well_log)] = row
+            for well_log in groups[kind]:
+                if well_log.categories is not None:
+                    resampled[id(well_log)] = _take(sorted_samples(well_log), positions, -1)
+
+    dataset_name = name or dataset.name
+    well_logs = []
+    for well_log in dataset.well_logs:
+        new_log = WellLog(name=well_log.name, date=well_log.date, description=well_log.description,
+                          interpolation=well_log.interpolation, log_type=well_log.log_type,
+                          log=[], dtst=dataset_name)
+        if id(well_log) in resampled:
+            new_log.values = resampled[id(well_log)]
+        elif well_log.categories is None:
+            new_log.values = np.full(len(new_index), np.nan)
+        else:
+            new_log.values = np.full(len(new_index), -1, dtype=np.int32)
+        new_log.categories = None if well_log.categories is None else list(well_log.categories)
+        well_logs.append(new_log)
+
+    return Dataset(
+        date_created=datetime.now(),
+        name=dataset_name,
+        type=dataset.type,
+        wellname=dataset.wellname,
+        constants=list(dataset.constants),
+        index_log=new_index,
+        index_name=dataset.index_name,
+        well_logs=well_logs,
+        metadata={**dataset.metadata, 'resampled_from': dataset.name}
+    )
+
+
+def resample_well(well: Well, dataset_name: str, step: Optional[float] = None,
+                  reference_dataset: Optional[str] = None, output_name: Optional[str] = None,
+                  tolerance: Optional[float] = None) -> Dataset:
+    """
+    Resample a dataset of a well and store the result in the well (replacing a dataset of the same name).
+
+    Args:
+        well: Well holding the dataset
+        dataset_name: Dataset to resample
+        step: Regular target step
+        reference_dataset: Dataset of the same well whose index is the target (takes precedence over step)
+        output_name: Name of the new dataset (defaults to '<dataset_name>_RS')
+        tolerance: Depth tolerance for POINT logs
+
+    Returns:
+        The resampled dataset
+    """
+    source = well.get_dataset(dataset_name)
+    new_index = None
+    if reference_dataset:
+        reference = well.get_dataset(reference_dataset).depth_index
+        new_index = reference.depths[:reference.count]
+
+    output_name = output_name or f"{dataset_name}_RS"
+    resampled = resample_dataset(source, new_index=new_index, step=step, tolerance=tolerance, name=output_name)
+    well.remove_dataset(output_name)
+    well.add_dataset(resampled)
+    return resampled
+
+
+def _resample_well_file(file_path: str, dataset_name: str, step: Optional[float], reference_dataset: Optional[str],
+                        output_name: Optional[str], tolerance: Optional[float]) -> Dict[str, Any]:
+    """
+    Process pool worker: resample one well file. The resampled well is returned
+    as 'data' and written by the calling process, so write listeners run there.
+    """
+    well_name = os.path.basename(file_path)[:-len(".ptrc")]
+    try:
+        well = Well.deserialize(file_path)
+        dataset_names = {ds.name for ds in well.datasets}
+        if dataset_name not in dataset_names or (reference_dataset and reference_dataset not in dataset_names):
+            return {"well": well_name, "status": "skipped"}
+        resampled = resample_well(well, dataset_name, step, reference_dataset, output_name, tolerance)
+        return {"well": well_name, "status": "resampled", "samples": len(resampled.index_log), "data": well.to_dict()}
+    except Exception as e:
+        return {"well": well_name, "status": "failed", "error": str(e)}
+
+
+def resample_project(project_path: str, dataset_name: str, step: Optional[float] = None,
+                     reference_dataset: Optional[str] = None, output_name: Optional[str] = None,
+                     tolerance: Optional[float] = None, max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Resample a dataset in every well of a project, one process per well.
+
+    Wells without the dataset (or without the reference dataset) are skipped.
+
+    Args:
+        project_path: Project directory path
+        dataset_name: Dataset to resample in each well
+        step: Regular target step
+        reference_dataset: Per-well dataset whose index is the target
+        output_name: Name of the new dataset (defaults to '<dataset_name>_RS')
+        tolerance: Depth tolerance for POINT logs
+        max_workers: Worker processes (1 runs in-process)
+
+    Returns:
+        Dictionary with resampled, skipped and failed wells
+    """
+    if step is None and not reference_dataset:
+        raise ValueError("Either step or reference_dataset is required")
+
+    wells_dir = os.path.join(project_path, "10-WELLS")
+    file_paths = []
+    if os.path.isdir(wells_dir):
+        file_paths = [os.path.join(wells_dir, name) for name in sorted(os.listdir(wells_dir)) if name.endswith(".ptrc")]
+
+    job_args = (dataset_name, step, reference_dataset, output_name, tolerance)
+    if max_workers == 1 or len(file_paths) <= 1:
+        results = [_resample_well_file(path, *job_args) for path in file_paths]
+    else:
+        # Spawned, not forked: a forked child would inherit the server's locks and SQLite connections
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn")) as executor:
+            futures = [executor.submit(_resample_well_file, path, *job_args) for path in file_paths]
+            results = [future.result() for future in futures]
+
+    for path, result in zip(file_paths, results):
+        if result["status"] == "resampled":
+            try:
+                # Keeps the file's format (JSON or binary v2)
+                write_well_file(path, result.pop("data"))
+            except Exception as e:
+                result.update(status="failed", error=str(e))
+
+    resampled = [r["well"] for r in results if r["status"] == "resampled"]
+    skipped = [r["well"] for r in results if r["status"] == "skipped"]
+    failed = [{"well": r["well"], "error": r["error"]} for r in results if r["status"] == "failed"]
+    print(f"[Resampling] {dataset_name}: {len(resampled)} resampled, {len(skipped)} skipped, {len(failed)} failed")
+
+    return {
+        "dataset": dataset_name,
+        "output": output_name or f"{dataset_name}_RS",
+        "resampled": resampled,
+        "skipped": skipped,
+        "failed": failed
+    }
@@ -0,0 +1,157 @@
+"""
+Process-pool loading of well files.
+
+Parsing legacy JSON .ptrc files is CPU bound and holds the GIL, so thread
+preloading does not scale with cores. Here each worker process parses one well
+and encodes its columns into a shared memory block with the v2 column layout
+(see ptrc_file_io.encode_well_blocks). Only the small header (names, units,
+block descriptors) and the fingerprint are pickled back; the parent decodes
+the columns straight from shared memory and unlinks the block.
+
+On Windows shared memory disappears with the last open handle, so workers
+return the well dictionary itself there.
+"""
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from utils.ptrc_file_io import read_well_bytes, parse_well_bytes, encode_well_blocks, decode_well_blocks
+from utils.well_file_index import file_fingerprint, read_fingerprint
+
+try:
+    from multiprocessing import resource_tracker
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+    resource_tracker = None
+    SharedMemory = None
+
+
+USE_SHARED_MEMORY = SharedMemory is not None and os.name != "nt"
+
+
+def _read_well_shared(file_path: str) -> Dict[str, Any]:
+    """
+    Process pool worker: parse one well file and move its columns into shared memory.
+
+    Returns:
+        {"path", "fingerprint", "well", "shm"} where well is the header well with
+        block descriptors and shm the shared memory name (None if the well itself
+        was returned), or {"path", "error"}
+    """
+    try:
+        fingerprint = file_fingerprint(file_path)
+        raw = read_well_bytes(file_path)
+        well = parse_well_bytes(raw, arrays=True)
+        # Hashed from the bytes already in memory: the file is read once per load
+        fingerprint = read_fingerprint(file_path, fingerprint, raw)
+
+        if not USE_SHARED_MEMORY:
+            return {"path": file_path, "fingerprint": fingerprint, "well": well, "shm": None}
+        try:
+            header, blocks, size = encode_well_blocks(well)
+        except (TypeError, ValueError):
+            # Columns with mixed sample types have no block encoding, send them as they are
+            return {"path": file_path, "fingerprint": fingerprint, "well": well, "shm": None}
+
+        shm = SharedMemory(create=True, size=max(size, 1))
+        try:
+            for offset, block in blocks:
+                shm.buf[offset:offset + block.nbytes] = memoryview(block).cast("B")
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        shm.close()
+        return {"path": file_path, "fingerprint": fingerprint, "well": header, "shm": shm.name}
+    except Exception as e:
+        return {"path": file_path, "error": str(e)}
+
+
+def _collect(result: Dict[str, Any]) -> Tuple[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[str]]:
+    """Decode a worker result into (path, well data, fingerprint, error), releasing its shared memory."""
+    if "error" in result:
+        return result["path"], None, None, result["error"]
+    if result["shm"] is None:
+        return result["path"], result["well"], result["fingerprint"], None
+
+    shm = SharedMemory(name=result["shm"])
+    try:
+        # Columns are copied out of the block, so no view of it outlives it
+        well = decode_well_blocks(result["well"], shm.buf, arrays=True, copy=True)
+    finally:
+        shm.close()
+        shm.unlink()
+    return result["path"], well, result["fingerprint"], None
+
+
+def _release(result: Dict[str, Any]):
+    """Unlink the shared memory of an uncollected worker result."""
+    if result.get("shm"):
+        shm = SharedMemory(name=result["shm"])
+        shm.close()
+        shm.unlink()
+
+
+class WellProcessPool:
+    """
+    Worker processes for loading wells one at a time, e.g. in priority order.
+    Results must be passed to collect() so their shared memory is released.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if USE_SHARED_MEMORY:
+            # Workers must register their blocks with the parent's tracker, which unlinks them
+            resource_tracker.ensure_running()
+        # Spawned, not forked: a forked child would inherit the server's locks and SQLite connections
+        self._executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn"))
+        self._pending = set()
+
+    def submit(self, file_path: str) -> Future:
+        future = self._executor.submit(_read_well_shared, file_path)
+        self._pending.add(future)
+        return future
+
+    def collect(self, future: Future) -> Tuple[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[str]]:
+        """Result of a submitted load as (file_path, well data, fingerprint, error)."""
+        self._pending.discard(future)
+        return _collect(future.result())
+
+    def shutdown(self):
+        """Stop the workers, releasing the blocks of results that were never collected."""
+        for future in self._pending:
+            future.cancel()
+        for future in self._pending:
+            if not future.cancelled() and future.exception() is None:
+                _release(future.result())
+        self._pending.clear()
+        self._executor.shutdown()
+
+
+def load_wells_in_processes(file_paths: List[str], max_workers: Optional[int] = None
+                            ) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Load well files in worker processes, in completion order.
+
+    Args:
+        file_paths: .ptrc files to load
+        max_workers: Worker processes (defaults to the CPU count, 1 runs in-process)
+
+    Yields:
+        (file_path, well data, fingerprint, error) per file; well data has the
+        read_well_file() layout and is None if the file failed to load
+    """
+    if max_workers == 1 or len(file_paths) <= 1:
+        for path in file_paths:
+            yield _collect(_read_well_shared(path))
+        return
+
+    pool = WellProcessPool(max_workers)
+    try:
+        futures = [pool.submit(path) for path in file_paths]
+        for future in as_completed(futures):
+            yield pool.collect(future)
+    finally:
+        # Also runs when the caller stopped early
+        pool.shutdown()
@@ -0,0 +1,375 @@
+"""
+Utility for reading and writing .ptrc well files.
+
+Two on-disk formats are supported:
+- Legacy JSON: the whole well as one JSON document (Well.to_dict layout)
+- Binary v2: a small JSON header holding datasets, logs, constants and metadata,
+  followed by contiguous little-endian column blocks for every index and log.
+  Blocks are 8-byte aligned at recorded offsets, so a single curve can be read
+  through numpy.memmap without touching the rest of the file.
+
+Readers detect the format from the file preamble, so callers never need to know
+which one a given well uses.
+"""
+
+import json
+import os
+import struct
+from datetime import date, datetime
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+import numpy as np
+
+from utils.fe_data_objects import columns_as_arrays, encode_log_values, log_array_to_list
+
+
+PTRC_MAGIC = b"PTRCBIN\x00"
+PTRC_VERSION = 2
+
+FORMAT_JSON = "json"
+FORMAT_V2 = "v2"
+
+# Format used for wells that do not exist on disk yet
+DEFAULT_WELL_FORMAT = FORMAT_JSON
+
+# magic, version, flags, header length
+_PREAMBLE = struct.Struct("<8sIIQ")
+_ALIGNMENT = 8
+
+_FLOAT_DTYPE = "<f8"
+_CODE_DTYPE = "<i4"
+
+# Callables (file_path, well_data) run after every successful write_well_file()
+_write_listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback for array-backed well dictionaries (arrays, NumPy scalars and dates)."""
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == 'f':
+            return log_array_to_list(value)
+        return value.tolist()
+    if isinstance(value, np.generic):
+        # np.int64(5) stays the number 5, not the string "5"
+        return value.item()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def add_write_listener(listener: Callable[[str, Dict[str, Any]], None]):
+    """
+    Register a callable run with (file_path, well_data) after every well file
+    written through write_well_file() (storage saves, session commits, CLI
+    commands, imports). Errors of a listener are printed and never fail the write.
+    """
+    if listener not in _write_listeners:
+        _write_listeners.append(listener)
+
+
+def detect_well_format(file_path: str) -> str:
+    """Return FORMAT_V2 or FORMAT_JSON for an existing .ptrc file."""
+    with open(file_path, "rb") as f:
+        magic = f.read(len(PTRC_MAGIC))
+    return FORMAT_V2 if magic == PTRC_MAGIC else FORMAT_JSON
+
+
+def _read_v2_header(f) -> Tuple[Dict[str, Any], int]:
+    """Read the v2 header from an open file. Returns (header, data_start)."""
+    preamble = f.read(_PREAMBLE.size)
+    magic, version, _flags, header_len = _PREAMBLE.unpack(preamble)
+    if magic != PTRC_MAGIC:
+        raise ValueError("Not a binary .ptrc file")
+    if version != PTRC_VERSION:
+        raise ValueError(f"Unsupported .ptrc version: {version}")
+    header = json.loads(f.read(header_len).decode("utf-8"))
+    data_start = _align(_PREAMBLE.size + header_len)
+    return header, data_start
+
+
+def read_well_header(file_path: str) -> Dict[str, Any]:
+    """
+    Read well structure without log samples.
+
+    For v2 files only the header is read; index_log and log entries are block
+    descriptors ({"offset", "count", "dtype"[, "categories"]}). Legacy JSON files
+    have no separate header, so the full document is returned.
+    """
+    if detect_well_format(file_path) == FORMAT_JSON:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    with open(file_path, "rb") as f:
+        header, _ = _read_v2_header(f)
+    return header["well"]
+
+
+def _decode_block(buffer, data_start: int, block: Dict[str, Any], arrays: bool, copy: bool = False) -> Any:
+    values = np.frombuffer(buffer, dtype=block["dtype"], count=block["count"],
+                           offset=data_start + block["offset"])
+    if "categories" in block:
+        lookup = np.array(block["categories"] + [None], dtype=object)
+        return lookup[values].tolist()
+    if arrays:
+        return values.copy() if copy else values
+    return log_array_to_list(values)
+
+
+def read_well_file(file_path: str, arrays: bool = False) -> Dict[str, Any]:
+    """
+    Read a .ptrc well file in either format.
+
+    Args:
+        file_path: Path to the .ptrc file
+        arrays: If True, numeric logs and indexes are returned as float64 arrays
+                instead of JSON-compatible lists (see columns_as_arrays)
+
+    Returns:
+        Well dictionary in the Well.to_dict() layout
+    """
+    return parse_well_bytes(read_well_bytes(file_path), arrays)
+
+
+def read_well_bytes(file_path: str) -> bytearray:
+    """Raw contents of a .ptrc file (the disk part of read_well_file, see parse_well_bytes)."""
+    with open(file_path, "rb") as f:
+        # One bytearray backs every column, so array views stay writable
+        buffer = bytearray(os.fstat(f.fileno()).st_size)
+        read = f.readinto(buffer)
+    del buffer[read:]
+    return buffer
+
+
+def parse_well_bytes(buffer: bytearray, arrays: bool = False) -> Dict[str, Any]:
+    """
+    Decode the contents of a .ptrc file in either format (see read_well_file).
+
+    Args:
+        buffer: File contents from read_well_bytes
+        arrays: If True, numeric columns are float64 arrays (views of buffer for v2 files)
+    """
+    if bytes(buffer[:len(PTRC_MAGIC)]) != PTRC_MAGIC:
+        well = json.loads(buffer.decode("utf-8"))
+        return columns_as_arrays(well) if arrays else well
+
+    magic, version, _flags, header_len = _PREAMBLE.unpack_from(buffer)
+    if version != PTRC_VERSION:
+        raise ValueError(f"Unsupported .ptrc version: {version}")
+    header = json.loads(buffer[_PREAMBLE.size:_PREAMBLE.size + header_len].decode("utf-8"))
+    data_start = _align(_PREAMBLE.size + header_len)
+    return decode_well_blocks(header["well"], buffer, data_start, arrays)
+
+
+def decode_well_blocks(well: Dict[str, Any], buffer, data_start: int = 0, arrays: bool = False,
+                       copy: bool = False) -> Dict[str, Any]:
+    """
+    Replace the block descriptors of a v2 header well (see encode_well_blocks) by
+    the samples they describe, in place.
+
+    Args:
+        well: Header well dictionary with block descriptors
+        buffer: Buffer holding the column blocks (file contents, shared memory, ...)
+        data_start: Position of block offset 0 in buffer
+        arrays: If True, numeric columns are returned as float64 views of buffer
+        copy: With arrays, copy the columns out of buffer (for buffers that are
+              released afterwards, e.g. shared memory or a mapping)
+
+    Returns:
+        The well dictionary
+    """
+    for dataset in well.get("datasets", []):
+        if isinstance(dataset.get("index_log"), dict):
+            dataset["index_log"] = _decode_block(buffer, data_start, dataset["index_log"], arrays, copy)
+        for log in dataset.get("well_logs", []):
+            if isinstance(log.get("log"), dict):
+                log["log"] = _decode_block(buffer, data_start, log["log"], arrays, copy)
+    return well
+
+
+def read_well_log(file_path: str, dataset_name: str, log_name: str) -> np.ndarray:
+    """
+    Read a single curve from a .ptrc file.
+
+    v2 files are memory-mapped so only the pages of the requested column block are
+    read. Legacy JSON files are parsed in full.
+
+    Returns:
+        float64 array for numeric logs, object array of str/None for string logs
+    """
+    if detect_well_format(file_path) == FORMAT_JSON:
+        well = read_well_file(file_path)
+        for dataset in well.get("datasets", []):
+            if dataset.get("name") != dataset_name:
+                continue
+            for log in dataset.get("well_logs", []):
+                if log.get("name") == log_name:
+                    values, categories = encode_log_values(log.get("log"), log.get("log_type", "float"))
+                    if categories is None:
+                        return values
+                    return np.array(categories + [None], dtype=object)[values]
+        raise KeyError(f"Log '{log_name}' not found in dataset '{dataset_name}'")
+
+    with open(file_path, "rb") as f:
+        header, data_start = _read_v2_header(f)
+
+    for dataset in header["well"].get("datasets", []):
+        if dataset.get("name") != dataset_name:
+            continue
+        for log in dataset.get("well_logs", []):
+            if log.get("name") != log_name:
+                continue
+            block = log["log"]
+            if block["count"] == 0:
+                values = np.empty(0, dtype=block["dtype"])
+            else:
+                mapped = np.memmap(file_path, dtype=block["dtype"], mode="r",
+                                   offset=data_start + block["offset"], shape=(block["count"],))
+                # Copy out so the file handle is released (required for rewrites on Windows)
+                values = np.array(mapped)
+                del mapped
+            if "categories" in block:
+                return np.array(block["categories"] + [None], dtype=object)[values]
+            return values.astype(np.float64, copy=False)
+    raise KeyError(f"Log '{log_name}' not found in dataset '{dataset_name}'")
+
+
+def _encode_block(values: Any, log_type: str, blocks: List[np.ndarray], offset: int) -> Tuple[Dict[str, Any], int]:
+    """Encode one column, append it to blocks and return (descriptor, next offset)."""
+    array, categories = encode_log_values(values, log_type)
+    if categories is None:
+        array = array.astype(_FLOAT_DTYPE, copy=False)
+        descriptor = {"offset": offset, "count": len(array), "dtype": _FLOAT_DTYPE}
+    else:
+        array = array.astype(_CODE_DTYPE, copy=False)
+        descriptor = {"offset": offset, "count": len(array), "dtype": _CODE_DTYPE, "categories": categories}
+    blocks.append(np.ascontiguousarray(array))
+    return descriptor, _align(offset + array.nbytes)
+
+
+def encode_well_blocks(well_data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Tuple[int, np.ndarray]], int]:
+    """
+    Encode every index and log of a well into aligned column blocks (the v2 data section).
+
+    Returns:
+        Tuple of (header well with block descriptors, [(offset, block)], total size in bytes)
+    """
+    blocks: List[np.ndarray] = []
+    offsets: List[int] = []
+    offset = 0
+
+    header_well = {key: value for key, value in well_data.items() if key != "datasets"}
+    header_datasets = []
+    for dataset in well_data.get("datasets", []):
+        header_dataset = {key: value for key, value in dataset.items()
+                          if key not in ("index_log", "well_logs")}
+        offsets.append(offset)
+        header_dataset["index_log"], offset = _encode_block(dataset.get("index_log", []), "float", blocks, offset)
+        header_logs = []
+        for log in dataset.get("well_logs", []):
+            header_log = {key: value for key, value in log.items() if key != "log"}
+            offsets.append(offset)
+            header_log["log"], offset = _encode_block(log.get("log", []), log.get("log_type", "float"), blocks, offset)
+            header_logs.append(header_log)
+        header_dataset["well_logs"] = header_logs
+        header_datasets.append(header_dataset)
+    header_well["datasets"] = header_datasets
+    return header_well, list(zip(offsets, blocks)), offset
+
+
+def _write_v2(file_path: str, well_data: Dict[str, Any]):
+    header_well, blocks, _ = encode_well_blocks(well_data)
+
+    header_bytes = json.dumps({"format": "ptrc", "version": PTRC_VERSION, "well": header_well},
+                              default=_json_default).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(header_bytes))
+
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(PTRC_MAGIC, PTRC_VERSION, 0, len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b"\x00" * (data_start - f.tell()))
+        for block_offset, block in blocks:
+            f.write(b"\x00" * (data_start + block_offset - f.tell()))
+            f.write(memoryview(block).cast("B"))
+    os.replace(tmp_path, file_path)
+
+
+def write_well_file(file_path: str, well_data: Dict[str, Any], fmt: Optional[str] = None, indent: Optional[int] = None) -> str:
+    """
+    Write a well dictionary to a .ptrc file.
+
+    Args:
+        file_path: Destination path
+        well_data: Well dictionary (logs may be lists or NumPy arrays)
+        fmt: FORMAT_JSON or FORMAT_V2. Defaults to the format of the existing
+             file, or DEFAULT_WELL_FORMAT for new files
+        indent: JSON indentation (legacy format only)
+
+    Returns:
+        The format that was written
+    """
+    if fmt is None:
+        fmt = detect_well_format(file_path) if os.path.exists(file_path) else DEFAULT_WELL_FORMAT
+
+    if fmt == FORMAT_V2:
+        _write_v2(file_path, well_data)
+    elif fmt == FORMAT_JSON:
+        # Encoded before the file is opened: an unserializable value must not truncate it
+        text = json.dumps(well_data, indent=indent, default=_json_default)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        raise ValueError(f"Unknown .ptrc format: {fmt}")
+
+    for listener in _write_listeners:
+        try:
+            listener(file_path, well_data)
+        except Exception as e:
+            print(f"[PtrcFileIO] Write listener failed for {file_path}: {e}")
+    return fmt
+
+
+def convert_project_wells(project_path: str, fmt: str = FORMAT_V2) -> Dict[str, Any]:
+    """
+    Rewrite every .ptrc file of a project in place using the given format.
+
+    Args:
+        project_path: Project directory path
+        fmt: Target format (FORMAT_V2 or FORMAT_JSON)
+
+    Returns:
+        Dictionary with converted, skipped (already in target format) and failed wells
+    """
+    if fmt not in (FORMAT_JSON, FORMAT_V2):
+        raise ValueError(f"Unknown .ptrc format: {fmt}")
+
+    wells_dir = os.path.join(project_path, "10-WELLS")
+    converted, skipped, failed = [], [], []
+
+    if os.path.isdir(wells_dir):
+        for filename in sorted(os.listdir(wells_dir)):
+            if not filename.endswith(".ptrc"):
+                continue
+            well_name = filename[:-len(".ptrc")]
+            file_path = os.path.join(wells_dir, filename)
+            try:
+                if detect_well_format(file_path) == fmt:
+                    skipped.append(well_name)
+                    continue
+                well_data = read_well_file(file_path, arrays=True)
+                write_well_file(file_path, well_data, fmt=fmt)
+                converted.append(well_name)
+            except Exception as e:
+                print(f"[PtrcFileIO] Failed to convert {file_path}: {e}")
+                failed.append({"well": well_name, "error": str(e)})
+
+    return {
+        "format": fmt,
+        "converted": converted,
+        "skipped": skipped,
+        "failed": failed
+    }
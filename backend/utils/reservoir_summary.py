@@ -0,0 +1,249 @@
+"""
+Reservoir summary (RESSUM) engine.
+
+Computes one RESSUM row per zone and well from porosity, water saturation and
+shale volume logs, a set of tops and net pay cutoffs:
+- zones run from each top to the next one (the last top closes the last zone)
+- samples are assigned to zones with searchsorted on the sorted depth index
+- each sample represents half the distance to its neighbours
+- a sample is net pay if PHI >= phi cutoff, SW <= sw cutoff and VSH <= vsh cutoff
+
+All zone sums are taken at once with np.add.reduceat over a stacked block of
+weighted samples. Averages over net pay: PHIE and VSH are thickness weighted,
+SWE is pore-volume (phi * h) weighted.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from multiprocessing import get_context
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.fe_data_objects import RESSUM, Dataset, Well, LazyWell
+from utils.ptrc_file_io import read_well_file
+
+
+DEFAULT_PHI_CUTOFF = 0.08
+DEFAULT_SW_CUTOFF = 0.6
+DEFAULT_VSH_CUTOFF = 0.4
+
+DEPTH_REFERENCE = "MD"
+
+
+def find_tops(well: Well, tops_dataset: Optional[str] = None) -> Tuple[np.ndarray, List[str]]:
+    """
+    Get tops of a well as sorted (depths, names).
+
+    Args:
+        well: Well object
+        tops_dataset: Name of the tops dataset (defaults to the first 'Tops' dataset)
+
+    Zone names come from the TOP (or ZONE) log, or the first string log of the dataset.
+
+    Returns:
+        Tuple of (depth array, zone names); empty if the well has no tops
+    """
+    dataset = None
+    for candidate in well.datasets:
+        if tops_dataset is not None:
+            if candidate.name == tops_dataset:
+                dataset = candidate
+                break
+        elif candidate.type.upper() == 'TOPS' or candidate.name.upper().startswith('TOPS'):
+            dataset = candidate
+            break
+
+    if dataset is None:
+        return np.empty(0), []
+
+    names_log = next((log for log in dataset.well_logs if log.name.upper() in ('TOP', 'ZONE')), None)
+    if names_log is None:
+        # Fall back to the first string log of the tops dataset
+        names_log = next((log for log in dataset.well_logs if log.is_categorical), None)
+    if names_log is None:
+        return np.empty(0), []
+
+    names = names_log.log
+    count = min(len(dataset.index_log), len(names))
+    depths = dataset.index_log[:count]
+    valid = np.isfinite(depths) & np.array([name is not None for name in names[:count]], dtype=bool)
+    order = np.argsort(depths[valid], kind='stable')
+    return depths[valid][order], [str(name) for name in np.asarray(names[:count], dtype=object)[valid][order]]
+
+
+def _sample_thickness(depths: np.ndarray) -> np.ndarray:
+    """Thickness represented by each sample of a sorted depth array."""
+    if len(depths) < 2:
+        return np.zeros(len(depths))
+    edges = np.concatenate(([depths[0]], (depths[:-1] + depths[1:]) / 2, [depths[-1]]))
+    thickness = np.diff(edges)
+    # End samples represent half a step on their outer side as well
+    thickness[0] += (depths[1] - depths[0]) / 2
+    thickness[-1] += (depths[-1] - depths[-2]) / 2
+    return thickness
+
+
+def compute_ressum(dataset: Dataset, tops: np.ndarray, zone_names: List[str],
+                   phi_log: str, sw_log: str, vsh_log: str,
+                   phi_cutoff: float = DEFAULT_PHI_CUTOFF, sw_cutoff: float = DEFAULT_SW_CUTOFF,
+                   vsh_cutoff: float = DEFAULT_VSH_CUTOFF, well_name: Optional[str] = None) -> List[RESSUM]:
+    """
+    Compute RESSUM rows for every zone of one dataset.
+
+    Args:
+        dataset: Dataset holding the porosity, saturation and shale volume logs
+        tops: Sorted top depths (zone i spans tops[i] to tops[i + 1])
+        zone_names: Zone names, one per top
+        phi_log, sw_log, vsh_log: Log names
+        phi_cutoff, sw_cutoff, vsh_cutoff: Net pay cutoffs
+        well_name: Well name for the rows (defaults to dataset.wellname)
+
+    Returns:
+        List of RESSUM rows (averages are NaN for zones without net pay)
+    """
+    if len(tops) < 2:
+        return []
+
+    logs = {well_log.name: well_log for well_log in dataset.well_logs}
+    missing = [name for name in (phi_log, sw_log, vsh_log) if name not in logs]
+    if missing:
+        raise KeyError(f"Log(s) {', '.join(missing)} not found in dataset '{dataset.name}'")
+
+    depth_index = dataset.depth_index
+    depths = depth_index.depths[:depth_index.count]
+    order = depth_index.order[:depth_index.count] if depth_index.order is not None else None
+
+    def sorted_log(name: str) -> np.ndarray:
+        values = np.full(len(dataset.index_log), np.nan)
+        log_values = logs[name].log
+        if log_values.dtype.kind != 'f':
+            raise ValueError(f"Log '{name}' is not numeric")
+        count = min(len(values), len(log_values))
+        values[:count] = log_values[:count]
+        return values[order] if order is not None else values[:depth_index.count]
+
+    phi, sw, vsh = sorted_log(phi_log), sorted_log(sw_log), sorted_log(vsh_log)
+    thickness = _sample_thickness(depths)
+
+    with np.errstate(invalid='ignore'):
+        net = (phi >= phi_cutoff) & (sw <= sw_cutoff) & (vsh <= vsh_cutoff)
+    net_h = np.where(net, thickness, 0.0)
+    phi_net = np.where(net, phi, 0.0)
+    sw_net = np.where(net, sw, 0.0)
+    vsh_net = np.where(net, vsh, 0.0)
+
+    weighted = np.vstack([
+        net_h,
+        net_h * phi_net,
+        net_h * phi_net * (1 - sw_net),
+        net_h * phi_net * sw_net,
+        net_h * vsh_net,
+    ])
+
+    # Zone i holds samples in [tops[i], tops[i + 1]); samples outside all zones are dropped
+    bounds = np.searchsorted(depths, tops, side='left')
+    starts, stops = bounds[:-1], bounds[1:]
+    sums = np.zeros((weighted.shape[0], len(starts)))
+    non_empty = np.flatnonzero(stops > starts)
+    if len(non_empty):
+        # Empty zones hold no samples, so consecutive non-empty zones are contiguous segments;
+        # an extra boundary at the base of the last zone cuts off samples below it
+        indices = starts[non_empty]
+        base = stops[non_empty[-1]]
+        if base < len(depths):
+            indices = np.append(indices, base)
+        sums[:, non_empty] = np.add.reduceat(weighted, indices, axis=1)[:, :len(non_empty)]
+
+    netpay, phih, sophih, swph, vshh = sums
+    gross = np.diff(tops)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        phie = np.where(netpay > 0, phih / netpay, np.nan)
+        swe = np.where(phih > 0, swph / phih, np.nan)
+        vsh_avg = np.where(netpay > 0, vshh / netpay, np.nan)
+        ntg = np.where(gross > 0, netpay / gross, np.nan)
+
+    well_name = well_name or dataset.wellname
+    return [
+        RESSUM(well=well_name, interval=zone_names[i], top=float(tops[i]), bottom=float(tops[i + 1]),
+               gross=float(gross[i]), phiec=phi_cutoff, swec=sw_cutoff, vshc=vsh_cutoff,
+               phie=float(phie[i]), swe=float(swe[i]), vsh=float(vsh_avg[i]),
+               phih=float(phih[i]), sophih=float(sophih[i]), netpay=float(netpay[i]),
+               ntg=float(ntg[i]), dataset=dataset.name, reference=DEPTH_REFERENCE)
+        for i in range(len(starts))
+    ]
+
+
+def _ressum_well_file(file_path: str, dataset_name: str, phi_log: str, sw_log: str, vsh_log: str,
+                      phi_cutoff: float, sw_cutoff: float, vsh_cutoff: float,
+                      tops_dataset: Optional[str]) -> Dict[str, Any]:
+    """Process pool worker: RESSUM rows of one well file."""
+    well_name = os.path.basename(file_path)[:-len(".ptrc")]
+    try:
+        # Lazy view: only the tops and the requested logs are converted
+        well = LazyWell(read_well_file(file_path, arrays=True))
+        dataset = next((ds for ds in well.datasets if ds.name == dataset_name), None)
+        tops, zone_names = find_tops(well, tops_dataset)
+        if dataset is None or len(tops) < 2:
+            return {"well": well_name, "status": "skipped", "rows": []}
+        rows = compute_ressum(dataset, tops, zone_names, phi_log, sw_log, vsh_log,
+                              phi_cutoff, sw_cutoff, vsh_cutoff, well_name=well.well_name)
+        return {"well": well_name, "status": "computed", "rows": rows}
+    except Exception as e:
+        return {"well": well_name, "status": "failed", "error": str(e), "rows": []}
+
+
+def compute_project_ressum(project_path: str, dataset_name: str, phi_log: str, sw_log: str, vsh_log: str,
+                           phi_cutoff: float = DEFAULT_PHI_CUTOFF, sw_cutoff: float = DEFAULT_SW_CUTOFF,
+                           vsh_cutoff: float = DEFAULT_VSH_CUTOFF, tops_dataset: Optional[str] = None,
+                           max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Compute RESSUM rows for every zone of every well in a project, one process per well.
+    Wells without the dataset or without at least two tops are skipped.
+
+    Returns:
+        Dictionary with rows (RESSUM list), computed, skipped and failed wells
+    """
+    wells_dir = os.path.join(project_path, "10-WELLS")
+    file_paths = []
+    if os.path.isdir(wells_dir):
+        file_paths = [os.path.join(wells_dir, name) for name in sorted(os.listdir(wells_dir)) if name.endswith(".ptrc")]
+
+    job_args = (dataset_name, phi_log, sw_log, vsh_log, phi_cutoff, sw_cutoff, vsh_cutoff, tops_dataset)
+    if max_workers == 1 or len(file_paths) <= 1:
+        results = [_ressum_well_file(path, *job_args) for path in file_paths]
+    else:
+        # Spawned, not forked: a forked child would inherit the server's locks and SQLite connections
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn")) as executor:
+            # Larger chunks keep per-task overhead low for projects with hundreds of wells
+            chunksize = max(1, len(file_paths) // ((max_workers or os.cpu_count() or 1) * 4))
+            results = list(executor.map(_ressum_well_file, file_paths,
+                                        *[[arg] * len(file_paths) for arg in job_args],
+                                        chunksize=chunksize))
+
+    rows = [row for result in results for row in result["rows"]]
+    computed = [r["well"] for r in results if r["status"] == "computed"]
+    skipped = [r["well"] for r in results if r["status"] == "skipped"]
+    failed = [{"well": r["well"], "error": r["error"]} for r in results if r["status"] == "failed"]
+    print(f"[RESSUM] {len(rows)} zone(s) from {len(computed)} well(s), {len(skipped)} skipped, {len(failed)} failed")
+
+    return {
+        "rows": rows,
+        "computed": computed,
+        "skipped": skipped,
+        "failed": failed
+    }
+
+
+def ressum_table(rows: List[RESSUM]) -> pd.DataFrame:
+    """RESSUM rows as a DataFrame with upper-case column names."""
+    columns = [name.upper() for name in RESSUM.__dataclass_fields__]
+    return pd.DataFrame([asdict(row) for row in rows]).rename(columns=str.upper).reindex(columns=columns)
+
+
+def export_ressum(rows: List[RESSUM], output_path: str) -> str:
+    """Write RESSUM rows to a CSV file and return the path."""
+    ressum_table(rows).to_csv(output_path, index=False, float_format='%.4f')
+    return output_path
@@ -13,6 +13,10 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from decimal import Decimal
 
+import numpy as np
+
+from utils.fe_data_objects import log_array_to_list
+
 
 DB_DIR = Path(__file__).parent.parent.parent / "data"
 DB_FILE = DB_DIR / "petrophysics.db"
@@ -65,6 +69,9 @@ def serialize_value(value: Any) -> Any:
         return {key: serialize_value(val) for key, val in value.items()}
     elif isinstance(value, set):
         return list(value)
+    elif isinstance(value, np.ndarray):
+        # Cached well columns (NaN as None, like the sample lists of .ptrc files)
+        return log_array_to_list(value) if value.dtype.kind == 'f' else value.tolist()
     else:
         return str(value)
 
@@ -267,7 +274,7 @@ class SQLiteStorageService:
                     """, (
                         session_id,
                         well_name,
-                        json.dumps(well_data.get("datasets", [])),
+                        json.dumps(well_data.get("datasets", []), default=serialize_value),
                         len(all_logs),
                         now.isoformat()
                     ))
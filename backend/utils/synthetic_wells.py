@@ -0,0 +1,126 @@
+"""
+Synthetic well generator for benchmarks.
+
+Builds wells in the Well.to_dict() layout (WIRE logs, a TOPS dataset and a few
+constants) and can write them out as a project directory with a 10-WELLS folder.
+"""
+
+import os
+import zlib
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from utils.fe_data_objects import log_array_to_list
+from utils.ptrc_file_io import write_well_file, FORMAT_JSON
+
+
+TOP_NAMES = ["SAND-A", "SHALE-A", "SAND-B", "SHALE-B", "SAND-C", "COAL", "SAND-D", "BASEMENT"]
+
+
+def generate_synthetic_well(well_name: str, n_samples: int = 5000, n_logs: int = 12,
+                            step: float = 0.1524, top_depth: float = 1000.0,
+                            seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Generate one synthetic well dictionary.
+
+    Args:
+        well_name: Well name
+        n_samples: Number of depth samples in the WIRE dataset
+        n_logs: Number of continuous float logs
+        step: Depth step of the WIRE index
+        top_depth: First depth of the WIRE index
+        seed: Random seed (derived from the well name if not given)
+
+    Returns:
+        Well dictionary in the Well.to_dict() layout
+    """
+    rng = np.random.default_rng(seed if seed is not None else zlib.crc32(well_name.encode()))
+    now = datetime.now().isoformat()
+    depths = top_depth + np.arange(n_samples) * step
+
+    wire_logs = []
+    for i in range(n_logs):
+        values = np.cumsum(rng.normal(0.0, 1.0, n_samples)) + 50.0
+        # Sprinkle missing samples the way real LAS nulls appear
+        values[rng.random(n_samples) < 0.02] = np.nan
+        wire_logs.append({
+            "name": f"LOG{i:02d}",
+            "date": now,
+            "description": f"Synthetic log {i}",
+            "dtst": "WIRE",
+            "interpolation": "CONTINUOUS",
+            "log_type": "float",
+            "log": log_array_to_list(values.round(4))
+        })
+
+    n_tops = len(TOP_NAMES)
+    top_depths = np.sort(rng.uniform(depths[0], depths[-1], n_tops)).round(2).tolist()
+    tops = {
+        "name": "TOPS",
+        "date": now,
+        "description": "Formation tops",
+        "dtst": "TOPS",
+        "interpolation": "TOP",
+        "log_type": "str",
+        "log": list(TOP_NAMES)
+    }
+
+    return {
+        "date_created": now,
+        "well_name": well_name,
+        "well_type": "Dev",
+        "datasets": [
+            {
+                "date_created": now,
+                "name": "WIRE",
+                "type": "Cont",
+                "wellname": well_name,
+                "index_name": "DEPTH",
+                "index_log": depths.round(4).tolist(),
+                "well_logs": wire_logs,
+                "metadata": {},
+                "constants": [
+                    {"name": "KB", "value": float(rng.uniform(10, 40)), "tag": "m"},
+                    {"name": "UWI", "value": f"SYN-{well_name}", "tag": ""}
+                ]
+            },
+            {
+                "date_created": now,
+                "name": "TOPS",
+                "type": "Tops",
+                "wellname": well_name,
+                "index_name": "DEPTH",
+                "index_log": top_depths,
+                "well_logs": [tops],
+                "metadata": {},
+                "constants": []
+            }
+        ]
+    }
+
+
+def generate_synthetic_project(project_path: str, n_wells: int = 50, fmt: str = FORMAT_JSON,
+                               **well_kwargs) -> List[str]:
+    """
+    Write a synthetic project (project_path/10-WELLS/*.ptrc).
+
+    Args:
+        project_path: Project directory to create
+        n_wells: Number of wells
+        fmt: .ptrc format to write
+        **well_kwargs: Passed to generate_synthetic_well
+
+    Returns:
+        List of written file paths
+    """
+    wells_dir = os.path.join(project_path, "10-WELLS")
+    os.makedirs(wells_dir, exist_ok=True)
+    paths = []
+    for i in range(n_wells):
+        well_name = f"SYN-{i:04d}"
+        file_path = os.path.join(wells_dir, f"{well_name}.ptrc")
+        write_well_file(file_path, generate_synthetic_well(well_name, seed=i, **well_kwargs), fmt=fmt)
+        paths.append(file_path)
+    return paths
@@ -0,0 +1,444 @@
+"""
+Byte-budgeted in-memory cache for well data.
+
+Entries are charged an estimated byte size and evicted against a memory budget
+with a segmented LRU policy; every operation is O(1):
+- active:    wells of the active project, LRU within their own byte budget
+             (protected from other projects, but no longer unbounded)
+- probation: other wells on first use
+- protected: other wells that were hit again while on probation; overflow is
+             demoted back to probation instead of being evicted
+
+When over budget, probation is evicted first, then protected, then active.
+The budget also shrinks under process RSS pressure (RSS above rss_limit_bytes).
+
+Entries are also in one of two tiers: hot entries hold the decoded well
+dictionary; entries idle for a while can be frozen into the cold tier, their
+columns packed in the v2 block layout, byte-shuffled and compressed with
+zlib or lzma (see freeze_well). A cold entry is thawed on its next hit.
+
+The cache is not locked internally; callers hold CACHE_LOCK like before.
+"""
+
+import copy
+import lzma
+import os
+import sys
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from utils.ptrc_file_io import encode_well_blocks, decode_well_blocks
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+MB = 1024 * 1024
+
+# Defaults, overridable through the environment
+DEFAULT_MAX_BYTES = int(float(os.environ.get("WELL_CACHE_MAX_MB", 4096)) * MB)
+DEFAULT_ACTIVE_FRACTION = float(os.environ.get("WELL_CACHE_ACTIVE_FRACTION", 0.75))
+DEFAULT_PROTECTED_FRACTION = 0.8  # Share of the non-active budget kept for the protected segment
+DEFAULT_RSS_LIMIT_BYTES = int(float(os.environ.get("WELL_CACHE_RSS_LIMIT_MB", 0)) * MB)  # 0 disables
+
+# Cold tier: entries idle this long are compressed (0 disables), and the codec used
+DEFAULT_COLD_AFTER_SECONDS = float(os.environ.get("WELL_CACHE_COLD_AFTER_SECONDS", 900))
+DEFAULT_COLD_CODEC = os.environ.get("WELL_CACHE_COLD_CODEC", "zlib")
+
+ACTIVE = "active"
+PROBATION = "probation"
+PROTECTED = "protected"
+
+# Approximate CPython costs: list slot + boxed float, and per-container overhead
+_LIST_SLOT_BYTES = 8
+_FLOAT_BYTES = 24
+_CONTAINER_BYTES = 64
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the resident size of a well dictionary in bytes.
+    Sample lists are costed from their length and first element, so the cost is
+    proportional to the number of logs, not samples.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes + _CONTAINER_BYTES
+    if isinstance(value, dict):
+        return _CONTAINER_BYTES + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return _CONTAINER_BYTES
+        first = value[0]
+        if isinstance(first, (dict, list, tuple)):
+            return _CONTAINER_BYTES + sum(estimate_size(item) for item in value)
+        # Flat sample list: strings of a log usually share a few objects, numbers do not
+        element = _FLOAT_BYTES if not isinstance(first, str) else 0
+        return _CONTAINER_BYTES + len(value) * (_LIST_SLOT_BYTES + element)
+    if isinstance(value, str):
+        return sys.getsizeof(value)
+    return _FLOAT_BYTES
+
+
+def process_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (None if it cannot be determined)."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+_CODECS = {
+    "zlib": (lambda raw: zlib.compress(raw, 1), zlib.decompress),
+    "lzma": (lambda raw: lzma.compress(raw, preset=1), lzma.decompress),
+}
+# Byte shuffle lane width: the matching bytes of neighbouring float64 samples end up
+# next to each other, which compresses far better than interleaved samples
+_SHUFFLE_LANES = 8
+
+
+def freeze_well(data: Dict[str, Any], codec: str = DEFAULT_COLD_CODEC) -> Optional[Dict[str, Any]]:
+    """
+    Compress a well dictionary for the cold tier.
+
+    Returns:
+        {"codec", "header", "blob", "raw_bytes"}, or None if the well has columns
+        without a block encoding (mixed sample types)
+    """
+    if codec not in _CODECS:
+        raise ValueError(f"Unknown cold tier codec: {codec}")
+    try:
+        header, blocks, size = encode_well_blocks(data)
+    except (TypeError, ValueError):
+        return None
+
+    # Blocks are 8-byte aligned, so the buffer splits into whole lanes
+    buffer = np.zeros(size, dtype=np.uint8)
+    for offset, block in blocks:
+        buffer[offset:offset + block.nbytes] = block.view(np.uint8)
+    shuffled = buffer.reshape(-1, _SHUFFLE_LANES).T.tobytes()
+    return {"codec": codec, "header": header, "blob": _CODECS[codec][0](shuffled), "raw_bytes": size}
+
+
+def thaw_well(frozen: Dict[str, Any]) -> Dict[str, Any]:
+    """Decompress a frozen well into a new dictionary in the read_well_file() layout."""
+    shuffled = np.frombuffer(_CODECS[frozen["codec"]][1](frozen["blob"]), dtype=np.uint8)
+    # Writable buffer holding only the columns: the thawed arrays are views of it
+    buffer = np.ascontiguousarray(shuffled.reshape(_SHUFFLE_LANES, -1).T).reshape(-1)
+    # decode_well_blocks fills the header in place; the frozen copy must stay intact
+    return decode_well_blocks(copy.deepcopy(frozen["header"]), buffer, arrays=True)
+
+
+def frozen_size(frozen: Dict[str, Any]) -> int:
+    """Resident size of a frozen well: compressed columns plus the header."""
+    return len(frozen["blob"]) + estimate_size(frozen["header"])
+
+
+class WellCache:
+    """
+    Segmented LRU cache of well entries with byte accounting.
+
+    Entries are dictionaries {"data": well_dict, "source": ..., "project": project_id};
+    the cache adds "bytes" and "last_access" to each entry. Cold entries have
+    "data" None and hold the compressed well in "frozen".
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, active_fraction: float = DEFAULT_ACTIVE_FRACTION,
+                 protected_fraction: float = DEFAULT_PROTECTED_FRACTION, rss_limit_bytes: int = DEFAULT_RSS_LIMIT_BYTES):
+        self.max_bytes = max_bytes
+        self.active_fraction = active_fraction
+        self.protected_fraction = protected_fraction
+        self.rss_limit_bytes = rss_limit_bytes
+        self.active_project: Optional[str] = None
+
+        self._segments: Dict[str, OrderedDict] = {
+            ACTIVE: OrderedDict(),
+            PROBATION: OrderedDict(),
+            PROTECTED: OrderedDict()
+        }
+        self._segment_of: Dict[str, str] = {}
+        self._bytes = {ACTIVE: 0, PROBATION: 0, PROTECTED: 0}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+        self.rss_evictions = 0
+        self.evictions_by_source: Dict[str, int] = {}
+        self.cold_hits = 0
+        self.freezes = 0
+        self.thaws = 0
+        self.freeze_seconds = 0.0
+        self.thaw_seconds = 0.0
+
+    # --- budgets ---
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self._bytes.values())
+
+    @property
+    def active_budget(self) -> int:
+        return int(self.max_bytes * self.active_fraction)
+
+    @property
+    def protected_budget(self) -> int:
+        return int((self.max_bytes - min(self._bytes[ACTIVE], self.active_budget)) * self.protected_fraction)
+
+    # --- mapping interface ---
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._segment_of
+
+    def __len__(self) -> int:
+        return len(self._segment_of)
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        return self._segments[self._segment_of[key]][key]
+
+    def __delitem__(self, key: str):
+        self.pop(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._segment_of))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Entry without touching recency or statistics."""
+        segment = self._segment_of.get(key)
+        return self._segments[segment][key] if segment is not None else default
+
+    def keys(self) -> List[str]:
+        return list(self._segment_of)
+
+    def values(self) -> List[Dict[str, Any]]:
+        return [segment[key] for segment in self._segments.values() for key in segment]
+
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        return [(key, segment[key]) for segment in self._segments.values() for key in segment]
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        segment = self._segment_of.pop(key, None)
+        if segment is None:
+            return default
+        entry = self._segments[segment].pop(key)
+        self._bytes[segment] -= entry["bytes"]
+        return entry
+
+    # --- cache operations ---
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Entry for key, recording a hit (recency update, probation -> protected) or a miss.
+        """
+        segment = self._segment_of.get(key)
+        if segment is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entries = self._segments[segment]
+        entries[key]["last_access"] = time.monotonic()
+        if entries[key].get("frozen") is not None:
+            self.cold_hits += 1
+        if segment == PROBATION:
+            entry = entries.pop(key)
+            self._bytes[PROBATION] -= entry["bytes"]
+            self._insert(PROTECTED, key, entry)
+            self._rebalance_protected()
+            return entry
+        entries.move_to_end(key)
+        return entries[key]
+
+    def put(self, key: str, entry: Dict[str, Any], size: Optional[int] = None) -> List[str]:
+        """
+        Insert or replace an entry and evict down to the budget.
+
+        Args:
+            key: Cache key
+            entry: Entry dictionary (must contain "data" and "project")
+            size: Size in bytes (estimated from entry["data"] if not given)
+
+        Returns:
+            Keys that were evicted
+        """
+        entry["bytes"] = size if size is not None else estimate_size(entry["data"])
+        entry["last_access"] = time.monotonic()
+        previous = self._segment_of.get(key)
+        if previous is not None:
+            self.pop(key)
+
+        if entry.get("project") == self.active_project and self.active_project is not None:
+            segment = ACTIVE
+        else:
+            # Replacing a known entry keeps its protected status
+            segment = PROTECTED if previous == PROTECTED else PROBATION
+        self._insert(segment, key, entry)
+        self._rebalance_protected()
+        return self._evict(keep=key)
+
+    def idle_keys(self, idle_seconds: float) -> List[str]:
+        """Hot entries not used for idle_seconds, least recently used first per segment."""
+        cutoff = time.monotonic() - idle_seconds
+        return [key for segment in self._segments.values() for key, entry in segment.items()
+                if entry.get("frozen") is None and entry["last_access"] < cutoff]
+
+    def freeze(self, key: str, frozen: Dict[str, Any], seconds: float = 0.0):
+        """Move an entry to the cold tier, replacing its data by the frozen well."""
+        segment = self._segment_of[key]
+        entry = self._segments[segment][key]
+        size = frozen_size(frozen)
+        self._bytes[segment] += size - entry["bytes"]
+        # frozen is set before data is cleared: readers seeing no data always find the frozen well
+        entry.update(frozen=frozen, data=None, bytes=size)
+        self.freezes += 1
+        self.freeze_seconds += seconds
+
+    def thaw(self, key: str, data: Dict[str, Any], seconds: float = 0.0) -> List[str]:
+        """
+        Move a cold entry back to the hot tier with its decompressed data.
+
+        Returns:
+            Keys that were evicted to make room
+        """
+        segment = self._segment_of[key]
+        entry = self._segments[segment][key]
+        size = estimate_size(data)
+        self._bytes[segment] += size - entry["bytes"]
+        entry.update(data=data, bytes=size)
+        entry.pop("frozen", None)
+        self.thaws += 1
+        self.thaw_seconds += seconds
+        self._rebalance_protected()
+        return self._evict(keep=key)
+
+    def set_active_project(self, project: Optional[str]) -> List[str]:
+        """
+        Make project the active one: its entries move to the active segment,
+        entries of the previous active project are demoted to probation.
+
+        Returns:
+            Keys that were evicted
+        """
+        if project == self.active_project:
+            return []
+        demoted = list(self._segments[ACTIVE].items())
+        self._segments[ACTIVE].clear()
+        self._bytes[ACTIVE] = 0
+        for key, entry in demoted:
+            self._insert(PROBATION, key, entry)
+
+        self.active_project = project
+        if project is not None:
+            for segment in (PROBATION, PROTECTED):
+                for key in [key for key, entry in self._segments[segment].items() if entry.get("project") == project]:
+                    entry = self._segments[segment].pop(key)
+                    self._bytes[segment] -= entry["bytes"]
+                    self._insert(ACTIVE, key, entry)
+        return self._evict()
+
+    def enforce_budget(self) -> List[str]:
+        """Evict down to the budget (e.g. after the budget or RSS limit changed)."""
+        return self._evict()
+
+    def _insert(self, segment: str, key: str, entry: Dict[str, Any]):
+        self._segments[segment][key] = entry
+        self._segment_of[key] = segment
+        self._bytes[segment] += entry["bytes"]
+
+    def _rebalance_protected(self):
+        """Demote least recently used protected entries to probation while over the protected budget."""
+        protected = self._segments[PROTECTED]
+        while self._bytes[PROTECTED] > self.protected_budget and len(protected) > 1:
+            key, entry = protected.popitem(last=False)
+            self._bytes[PROTECTED] -= entry["bytes"]
+            self._insert(PROBATION, key, entry)
+
+    def _evict_one(self, segment: str, keep: Optional[str]) -> Optional[str]:
+        entries = self._segments[segment]
+        key = next(iter(entries), None)
+        if key is None or key == keep:
+            return None
+        entry = self.pop(key)
+        source = entry.get("source", "unknown")
+        self.evictions_by_source[source] = self.evictions_by_source.get(source, 0) + 1
+        self.evictions += 1
+        self.evicted_bytes += entry["bytes"]
+        return key
+
+    def _evict(self, keep: Optional[str] = None) -> List[str]:
+        """Evict least recently used entries until the active segment and the total fit their budgets."""
+        evicted = []
+        while self._bytes[ACTIVE] > self.active_budget:
+            key = self._evict_one(ACTIVE, keep)
+            if key is None:
+                break
+            evicted.append(key)
+
+        budget = self.max_bytes
+        rss = process_rss() if self.rss_limit_bytes else None
+        if rss is not None and rss > self.rss_limit_bytes:
+            # Memory pressure: give back what the process is over its limit
+            budget = max(0, min(budget, self.total_bytes - (rss - self.rss_limit_bytes)))
+
+        while self.total_bytes > budget:
+            key = (self._evict_one(PROBATION, keep) or self._evict_one(PROTECTED, keep)
+                   or self._evict_one(ACTIVE, keep))
+            if key is None:
+                break
+            evicted.append(key)
+            if budget < self.max_bytes:
+                self.rss_evictions += 1
+        return evicted
+
+    def clear(self):
+        for segment in self._segments.values():
+            segment.clear()
+        self._segment_of.clear()
+        self._bytes = {ACTIVE: 0, PROBATION: 0, PROTECTED: 0}
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics: entries and bytes per segment, budgets, hit ratio and evictions."""
+        lookups = self.hits + self.misses
+        tiers = {"hot": {"entries": 0, "bytes": 0}, "cold": {"entries": 0, "bytes": 0, "raw_bytes": 0}}
+        for entry in self.values():
+            frozen = entry.get("frozen")
+            tier = tiers["hot" if frozen is None else "cold"]
+            tier["entries"] += 1
+            tier["bytes"] += entry["bytes"]
+            if frozen is not None:
+                tier["raw_bytes"] += frozen["raw_bytes"]
+        tiers["hot"]["hits"] = self.hits - self.cold_hits
+        tiers["cold"]["hits"] = self.cold_hits
+        tiers["hot"]["hit_ratio"] = (self.hits - self.cold_hits) / lookups if lookups else None
+        tiers["cold"]["hit_ratio"] = self.cold_hits / lookups if lookups else None
+        tiers["cold"]["freezes"] = self.freezes
+        tiers["cold"]["thaws"] = self.thaws
+        tiers["cold"]["freeze_seconds"] = round(self.freeze_seconds, 3)
+        tiers["cold"]["thaw_seconds"] = round(self.thaw_seconds, 3)
+        return {
+            "entries": len(self),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "active_budget_bytes": self.active_budget,
+            "rss_limit_bytes": self.rss_limit_bytes,
+            "rss_bytes": process_rss(),
+            "segments": {
+                name: {"entries": len(entries), "bytes": self._bytes[name]}
+                for name, entries in self._segments.items()
+            },
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else None,
+            "evictions": self.evictions,
+            "evicted_bytes": self.evicted_bytes,
+            "rss_evictions": self.rss_evictions,
+            "evictions_by_source": dict(self.evictions_by_source),
+            "tiers": tiers
+        }
@@ -0,0 +1,231 @@
+"""
+Well cache metrics and sampled logging.
+
+CacheMetrics collects what the cache counters in WellCache do not know about:
+hits and misses by source, disk read and parse latency of well loads, and
+contention on single keys (requests waiting on another request's load of the
+same well). render_prometheus() turns these, the WellCache statistics and the
+bytes resident per project into the Prometheus text exposition format served
+by /api/storage/cache-metrics.
+
+SampledLog keeps per-request cache messages (hits, misses, evictions) off the
+hot path: each message kind is logged once and then once every `every` times,
+with the number of messages suppressed in between.
+"""
+
+import bisect
+import copy
+import logging
+import os
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Any, Iterable, List, Tuple
+
+
+# Latency histogram buckets in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Log 1 of every N per-request cache messages (1 logs all of them)
+DEFAULT_LOG_SAMPLE = int(os.environ.get("WELL_CACHE_LOG_SAMPLE", 100))
+
+# Keys listed individually in the contention metric
+TOP_CONTENDED_KEYS = 10
+
+
+class Histogram:
+    """Fixed-bucket histogram (not locked, callers serialize observe())."""
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(upper bound, observations <= bound) pairs, ending with +Inf."""
+        total, result = 0, []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        return {"count": self.count, "sum_seconds": round(self.sum, 4),
+                "mean_seconds": round(self.sum / self.count, 6) if self.count else None}
+
+
+class CacheMetrics:
+    """Thread-safe counters and histograms of the file well storage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+        self.read_seconds = Histogram()
+        self.parse_seconds = Histogram()
+        self.wait_seconds = Histogram()
+        self.key_waits: Counter = Counter()
+        self.waiters: Dict[str, int] = defaultdict(int)
+        self.max_waiters = 0
+
+    def hit(self, source: str):
+        """Cache hit on an entry loaded by source (preload, lazy, saved)."""
+        with self._lock:
+            self.hits[source] += 1
+
+    def miss(self, source: str):
+        """Cache miss of a request kind (lazy, preload, cache_only)."""
+        with self._lock:
+            self.misses[source] += 1
+
+    def observe_load(self, read_seconds: float, parse_seconds: float):
+        """Latency of one well load: reading the file and decoding it."""
+        with self._lock:
+            self.read_seconds.observe(read_seconds)
+            self.parse_seconds.observe(parse_seconds)
+
+    def wait_started(self, key: str):
+        """A request started waiting on another request's load of key."""
+        with self._lock:
+            self.waiters[key] += 1
+            self.key_waits[key] += 1
+            self.max_waiters = max(self.max_waiters, self.waiters[key])
+
+    def wait_finished(self, key: str, seconds: float):
+        with self._lock:
+            self.waiters[key] -= 1
+            if self.waiters[key] <= 0:
+                del self.waiters[key]
+            self.wait_seconds.observe(seconds)
+
+    def export(self) -> Dict[str, Any]:
+        """Consistent copy of the counters and histograms."""
+        with self._lock:
+            return {
+                "hits": dict(self.hits),
+                "misses": dict(self.misses),
+                "read_seconds": copy.deepcopy(self.read_seconds),
+                "parse_seconds": copy.deepcopy(self.parse_seconds),
+                "wait_seconds": copy.deepcopy(self.wait_seconds),
+                "max_waiters": self.max_waiters,
+                "key_waits": self.key_waits.most_common(TOP_CONTENDED_KEYS)
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits_by_source": dict(self.hits),
+                "misses_by_source": dict(self.misses),
+                "disk_read": self.read_seconds.summary(),
+                "parse": self.parse_seconds.summary(),
+                "inflight_waits": self.wait_seconds.summary(),
+                "max_waiters_per_key": self.max_waiters,
+                "most_contended_keys": self.key_waits.most_common(TOP_CONTENDED_KEYS)
+            }
+
+
+class SampledLog:
+    """Logs the first and then every `every`-th message of each kind."""
+
+    def __init__(self, logger: logging.Logger, every: int = DEFAULT_LOG_SAMPLE):
+        self.logger = logger
+        self.every = max(1, every)
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def log(self, level: int, kind: str, message: str, *args):
+        if not self.logger.isEnabledFor(level):
+            return
+        with self._lock:
+            self._counts[kind] += 1
+            count = self._counts[kind]
+        if (count - 1) % self.every:
+            return
+        if count > 1:
+            message += f" ({self.every - 1} similar suppressed)"
+        self.logger.log(level, message, *args)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class _Exposition:
+    """Builder for the Prometheus text format."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def metric(self, name: str, kind: str, help_text: str, samples: Iterable[Tuple[Dict[str, Any], Any]]):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            self.lines.append(f"{name}{_labels(**labels)} {value}")
+
+    def histogram(self, name: str, help_text: str, histogram: Histogram):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} histogram")
+        for bound, count in histogram.cumulative():
+            self.lines.append(f"{name}_bucket{_labels(le=bound)} {count}")
+        self.lines.append(f"{name}_sum {histogram.sum}")
+        self.lines.append(f"{name}_count {histogram.count}")
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def render_prometheus(storage) -> str:
+    """Metrics of a FileWellStorageService in the Prometheus text exposition format."""
+    cache_stats = storage.get_cache_stats()
+    resident = storage.resident_bytes_by_project()
+    metrics = storage.metrics.export()
+    hits, misses = metrics["hits"], metrics["misses"]
+    out = _Exposition()
+
+    out.metric("well_cache_hits_total", "counter", "Cache hits by the source that loaded the well",
+               [({"source": source}, count) for source, count in sorted(hits.items())])
+    out.metric("well_cache_misses_total", "counter", "Cache misses by request kind",
+               [({"source": source}, count) for source, count in sorted(misses.items())])
+    out.metric("well_cache_evictions_total", "counter", "Evicted wells by the source that loaded them",
+               [({"source": source}, count)
+                for source, count in sorted(cache_stats["evictions_by_source"].items())])
+    out.histogram("well_cache_disk_read_seconds", "Time reading a well file", metrics["read_seconds"])
+    out.histogram("well_cache_parse_seconds", "Time decoding a well file", metrics["parse_seconds"])
+    out.histogram("well_cache_inflight_wait_seconds",
+                  "Time requests waited on another request's load of the same well", metrics["wait_seconds"])
+    out.metric("well_cache_inflight_max_waiters", "gauge",
+               "Most requests seen waiting on one well load at the same time", [({}, metrics["max_waiters"])])
+    out.metric("well_cache_key_waits_total", "counter", "Waits on in-flight loads of the most contended wells",
+               [({"key": key}, count) for key, count in metrics["key_waits"]])
+    out.metric("well_cache_inflight_loads", "gauge", "Well loads in progress", [({}, cache_stats["inflight_loads"])])
+    lookups = sum(hits.values()) + sum(misses.values())
+    out.metric("well_cache_hit_ratio", "gauge", "Hits over lookups since startup",
+               [({}, sum(hits.values()) / lookups if lookups else 0.0)])
+    out.metric("well_cache_resident_bytes", "gauge", "Estimated bytes of cached wells by project and tier",
+               [({"project": project, "tier": tier}, size)
+                for project, tiers in sorted(resident.items()) for tier, size in sorted(tiers.items())])
+    out.metric("well_cache_entries", "gauge", "Cached wells by tier",
+               [({"tier": tier}, stats["entries"]) for tier, stats in cache_stats["tiers"].items()])
+    out.metric("well_cache_budget_bytes", "gauge", "Cache byte budget", [({}, cache_stats["max_bytes"])])
+    out.metric("well_cache_cold_freezes_total", "counter", "Wells compressed into the cold tier",
+               [({}, cache_stats["tiers"]["cold"]["freezes"])])
+    out.metric("well_cache_cold_thaws_total", "counter", "Wells decompressed from the cold tier",
+               [({}, cache_stats["tiers"]["cold"]["thaws"])])
+    out.metric("well_cache_stale_reloads_total", "counter", "Wells reloaded because their file changed",
+               [({}, cache_stats["stale_reloads"])])
+    out.metric("well_cache_invalidations_total", "counter", "Wells dropped from the cache",
+               [({}, cache_stats["invalidations"])])
+    out.metric("well_cache_saved_loads_total", "counter", "Loads avoided by sharing an in-flight load",
+               [({}, cache_stats["saved_loads"])])
+    return out.text()
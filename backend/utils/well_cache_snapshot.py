@@ -0,0 +1,200 @@
+"""
+Warm-start snapshot of the well cache.
+
+Restarting the server used to reparse every well of the current project. The
+cache is now written to one binary snapshot file on shutdown and periodically:
+a JSON header lists the cached wells (cache key, project, source, file path and
+file fingerprint), followed by their columns in the .ptrc v2 block layout
+(see ptrc_file_io.encode_well_blocks). Cold tier wells are stored as their
+compressed blob and stay cold.
+
+On startup the snapshot is memory-mapped and every well whose file still
+matches its fingerprint is decoded straight from the mapping; only wells that
+changed since the snapshot (or are missing from it) are parsed again by the
+preloader.
+
+Layout: preamble (magic, version, flags, header length), JSON header, then
+8-byte aligned data; entry offsets are relative to the start of the data.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from utils.ptrc_file_io import encode_well_blocks, decode_well_blocks
+from utils.sqlite_storage import DB_DIR
+
+
+SNAPSHOT_MAGIC = b"PTRCSNAP"
+SNAPSHOT_VERSION = 1
+
+DEFAULT_SNAPSHOT_FILE = os.environ.get("WELL_CACHE_SNAPSHOT_FILE", str(DB_DIR / "well_cache.snapshot"))
+# Seconds between periodic snapshots (0 only writes on shutdown)
+DEFAULT_SNAPSHOT_INTERVAL = float(os.environ.get("WELL_CACHE_SNAPSHOT_SECONDS", 300))
+
+# magic, version, flags, header length
+_PREAMBLE = struct.Struct("<8sIIQ")
+_ALIGNMENT = 8
+
+# Entry metadata kept in the snapshot header
+SNAPSHOT_FIELDS = ("source", "project", "path", "fingerprint")
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def write_snapshot(file_path: str, entries: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Write cache entries to a snapshot file (atomically, through a temporary file).
+
+    Args:
+        file_path: Snapshot file
+        entries: (cache key, entry) pairs; entries hold SNAPSHOT_FIELDS and either
+                 "data" (decoded well) or "frozen" (cold tier well)
+
+    Returns:
+        Dictionary with wells written, wells skipped (no block encoding) and file bytes
+    """
+    records, chunks = [], []
+    offset, skipped = 0, 0
+    for key, entry in entries:
+        record = {"key": key, **{field: entry.get(field) for field in SNAPSHOT_FIELDS}}
+        frozen = entry.get("frozen")
+        if frozen is not None:
+            blob = frozen["blob"]
+            record["frozen"] = {"codec": frozen["codec"], "header": frozen["header"],
+                                "raw_bytes": frozen["raw_bytes"], "offset": offset, "size": len(blob)}
+            chunks.append((offset, [(0, memoryview(blob))]))
+            offset = _align(offset + len(blob))
+        else:
+            try:
+                header, blocks, size = encode_well_blocks(entry["data"])
+            except (TypeError, ValueError):
+                # Mixed sample types: the well is parsed again after the restart
+                skipped += 1
+                continue
+            record["well"] = header
+            record["offset"] = offset
+            chunks.append((offset, [(block_offset, memoryview(block).cast("B")) for block_offset, block in blocks]))
+            offset = _align(offset + size)
+        records.append(record)
+
+    header_bytes = json.dumps({"created": time.time(), "entries": records}, default=str).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(header_bytes))
+
+    os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(header_bytes)))
+        f.write(header_bytes)
+        for chunk_offset, pieces in chunks:
+            for piece_offset, piece in pieces:
+                f.write(b"\x00" * (data_start + chunk_offset + piece_offset - f.tell()))
+                f.write(piece)
+        size = f.tell()
+    os.replace(tmp_path, file_path)
+    return {"wells": len(records), "skipped": skipped, "bytes": size}
+
+
+class CacheSnapshot:
+    """Read access to a snapshot file through a read-only memory mapping."""
+
+    def __init__(self, file_path: str):
+        self._file = open(file_path, "rb")
+        try:
+            magic, version, _flags, header_len = _PREAMBLE.unpack(self._file.read(_PREAMBLE.size))
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError("Not a well cache snapshot")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported snapshot version: {version}")
+            header = json.loads(self._file.read(header_len).decode("utf-8"))
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self.created = header["created"]
+        self.entries: List[Dict[str, Any]] = header["entries"]
+        self._data_start = _align(_PREAMBLE.size + header_len)
+
+    def load(self, record: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Samples of a snapshot entry.
+
+        Returns:
+            (well data, None) for hot entries, (None, frozen well) for cold entries
+        """
+        frozen = record.get("frozen")
+        if frozen is not None:
+            start = self._data_start + frozen["offset"]
+            return None, {"codec": frozen["codec"], "header": frozen["header"],
+                          "raw_bytes": frozen["raw_bytes"], "blob": self._map[start:start + frozen["size"]]}
+        # Columns are copied out of the mapping, so nothing keeps it alive
+        return decode_well_blocks(record["well"], self._map, self._data_start + record["offset"],
+                                  arrays=True, copy=True), None
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CacheSnapshotter:
+    """Writes the storage's cache snapshot periodically from a daemon thread."""
+
+    def __init__(self, storage, interval: float = DEFAULT_SNAPSHOT_INTERVAL):
+        self.storage = storage
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.snapshots = 0
+        self.last_snapshot: Optional[Dict[str, Any]] = None
+
+    def snapshot_once(self, force: bool = False) -> Dict[str, Any]:
+        """Write a snapshot unless the cached wells did not change since the last one."""
+        result = self.storage.save_cache_snapshot(force=force)
+        if result["written"]:
+            self.snapshots += 1
+            self.last_snapshot = result
+        return result
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.snapshot_once()
+            except Exception as e:
+                print(f"[CacheSnapshotter] Snapshot failed: {e}")
+
+    def start(self) -> bool:
+        """Start periodic snapshots (no-op if the interval is 0 or already running)."""
+        if self.interval <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="well-cache-snapshot", daemon=True)
+        self._thread.start()
+        print(f"[CacheSnapshotter] Snapshot every {self.interval}s")
+        return True
+
+    def stop(self, timeout: float = 5.0):
+        """Stop periodic snapshots and wait for a running one to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "interval_seconds": self.interval,
+            "snapshots": self.snapshots,
+            "last_snapshot": self.last_snapshot
+        }
@@ -0,0 +1,113 @@
+"""
+Per-project well summary catalog.
+
+List, find and count operations (the /wells/list endpoint, LIST_ALL_WELLS,
+LIST_OF_DATASET, FIND_WITH_DATASET) only need names, types and counts, so they
+are answered from the summaries kept in the well file index (see
+well_file_index.summarize_well) instead of loading well bodies.
+
+Summaries are written whenever the storage service saves or loads a well. A
+query costs one stat per well to confirm the summaries still describe the files;
+wells written behind the service's back (CLI commands, other processes) or never
+loaded yet are read once and their summaries recorded.
+"""
+
+import os
+import threading
+from typing import Dict, Any, List, Optional
+
+from utils.ptrc_file_io import read_well_file
+from utils.well_file_index import WellFileIndex
+
+
+class WellCatalog:
+    """Summary catalog backed by a WellFileIndex."""
+
+    def __init__(self, index: WellFileIndex):
+        self.index = index
+        self.queries = 0
+        self.rebuilt = 0
+
+    def wells(self, project_path: str) -> List[Dict[str, Any]]:
+        """
+        Summaries of all wells of a project, sorted by well name.
+
+        Returns:
+            List of summaries (see summarize_well) with "id" (file name) and "path" added.
+            Wells that cannot be read are listed with their "error" and no datasets
+        """
+        self.index.refresh_project(project_path)
+        entries = self.index.summaries(project_path)
+
+        stale = []
+        for entry in entries:
+            try:
+                stat = os.stat(entry["path"])
+            except OSError:
+                entry["summary"] = None
+                continue
+            if entry["summary"] is None or (stat.st_size, stat.st_mtime_ns) != (entry["size"], entry["mtime_ns"]):
+                stale.append(entry)
+
+        if stale:
+            recorded = []
+            for entry in stale:
+                try:
+                    recorded.append((entry["path"], read_well_file(entry["path"], arrays=True)))
+                except Exception as e:
+                    print(f"[WellCatalog] Failed to summarize {entry['path']}: {e}")
+                    entry["error"] = str(e)
+            self.index.record_files(recorded)
+            self.rebuilt += len(recorded)
+            refreshed = {entry["path"]: entry["summary"] for entry in self.index.summaries(project_path)}
+            for entry in stale:
+                entry["summary"] = None if "error" in entry else refreshed.get(entry["path"])
+
+        self.queries += 1
+        wells = []
+        for entry in entries:
+            if entry["summary"] is not None:
+                wells.append({**entry["summary"], "id": entry["well_name"], "path": entry["path"]})
+            elif "error" in entry:
+                wells.append({"id": entry["well_name"], "path": entry["path"], "error": entry["error"], "datasets": []})
+        return wells
+
+    def well(self, project_path: str, well_name: str) -> Optional[Dict[str, Any]]:
+        """Summary of one well, or None if the project has no such well."""
+        return next((well for well in self.wells(project_path) if well["id"] == well_name), None)
+
+    def find_dataset(self, project_path: str, dataset_name: str) -> List[Dict[str, Any]]:
+        """
+        Wells of a project holding a dataset.
+
+        Returns:
+            List of {"well": well summary, "dataset": dataset summary}
+        """
+        matches = []
+        for well in self.wells(project_path):
+            dataset = next((ds for ds in well["datasets"] if ds["name"] == dataset_name), None)
+            if dataset is not None:
+                matches.append({"well": well, "dataset": dataset})
+        return matches
+
+    def stats(self) -> Dict[str, Any]:
+        return {"queries": self.queries, "rebuilt_summaries": self.rebuilt}
+
+
+_fallback_catalog: Optional[WellCatalog] = None
+_fallback_lock = threading.Lock()
+
+
+def get_well_catalog() -> WellCatalog:
+    """Catalog of the file well storage service (or a standalone one if it is not initialized)."""
+    # Imported here, file_well_storage imports this module
+    from utils.file_well_storage import get_file_well_storage
+
+    global _fallback_catalog
+    try:
+        return get_file_well_storage().catalog
+    except RuntimeError:
+        with _fallback_lock:
+            if _fallback_catalog is None:
+                _fallback_catalog = WellCatalog(WellFileIndex())
+            return _fallback_catalog
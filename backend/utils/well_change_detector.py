@@ -0,0 +1,99 @@
+"""
+Background change detector for well files.
+
+Polls the indexed 10-WELLS folders and the cached wells so edits made outside
+the API (CLI commands writing .ptrc files directly, batch jobs, other
+processes) become visible without restarting the server:
+- a 10-WELLS folder whose mtime changed is listed again (wells added, removed, renamed)
+- every cached well is checked against its file fingerprint; changed wells of
+  the active project are reloaded, other changed or deleted wells are invalidated
+- cached wells idle for longer than the storage's cold_after_seconds are
+  compressed into the cold tier (see FileWellStorageService.compress_idle_wells)
+
+Each poll costs one stat per indexed folder and one per cached well.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+
+DEFAULT_POLL_INTERVAL = float(os.environ.get("WELL_CHANGE_POLL_SECONDS", 5))
+
+
+class WellChangeDetector:
+    """Polling change detector running in a daemon thread."""
+
+    def __init__(self, storage, interval: float = DEFAULT_POLL_INTERVAL):
+        self.storage = storage
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.polls = 0
+        self.reloaded = 0
+        self.invalidated = 0
+        self.rescanned_projects = 0
+        self.compressed = 0
+        self.last_poll_seconds = 0.0
+
+    def poll_once(self) -> Dict[str, Any]:
+        """
+        Run one detection pass.
+
+        Returns:
+            Dictionary with rescanned projects and reloaded/invalidated/compressed cache keys
+        """
+        start = time.perf_counter()
+        rescanned = [os.path.dirname(wells_dir) for wells_dir in self.storage.index.wells_dirs()
+                     if self.storage.index_project(os.path.dirname(wells_dir))]
+        result = self.storage.revalidate_cached_wells()
+        result["compressed"] = self.storage.compress_idle_wells()
+
+        self.polls += 1
+        self.rescanned_projects += len(rescanned)
+        self.reloaded += len(result["reloaded"])
+        self.invalidated += len(result["invalidated"])
+        self.compressed += len(result["compressed"])
+        self.last_poll_seconds = time.perf_counter() - start
+
+        if rescanned or result["reloaded"] or result["invalidated"]:
+            print(f"[WellChangeDetector] {len(rescanned)} project(s) rescanned, "
+                  f"{len(result['reloaded'])} well(s) reloaded, {len(result['invalidated'])} invalidated")
+        return {"rescanned_projects": rescanned, **result}
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll_once()
+            except Exception as e:
+                print(f"[WellChangeDetector] Poll failed: {e}")
+
+    def start(self) -> bool:
+        """Start polling in the background (no-op if the interval is 0 or already running)."""
+        if self.interval <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="well-change-detector", daemon=True)
+        self._thread.start()
+        print(f"[WellChangeDetector] Polling every {self.interval}s")
+        return True
+
+    def stop(self, timeout: float = 5.0):
+        """Stop polling and wait for the thread to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "interval_seconds": self.interval,
+            "polls": self.polls,
+            "rescanned_projects": self.rescanned_projects,
+            "reloaded": self.reloaded,
+            "invalidated": self.invalidated,
+            "compressed": self.compressed,
+            "last_poll_seconds": round(self.last_poll_seconds, 4)
+        }
@@ -0,0 +1,438 @@
+"""
+Persistent, incremental index of .ptrc well files.
+
+The index lives in a small SQLite database next to the application database
+(data/well_index.db) with one row per 10-WELLS folder (its mtime) and one row per
+well file (size, mtime, content hash and a catalog summary, see summarize_well).
+
+On startup only the workspace folders are listed with os.scandir: a folder that
+holds a 10-WELLS folder is a project and is not descended into, so LAS input
+folders, uploads and backups inside projects are never walked. A 10-WELLS folder
+is only listed again when its mtime changed (wells added, removed or renamed).
+In-place rewrites of a well file are picked up when the well is loaded or saved
+through the storage service (record_file).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from utils.fe_data_objects import encode_log_values
+from utils.sqlite_storage import DB_DIR
+
+
+INDEX_DB_FILE = DB_DIR / "well_index.db"
+
+WELLS_DIR_NAME = "10-WELLS"
+WELL_FILE_EXTENSION = ".ptrc"
+
+# Project folders are looked for at most this many levels below the workspace root
+MAX_PROJECT_DEPTH = 3
+
+# Files above this size are indexed without a content hash (hashing means a second full read)
+MAX_HASH_BYTES = 512 * 1024 * 1024
+
+# Bumped when the summary layout changes; older summaries are rebuilt on demand
+SUMMARY_VERSION = 2
+
+
+def project_id(project_path: str) -> str:
+    """Normalized absolute project path; identifies a project independent of its folder name."""
+    return os.path.normcase(os.path.abspath(project_path))
+
+
+def file_hash(file_path: str) -> str:
+    """Content hash (BLAKE2b, 128 bit) of a file."""
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+
+def file_fingerprint(file_path: str, with_hash: bool = False) -> Dict[str, Any]:
+    """
+    Fingerprint of a file: size, mtime and optionally the content hash.
+    Raises OSError if the file cannot be accessed.
+    """
+    stat = os.stat(file_path)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "content_hash": file_hash(file_path) if with_hash and stat.st_size <= MAX_HASH_BYTES else None
+    }
+
+
+def read_fingerprint(file_path: str, before: Dict[str, Any], buffer) -> Dict[str, Any]:
+    """
+    Fingerprint of a file whose contents were just read into buffer, hashing buffer
+    instead of reading the file a second time.
+
+    Args:
+        before: Fingerprint taken before the read (see file_fingerprint)
+        buffer: Complete file contents
+
+    Returns:
+        before with the content hash of buffer, or before unchanged (no hash) if the
+        file changed while it was read
+    Raises OSError if the file cannot be accessed.
+    """
+    after = os.stat(file_path)
+    if (after.st_size, after.st_mtime_ns) != (before["size"], before["mtime_ns"]) or len(buffer) != after.st_size:
+        return before
+    if after.st_size > MAX_HASH_BYTES:
+        return {**before, "content_hash": None}
+    return {**before, "content_hash": hashlib.blake2b(buffer, digest_size=16).hexdigest()}
+
+
+def _depth_range(depths: np.ndarray) -> Tuple[Optional[float], Optional[float]]:
+    if not len(depths):
+        return None, None
+    return float(depths.min()), float(depths.max())
+
+
+def _summarize_dataset(dataset: Dict[str, Any]) -> Dict[str, Any]:
+    depths, _ = encode_log_values(dataset.get("index_log"), "float")
+    on_depth = np.isfinite(depths)
+    top, bottom = _depth_range(depths[on_depth])
+
+    logs = []
+    for log in dataset.get("well_logs") or []:
+        entry = {"name": log.get("name"), "log_type": log.get("log_type")}
+        try:
+            values, categories = encode_log_values(log.get("log"), log.get("log_type", "float"))
+        except ValueError:
+            # Mixed sample types: only the count is known
+            logs.append({**entry, "samples": len(log.get("log") or []), "nulls": None, "top": None, "bottom": None})
+            continue
+        present = values >= 0 if categories is not None else ~np.isnan(values)
+        count = min(len(present), len(depths))
+        log_top, log_bottom = _depth_range(depths[:count][present[:count] & on_depth[:count]])
+        logs.append({**entry, "samples": len(values), "nulls": int(len(values) - np.count_nonzero(present)),
+                     "top": log_top, "bottom": log_bottom})
+
+    return {
+        "name": dataset.get("name"),
+        "type": dataset.get("type"),
+        "index_name": dataset.get("index_name"),
+        "samples": len(depths),
+        "nulls": int(len(depths) - np.count_nonzero(on_depth)),
+        "top": top,
+        "bottom": bottom,
+        "constants": len(dataset.get("constants") or []),
+        "logs": len(logs),
+        "well_logs": logs
+    }
+
+
+def summarize_well(well_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Catalog summary of a well dictionary (lists or arrays): name, type, creation date and
+    per-dataset and per-log names, types, sample counts, null counts and depth ranges.
+    Depth ranges of logs cover their non-null samples.
+    """
+    return {
+        "version": SUMMARY_VERSION,
+        "well_name": well_data.get("well_name"),
+        "well_type": well_data.get("well_type"),
+        "date_created": well_data.get("date_created"),
+        "datasets": [_summarize_dataset(dataset) for dataset in well_data.get("datasets") or []]
+    }
+
+
+def find_wells_dirs(root: str, max_depth: int = MAX_PROJECT_DEPTH) -> Iterator[str]:
+    """
+    Find the 10-WELLS folders below root.
+
+    Hidden folders are skipped and project folders (holding a 10-WELLS folder)
+    are not descended into.
+    """
+    pending = [(root, 0)]
+    while pending:
+        directory, depth = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = [entry for entry in entries
+                           if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.')]
+        except OSError:
+            continue
+
+        wells_dir = next((entry for entry in subdirs if entry.name == WELLS_DIR_NAME), None)
+        if wells_dir is not None:
+            yield wells_dir.path
+        elif depth < max_depth:
+            pending.extend((entry.path, depth + 1) for entry in subdirs)
+
+
+class WellFileIndex:
+    """
+    SQLite-backed index of well files.
+    Thread-safe: all statements run on one connection under a lock.
+    """
+
+    def __init__(self, db_path: str = str(INDEX_DB_FILE)):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._init_database()
+
+    def _init_database(self):
+        """Initialize database schema"""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS wells_dirs (
+                    path TEXT PRIMARY KEY,
+                    project_path TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS well_files (
+                    path TEXT PRIMARY KEY,
+                    wells_dir TEXT NOT NULL,
+                    project_path TEXT NOT NULL,
+                    well_name TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    content_hash TEXT,
+                    summary TEXT
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_well_files_dir ON well_files (wells_dir)")
+
+    def scan_workspace(self, workspace_root: str, force: bool = False) -> Dict[str, Any]:
+        """
+        Bring the index up to date for all projects below the workspace root.
+
+        Args:
+            workspace_root: Workspace root folder
+            force: List every 10-WELLS folder, even if its mtime did not change
+
+        Returns:
+            Dictionary with the number of wells folders, rescanned folders and indexed files
+        """
+        root = project_id(workspace_root)
+        wells_dirs = set(find_wells_dirs(root))
+
+        rescanned = sum(1 for wells_dir in wells_dirs if self.refresh_wells_dir(wells_dir, force=force))
+
+        # Forget folders below the workspace that are gone (projects outside it are kept)
+        with self._lock, self._conn:
+            known = [row[0] for row in self._conn.execute("SELECT path FROM wells_dirs")]
+            removed = [path for path in known
+                       if path.startswith(root + os.sep) and path not in wells_dirs]
+            for path in removed:
+                self._conn.execute("DELETE FROM well_files WHERE wells_dir = ?", (path,))
+                self._conn.execute("DELETE FROM wells_dirs WHERE path = ?", (path,))
+            files = self._conn.execute("SELECT COUNT(*) FROM well_files").fetchone()[0]
+
+        return {
+            "wells_dirs": len(wells_dirs),
+            "rescanned": rescanned,
+            "removed": len(removed),
+            "files": files
+        }
+
+    def refresh_wells_dir(self, wells_dir: str, force: bool = False) -> bool:
+        """
+        List a 10-WELLS folder again if its mtime changed and update its file rows.
+        New and changed files (size or mtime) lose their hash and summary.
+
+        Returns:
+            True if the folder was listed again
+        """
+        wells_dir = project_id(wells_dir)
+        try:
+            dir_mtime = os.stat(wells_dir).st_mtime_ns
+        except OSError:
+            # Folder is gone (or never existed): only a change if it was indexed
+            with self._lock:
+                known = self._conn.execute("SELECT 1 FROM wells_dirs WHERE path = ?", (wells_dir,)).fetchone()
+            if known is None:
+                return False
+            self.remove_wells_dir(wells_dir)
+            return True
+
+        with self._lock:
+            row = self._conn.execute("SELECT mtime_ns FROM wells_dirs WHERE path = ?", (wells_dir,)).fetchone()
+        if row is not None and row[0] == dir_mtime and not force:
+            return False
+
+        listed: Dict[str, Tuple[int, int]] = {}
+        try:
+            with os.scandir(wells_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(WELL_FILE_EXTENSION) and entry.is_file():
+                        stat = entry.stat()
+                        listed[entry.path] = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            return False
+
+        project_path = os.path.dirname(wells_dir)
+        with self._lock, self._conn:
+            stored = {path: (size, mtime) for path, size, mtime in self._conn.execute(
+                "SELECT path, size, mtime_ns FROM well_files WHERE wells_dir = ?", (wells_dir,))}
+            for path in stored.keys() - listed.keys():
+                self._conn.execute("DELETE FROM well_files WHERE path = ?", (path,))
+            self._conn.executemany(
+                """INSERT OR REPLACE INTO well_files
+                   (path, wells_dir, project_path, well_name, size, mtime_ns, content_hash, summary)
+                   VALUES (?, ?, ?, ?, ?, ?, NULL, NULL)""",
+                [(path, wells_dir, project_path, os.path.basename(path)[:-len(WELL_FILE_EXTENSION)], size, mtime)
+                 for path, (size, mtime) in listed.items() if stored.get(path) != (size, mtime)]
+            )
+            self._conn.execute("INSERT OR REPLACE INTO wells_dirs (path, project_path, mtime_ns) VALUES (?, ?, ?)",
+                               (wells_dir, project_path, dir_mtime))
+        return True
+
+    def refresh_project(self, project_path: str, force: bool = False) -> bool:
+        """Refresh the 10-WELLS folder of one project (also for projects outside the workspace)."""
+        return self.refresh_wells_dir(os.path.join(project_id(project_path), WELLS_DIR_NAME), force=force)
+
+    def remove_wells_dir(self, wells_dir: str):
+        """Forget a 10-WELLS folder and its files."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM well_files WHERE wells_dir = ?", (wells_dir,))
+            self._conn.execute("DELETE FROM wells_dirs WHERE path = ?", (wells_dir,))
+
+    def files(self, project_path: Optional[str] = None) -> List[Tuple[str, str, str]]:
+        """
+        Indexed well files as (path, project_path, well_name).
+
+        Args:
+            project_path: Only return the wells of this project
+        """
+        with self._lock:
+            if project_path is None:
+                return self._conn.execute("SELECT path, project_path, well_name FROM well_files").fetchall()
+            return self._conn.execute("SELECT path, project_path, well_name FROM well_files WHERE project_path = ?",
+                                      (project_id(project_path),)).fetchall()
+
+    def get_entry(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Index row of one file (size, mtime_ns, content_hash, summary) or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, project_path, well_name, size, mtime_ns, content_hash, summary FROM well_files WHERE path = ?",
+                (project_id(file_path),)).fetchone()
+        if row is None:
+            return None
+        return {
+            "path": row[0],
+            "project_path": row[1],
+            "well_name": row[2],
+            "size": row[3],
+            "mtime_ns": row[4],
+            "content_hash": row[5],
+            "summary": json.loads(row[6]) if row[6] else None
+        }
+
+    def record_file(self, file_path: str, well_data: Optional[Dict[str, Any]] = None,
+                    with_hash: bool = True, fingerprint: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Record the current size, mtime, hash and (if well_data is given) summary of a file,
+        typically right after it was loaded or written.
+
+        Args:
+            fingerprint: Fingerprint already taken by the caller (e.g. read_fingerprint
+                         of a file just loaded); the file is not touched again
+
+        Returns:
+            The recorded fingerprint (see file_fingerprint), or None if the file is gone
+        """
+        return self.record_files([(file_path, well_data, fingerprint)], with_hash=with_hash)[0]
+
+    def record_files(self, items: List[Tuple], with_hash: bool = True) -> List[Optional[Dict[str, Any]]]:
+        """
+        Record several files in one transaction (see record_file).
+        Items are (file_path, well_data) or (file_path, well_data, fingerprint) when the
+        fingerprint was already taken elsewhere (e.g. by a preload worker process).
+        """
+        rows = []
+        fingerprints = []
+        for item in items:
+            file_path, well_data = project_id(item[0]), item[1]
+            fingerprint = item[2] if len(item) > 2 else None
+            if fingerprint is None:
+                try:
+                    fingerprint = file_fingerprint(file_path, with_hash=with_hash)
+                except OSError:
+                    fingerprints.append(None)
+                    continue
+            fingerprints.append(fingerprint)
+            if well_data is not None and self._has_summary(file_path, fingerprint):
+                # Loading an unchanged file again: the stored summary still describes it
+                well_data = None
+            wells_dir = os.path.dirname(file_path)
+            rows.append((file_path, wells_dir, os.path.dirname(wells_dir),
+                         os.path.basename(file_path)[:-len(WELL_FILE_EXTENSION)],
+                         fingerprint["size"], fingerprint["mtime_ns"], fingerprint["content_hash"],
+                         json.dumps(summarize_well(well_data), default=str) if well_data is not None else None))
+
+        if not rows:
+            return fingerprints
+        with self._lock, self._conn:
+            # Keep an existing summary when only the fingerprint is refreshed
+            self._conn.executemany(
+                """INSERT INTO well_files
+                   (path, wells_dir, project_path, well_name, size, mtime_ns, content_hash, summary)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(path) DO UPDATE SET
+                       size = excluded.size,
+                       mtime_ns = excluded.mtime_ns,
+                       content_hash = excluded.content_hash,
+                       summary = COALESCE(excluded.summary,
+                                          CASE WHEN well_files.mtime_ns = excluded.mtime_ns
+                                               THEN well_files.summary END)""",
+                rows
+            )
+        return fingerprints
+
+    def _has_summary(self, file_path: str, fingerprint: Dict[str, Any]) -> bool:
+        """True if the row of file_path matches the fingerprint and holds a current summary."""
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT 1 FROM well_files WHERE path = ? AND size = ? AND mtime_ns = ?
+                   AND json_extract(summary, '$.version') = ?""",
+                (file_path, fingerprint["size"], fingerprint["mtime_ns"], SUMMARY_VERSION)).fetchone()
+        return row is not None
+
+    def summaries(self, project_path: str) -> List[Dict[str, Any]]:
+        """
+        Index rows of all wells of a project, sorted by well name.
+
+        Returns:
+            List of {"path", "well_name", "size", "mtime_ns", "summary"}; summary is None
+            if the file was never summarized or its summary predates SUMMARY_VERSION
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT path, well_name, size, mtime_ns, summary FROM well_files
+                   WHERE project_path = ? ORDER BY well_name""",
+                (project_id(project_path),)).fetchall()
+        entries = []
+        for path, well_name, size, mtime_ns, summary in rows:
+            summary = json.loads(summary) if summary else None
+            if summary is not None and summary.get("version") != SUMMARY_VERSION:
+                summary = None
+            entries.append({"path": path, "well_name": well_name, "size": size,
+                            "mtime_ns": mtime_ns, "summary": summary})
+        return entries
+
+    def wells_dirs(self) -> List[str]:
+        """All indexed 10-WELLS folders."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT path FROM wells_dirs")]
+
+    def remove_file(self, file_path: str):
+        """Forget one well file."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM well_files WHERE path = ?", (project_id(file_path),))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
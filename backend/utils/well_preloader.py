@@ -0,0 +1,326 @@
+"""
+Background, prioritized preloading of a project's wells.
+
+Opening a project starts a preload job instead of blocking the request (or
+server startup) until every well is parsed. Wells are loaded in priority order:
+1. wells requested through prioritize() while the job runs
+2. the persisted active well
+3. the persisted selected wells
+4. all other wells by name
+
+Opening another project cancels the running job: wells already being read are
+finished, queued wells are dropped. Requests for wells that are not loaded yet
+do not wait for the job; they load the well on demand (sharing the load if the
+job is reading it at that moment, see FileWellStorageService.claim_load).
+
+Jobs run in background threads. In process mode the wells are parsed in worker
+processes (see parallel_well_loader), still in priority order.
+"""
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Dict, Any, List, Optional
+
+from utils.parallel_well_loader import WellProcessPool
+from utils.well_file_index import project_id
+
+
+# Preload modes: threads (I/O bound, v2 files) or worker processes (CPU bound JSON parsing)
+PRELOAD_THREAD = "thread"
+PRELOAD_PROCESS = "process"
+
+PRIORITY_REQUESTED = 0
+PRIORITY_ACTIVE = 1
+PRIORITY_SELECTED = 2
+PRIORITY_REST = 3
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+DEFAULT_PRELOAD_WORKERS = int(os.environ.get("WELL_PRELOAD_WORKERS", 4))
+
+
+def session_priority_wells(project_path: str) -> List[str]:
+    """Persisted active well followed by the selected wells of a project."""
+    # Imported here, the SQLite storage is only needed when a project is opened
+    from utils.sqlite_storage import SQLiteStorageService
+
+    storage = SQLiteStorageService()
+    active = storage.load_active_well(project_path)
+    selected = storage.load_selected_wells(project_path) or []
+    return ([active] if active else []) + [well for well in selected if well != active]
+
+
+class PreloadJob:
+    """Preload of one project; loads wells in priority order until done or cancelled."""
+
+    def __init__(self, storage, project_path: str, well_ids: List[str], priority_wells: List[str],
+                 mode: str, workers: int):
+        self.storage = storage
+        self.project_path = project_path
+        self.project_key = project_id(project_path)
+        self.project_name = os.path.basename(os.path.normpath(project_path))
+        self.mode = mode
+        # Worker processes beyond the CPU count only add overhead
+        self.workers = max(1, min(workers, os.cpu_count() or 1) if mode == PRELOAD_PROCESS else workers)
+        known = set(well_ids)
+        self.priority_wells = list(dict.fromkeys(well for well in priority_wells if well in known))
+
+        self.state = QUEUED
+        self.total = len(well_ids)
+        self.loaded = 0
+        self.failed: List[str] = []
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+        self._well_ids = known
+        self._done_wells: set = set()
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._finished = threading.Event()
+        self._order = itertools.count()
+
+        # The first priority well is the active one, the others keep their order
+        self._queue = [(PRIORITY_ACTIVE if i == 0 else PRIORITY_SELECTED, next(self._order), well)
+                       for i, well in enumerate(self.priority_wells)]
+        self._queue += [(PRIORITY_REST, next(self._order), well)
+                        for well in sorted(known.difference(self.priority_wells))]
+        heapq.heapify(self._queue)
+
+    # --- queue ---
+
+    def prioritize(self, well_id: str) -> bool:
+        """Move a well to the front of the queue. Returns False if it is not queued any more."""
+        with self._lock:
+            if well_id not in self._well_ids or well_id in self._done_wells or self._finished.is_set():
+                return False
+            # Decreasing sequence: the latest request is loaded before earlier ones
+            heapq.heappush(self._queue, (PRIORITY_REQUESTED, -next(self._order), well_id))
+            return True
+
+    def _next(self) -> Optional[str]:
+        """Highest priority well that was not handled yet, or None when done or cancelled."""
+        with self._lock:
+            while self._queue and not self._cancel.is_set():
+                _, _, well_id = heapq.heappop(self._queue)
+                if well_id not in self._done_wells:
+                    self._done_wells.add(well_id)
+                    return well_id
+            return None
+
+    def _record(self, well_id: str, success: bool):
+        with self._lock:
+            if success:
+                self.loaded += 1
+            else:
+                self.failed.append(well_id)
+
+    # --- execution ---
+
+    def run(self):
+        self.state = RUNNING
+        self.started_at = time.time()
+        try:
+            if not self._cancel.is_set():
+                self.storage.set_active_project(self.project_path)
+            if self.mode == PRELOAD_PROCESS and self.workers > 1:
+                self._run_processes()
+            else:
+                threads = [threading.Thread(target=self._run_thread, name=f"well-preload-{i}", daemon=True)
+                           for i in range(self.workers)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            self.state = CANCELLED if self._cancel.is_set() else COMPLETED
+            if self.state == COMPLETED:
+                self.storage.mark_preloaded(self.project_path)
+        except Exception as e:
+            print(f"[WellPreloader] Preload of '{self.project_name}' failed: {e}")
+            self.state = FAILED
+        finally:
+            self.finished_at = time.time()
+            self._finished.set()
+            print(f"[WellPreloader] Preload of '{self.project_name}' {self.state}: {self.loaded}/{self.total} wells "
+                  f"loaded, {len(self.failed)} failed in {self.finished_at - self.started_at:.2f}s")
+
+    def _run_thread(self):
+        while True:
+            well_id = self._next()
+            if well_id is None:
+                return
+            try:
+                success = self.storage.preload_well(self.project_path, well_id)
+            except Exception as e:
+                print(f"[WellPreloader] Failed to preload {well_id}: {e}")
+                success = False
+            self._record(well_id, success)
+
+    def _run_processes(self):
+        """Keep `workers` wells in flight in worker processes, submitting in priority order."""
+        pool = WellProcessPool(self.workers)
+        in_flight = {}
+        try:
+            while True:
+                while len(in_flight) < self.workers:
+                    well_id = self._next()
+                    if well_id is None:
+                        break
+                    self._submit(pool, in_flight, well_id)
+                if not in_flight:
+                    return
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._complete(pool, future, *in_flight.pop(future))
+        finally:
+            # Only reached with loads in flight if collecting raised
+            for future, (well_id, file_key, file_path, claim) in in_flight.items():
+                self.storage.finish_load(file_key, claim, None)
+            pool.shutdown()
+
+    def _submit(self, pool: WellProcessPool, in_flight: Dict, well_id: str):
+        file_key = self.storage.get_file_key(self.project_path, well_id)
+        file_path = self.storage.file_index.get(file_key)
+        if file_path is None:
+            self._record(well_id, False)
+            return
+        claim, leader = self.storage.claim_load(file_key)
+        if not leader:
+            # Cached already, or a request is reading it right now
+            self._record(well_id, True)
+            return
+        try:
+            in_flight[pool.submit(file_path)] = (well_id, file_key, file_path, claim)
+        except Exception:
+            self.storage.finish_load(file_key, claim, None)
+            raise
+
+    def _complete(self, pool: WellProcessPool, future, well_id: str, file_key: str, file_path: str, claim):
+        data = None
+        try:
+            _, well_data, fingerprint, error = pool.collect(future)
+            if error is None:
+                self.storage.index.record_files([(file_path, well_data, fingerprint)])
+                data = self.storage.store_loaded_well(file_key, well_data, "preload", self.project_key,
+                                                      file_path, fingerprint)
+            else:
+                print(f"[WellPreloader] Failed to preload {well_id}: {error}")
+        finally:
+            self.storage.finish_load(file_key, claim, data)
+        self._record(well_id, data is not None)
+
+    # --- control ---
+
+    def cancel(self):
+        """Drop the queued wells; loads in progress are finished."""
+        self._cancel.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the job to finish. Returns False on timeout."""
+        return self._finished.wait(timeout)
+
+    @property
+    def finished(self) -> bool:
+        return self._finished.is_set()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            handled = self.loaded + len(self.failed)
+            end = self.finished_at or time.time()
+            return {
+                "project": self.project_name,
+                "project_path": self.project_path,
+                "state": self.state,
+                "mode": self.mode,
+                "workers": self.workers,
+                "total_wells": self.total,
+                "loaded_wells": self.loaded,
+                "failed_wells": list(self.failed),
+                "remaining_wells": self.total - handled,
+                "progress": handled / self.total if self.total else 1.0,
+                "priority_wells": list(self.priority_wells),
+                "elapsed_seconds": round(end - self.started_at, 3) if self.started_at else 0.0
+            }
+
+
+class WellPreloader:
+    """Runs at most one preload job at a time; starting another project cancels the current one."""
+
+    def __init__(self, storage, workers: int = DEFAULT_PRELOAD_WORKERS):
+        self.storage = storage
+        self.workers = workers
+        self.job: Optional[PreloadJob] = None
+        self._lock = threading.Lock()
+
+    def start(self, project_path: str, priority_wells: Optional[List[str]] = None,
+              mode: Optional[str] = None, workers: Optional[int] = None) -> PreloadJob:
+        """
+        Start preloading a project in the background.
+
+        Args:
+            project_path: Path to the project directory
+            priority_wells: Wells to load first, most important first (defaults to the
+                            persisted active and selected wells)
+            mode: PRELOAD_THREAD or PRELOAD_PROCESS (defaults to the storage's preload_mode)
+            workers: Concurrent loads (threads or worker processes)
+
+        Returns:
+            The running job (the current one if this project is already being preloaded)
+        """
+        mode = mode or self.storage.preload_mode
+        if mode not in (PRELOAD_THREAD, PRELOAD_PROCESS):
+            raise ValueError(f"Unknown preload mode: {mode}")
+        if priority_wells is None:
+            try:
+                priority_wells = session_priority_wells(project_path)
+            except Exception as e:
+                print(f"[WellPreloader] Could not read active/selected wells: {e}")
+                priority_wells = []
+
+        with self._lock:
+            current = self.job
+            if current is not None and not current.finished:
+                if current.project_key == project_id(project_path):
+                    # Each request goes in front of the previous one, so the most important is pushed last
+                    for well_id in reversed(priority_wells):
+                        current.prioritize(well_id)
+                    return current
+                print(f"[WellPreloader] Cancelling preload of '{current.project_name}'")
+                current.cancel()
+
+            well_ids = self.storage.list_wells_in_project(project_path)
+            job = PreloadJob(self.storage, project_path, well_ids, priority_wells, mode, workers or self.workers)
+            self.job = job
+
+        print(f"[WellPreloader] Preloading {job.total} wells of '{job.project_name}' in the background "
+              f"({job.mode}, {job.workers} workers, {len(job.priority_wells)} prioritized)")
+        threading.Thread(target=job.run, name="well-preload", daemon=True).start()
+        return job
+
+    def prioritize(self, project_path: str, well_id: str) -> bool:
+        """Move a well of the project being preloaded to the front of the queue."""
+        job = self.job
+        if job is None or job.project_key != project_id(project_path):
+            return False
+        return job.prioritize(well_id)
+
+    def cancel(self) -> bool:
+        """Cancel the running job. Returns False if no job was running."""
+        job = self.job
+        if job is None or job.finished:
+            return False
+        job.cancel()
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        job = self.job
+        if job is None:
+            return {"state": None}
+        return job.status()
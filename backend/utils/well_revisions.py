@@ -0,0 +1,321 @@
+"""
+Revision counters and content fingerprints of well files.
+
+Every well, dataset and log has a content fingerprint (BLAKE2b of its metadata
+and samples, independent of whether samples are lists or arrays) and a revision:
+the value of one workspace-wide, monotonically increasing sequence at the time
+its content last changed. Revisions are kept in the well index database
+(data/well_index.db) and survive restarts.
+
+Revisions are recorded
+- whenever a well file is written (ptrc_file_io write listener, so storage
+  saves, session commits, CLI commands and LAS imports all bump them), and
+- lazily for files changed behind the server's back: a row is only trusted
+  while the file's size and mtime match it (see current()).
+
+Datasets and logs that disappear keep a removed entry with the revision of
+their removal, so clients can ask what changed since a revision they saw.
+Deleted wells keep a row with deleted set.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from utils.fe_data_objects import encode_log_values
+from utils.well_file_index import INDEX_DB_FILE, WELL_FILE_EXTENSION, project_id, file_fingerprint
+
+
+# Keys holding samples or children; everything else is metadata
+_WELL_CHILDREN = ("datasets",)
+_DATASET_CHILDREN = ("well_logs", "index_log")
+
+
+def _digest() -> "hashlib.blake2b":
+    return hashlib.blake2b(digest_size=16)
+
+
+def _metadata(item: Dict[str, Any], children: tuple) -> bytes:
+    return json.dumps({key: value for key, value in item.items() if key not in children},
+                      sort_keys=True, default=str).encode("utf-8")
+
+
+def _hash_samples(digest, samples: Any, log_type: str):
+    try:
+        values, categories = encode_log_values(samples, log_type)
+    except ValueError:
+        # Mixed sample types: hash their JSON text
+        digest.update(json.dumps(samples.tolist() if isinstance(samples, np.ndarray) else samples,
+                                 default=str).encode("utf-8"))
+        return
+    digest.update(np.ascontiguousarray(values).view(np.uint8))
+    if categories is not None:
+        digest.update(json.dumps(categories).encode("utf-8"))
+
+
+def log_fingerprint(log: Dict[str, Any]) -> str:
+    """Fingerprint of a log dictionary (metadata and samples)."""
+    digest = _digest()
+    digest.update(_metadata(log, ("log",)))
+    _hash_samples(digest, log.get("log"), log.get("log_type", "float"))
+    return digest.hexdigest()
+
+
+def well_fingerprints(well_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Content fingerprints of a well dictionary.
+
+    Returns:
+        {"fingerprint": well fingerprint,
+         "datasets": {dataset name: {"fingerprint": ..., "logs": {log name: fingerprint}}}}
+        (a later dataset or log with the same name replaces an earlier one)
+    """
+    datasets = {}
+    well_digest = _digest()
+    well_digest.update(_metadata(well_data, _WELL_CHILDREN))
+    for dataset in well_data.get("datasets") or []:
+        logs = {log.get("name"): log_fingerprint(log) for log in dataset.get("well_logs") or []}
+        digest = _digest()
+        digest.update(_metadata(dataset, _DATASET_CHILDREN))
+        _hash_samples(digest, dataset.get("index_log"), "float")
+        for name, fingerprint in logs.items():
+            digest.update(f"{name}:{fingerprint};".encode("utf-8"))
+        fingerprint = digest.hexdigest()
+        datasets[dataset.get("name")] = {"fingerprint": fingerprint, "logs": logs}
+        well_digest.update(f"{dataset.get('name')}:{fingerprint};".encode("utf-8"))
+    return {"fingerprint": well_digest.hexdigest(), "datasets": datasets}
+
+
+def _stamp(previous: Optional[Dict[str, Any]], fingerprint: str, revision: int) -> Dict[str, Any]:
+    """Version stamp of an item: its previous revision if the content did not change."""
+    if previous is not None and not previous.get("removed") and previous.get("fingerprint") == fingerprint:
+        return {"revision": previous["revision"], "fingerprint": fingerprint}
+    return {"revision": revision, "fingerprint": fingerprint}
+
+
+def _removed(previous: Dict[str, Dict[str, Any]], present: Dict[str, Any], revision: int) -> Dict[str, Dict[str, Any]]:
+    """Removed entries: items of previous that are gone (new tombstones get this revision)."""
+    return {name: (stamp if stamp.get("removed") else {"revision": revision, "removed": True})
+            for name, stamp in previous.items() if name not in present}
+
+
+def stamp_datasets(previous: Dict[str, Any], fingerprints: Dict[str, Any], revision: int) -> Dict[str, Any]:
+    """
+    Per-dataset and per-log version stamps of a new well revision.
+
+    Args:
+        previous: Stamps of the previous revision ({} for a new well)
+        fingerprints: "datasets" of well_fingerprints() for the new content
+        revision: The new well revision
+
+    Returns:
+        {dataset name: {"revision", "fingerprint", "logs": {log name: {"revision", "fingerprint"}}}};
+        removed datasets and logs are {"revision", "removed": True}
+    """
+    datasets = {}
+    for name, dataset in fingerprints.items():
+        before = previous.get(name) or {}
+        before_logs = before.get("logs", {}) if not before.get("removed") else {}
+        logs = {log_name: _stamp(before_logs.get(log_name), fingerprint, revision)
+                for log_name, fingerprint in dataset["logs"].items()}
+        logs.update(_removed(before_logs, dataset["logs"], revision))
+        datasets[name] = {**_stamp(before or None, dataset["fingerprint"], revision), "logs": logs}
+    datasets.update(_removed(previous, fingerprints, revision))
+    return datasets
+
+
+class WellRevisionStore:
+    """
+    SQLite-backed revisions of well files (in the well index database).
+    Thread-safe: all statements run on one connection under a lock.
+    """
+
+    def __init__(self, db_path: str = str(INDEX_DB_FILE)):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        # The connection and lock belong to this process, a forked child must not use them
+        self.owner_pid = os.getpid()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._init_database()
+
+    def _init_database(self):
+        """Initialize database schema"""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS revision_sequence (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    value INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute("INSERT OR IGNORE INTO revision_sequence (id, value) VALUES (0, 0)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS well_revisions (
+                    path TEXT PRIMARY KEY,
+                    project_path TEXT NOT NULL,
+                    well_name TEXT NOT NULL,
+                    revision INTEGER NOT NULL,
+                    fingerprint TEXT,
+                    size INTEGER,
+                    mtime_ns INTEGER,
+                    modified REAL NOT NULL,
+                    deleted INTEGER NOT NULL DEFAULT 0,
+                    datasets TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_well_revisions_project ON well_revisions (project_path)")
+
+    def _next_revision(self) -> int:
+        """Next value of the revision sequence (caller holds the lock inside a transaction)."""
+        self._conn.execute("UPDATE revision_sequence SET value = value + 1 WHERE id = 0")
+        return self._conn.execute("SELECT value FROM revision_sequence WHERE id = 0").fetchone()[0]
+
+    def _row(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Stored row of a file (caller holds the lock)."""
+        row = self._conn.execute(
+            """SELECT path, project_path, well_name, revision, fingerprint, size, mtime_ns, modified, deleted, datasets
+               FROM well_revisions WHERE path = ?""", (file_path,)).fetchone()
+        return _row_dict(row) if row is not None else None
+
+    def last_revision(self) -> int:
+        """Latest revision handed out in the workspace."""
+        with self._lock:
+            return self._conn.execute("SELECT value FROM revision_sequence WHERE id = 0").fetchone()[0]
+
+    def record(self, file_path: str, well_data: Dict[str, Any],
+               fingerprint: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Record the content of a well file, bumping its revision if the content changed.
+
+        Args:
+            file_path: Well file
+            well_data: Well dictionary the file holds
+            fingerprint: File fingerprint (size, mtime_ns) the data belongs to; taken now if not given
+
+        Returns:
+            The well's revision row (see get())
+        """
+        file_path = project_id(file_path)
+        if fingerprint is None:
+            try:
+                fingerprint = file_fingerprint(file_path)
+            except OSError:
+                fingerprint = {"size": None, "mtime_ns": None}
+        content = well_fingerprints(well_data)
+        wells_dir = os.path.dirname(file_path)
+
+        with self._lock, self._conn:
+            previous = self._row(file_path)
+            if previous is not None and not previous["deleted"] and previous["fingerprint"] == content["fingerprint"]:
+                # Same content (rewritten or touched): only the file signature moves
+                self._conn.execute("UPDATE well_revisions SET size = ?, mtime_ns = ? WHERE path = ?",
+                                   (fingerprint["size"], fingerprint["mtime_ns"], file_path))
+                return {**previous, "size": fingerprint["size"], "mtime_ns": fingerprint["mtime_ns"]}
+
+            revision = self._next_revision()
+            datasets = stamp_datasets(previous["datasets"] if previous is not None else {},
+                                      content["datasets"], revision)
+            row = {
+                "path": file_path,
+                "project_path": os.path.dirname(wells_dir),
+                "well_name": os.path.basename(file_path)[:-len(WELL_FILE_EXTENSION)],
+                "revision": revision,
+                "fingerprint": content["fingerprint"],
+                "size": fingerprint["size"],
+                "mtime_ns": fingerprint["mtime_ns"],
+                "modified": time.time(),
+                "deleted": False,
+                "datasets": datasets
+            }
+            self._conn.execute(
+                """INSERT OR REPLACE INTO well_revisions
+                   (path, project_path, well_name, revision, fingerprint, size, mtime_ns, modified, deleted, datasets)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?)""",
+                (file_path, row["project_path"], row["well_name"], revision, row["fingerprint"],
+                 row["size"], row["mtime_ns"], row["modified"], json.dumps(datasets)))
+        return row
+
+    def get(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Stored revision row of a file, or None.
+
+        Returns:
+            {"path", "project_path", "well_name", "revision", "fingerprint", "size", "mtime_ns",
+             "modified" (unix time), "deleted", "datasets" (see stamp_datasets)}
+        """
+        with self._lock:
+            return self._row(project_id(file_path))
+
+    def current(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Revision row of a file if it still describes the file (same size and mtime),
+        else None: the file is new, changed behind the server's back or gone.
+        One stat call, the well body is not read.
+        """
+        row = self.get(file_path)
+        if row is None or row["deleted"]:
+            return None
+        try:
+            stat = os.stat(row["path"])
+        except OSError:
+            return None
+        if (stat.st_size, stat.st_mtime_ns) != (row["size"], row["mtime_ns"]):
+            return None
+        return row
+
+    def mark_deleted(self, file_path: str) -> Optional[int]:
+        """
+        Record that a well file was deleted (all its datasets become removed).
+
+        Returns:
+            The revision of the deletion, or None if the file had no live row
+        """
+        file_path = project_id(file_path)
+        with self._lock, self._conn:
+            previous = self._row(file_path)
+            if previous is None or previous["deleted"]:
+                return None
+            revision = self._next_revision()
+            datasets = stamp_datasets(previous["datasets"], {}, revision)
+            self._conn.execute(
+                """UPDATE well_revisions SET revision = ?, fingerprint = NULL, size = NULL, mtime_ns = NULL,
+                   modified = ?, deleted = 1, datasets = ? WHERE path = ?""",
+                (revision, time.time(), json.dumps(datasets), file_path))
+        return revision
+
+    def project_rows(self, project_path: str) -> List[Dict[str, Any]]:
+        """Revision rows of all wells of a project (deleted wells included), sorted by well name."""
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT path, project_path, well_name, revision, fingerprint, size, mtime_ns, modified, deleted, datasets
+                   FROM well_revisions WHERE project_path = ? ORDER BY well_name""",
+                (project_id(project_path),)).fetchall()
+        return [_row_dict(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _row_dict(row: tuple) -> Dict[str, Any]:
+    path, project_path, well_name, revision, fingerprint, size, mtime_ns, modified, deleted, datasets = row
+    return {
+        "path": path,
+        "project_path": project_path,
+        "well_name": well_name,
+        "revision": revision,
+        "fingerprint": fingerprint,
+        "size": size,
+        "mtime_ns": mtime_ns,
+        "modified": modified,
+        "deleted": bool(deleted),
+        "datasets": json.loads(datasets)
+    }